@@ -0,0 +1,64 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+from fxplan.backtest import Backtest, BarSeries
+
+
+def make_bars(rows: int, seed: int = 0) -> BarSeries:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.00005, rows))
+    open = np.r_[close[0], close[:-1]]
+    high = np.maximum(open, close) + rng.random(rows) * 0.0001
+    low = np.minimum(open, close) - rng.random(rows) * 0.0001
+    return BarSeries.from_arrays(np.arange(rows) * 60, open, high, low, close)
+
+
+def make_plans(bars: BarSeries, rows: int, seed: int = 0) -> tuple:
+    rng = np.random.default_rng(seed)
+    times = bars.get_column("time")
+    entry_times = np.sort(rng.integers(0, times[-1], rows))
+    price = bars.get_column("open")[np.searchsorted(times, entry_times)]
+    is_long = rng.random(rows) < 0.5
+    sl_distance = rng.uniform(0.0005, 0.01, rows)
+    tp_distance = rng.uniform(0.0005, 0.02, rows)
+    return entry_times, {
+        "is_long": is_long,
+        "sl_price": np.where(is_long, price - sl_distance, price + sl_distance),
+        "tp_price": np.where(is_long, price + tp_distance, price - tp_distance),
+        "sl_with_commission_in_money": np.full(rows, 107.0),
+        "tp_with_commission_in_money": np.full(rows, 193.0),
+    }
+
+
+def main() -> None:
+    bar_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    plan_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bars.npy"
+        make_bars(bar_rows).save(path)
+        bars = BarSeries.load(path)
+        entry_times, plans = make_plans(bars, plan_rows)
+
+        backtest = Backtest(bars)
+        start = time.perf_counter()
+        backtest.run(entry_times[:1], {name: column[:1] for name, column in plans.items()})
+        indexed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = backtest.run(entry_times, plans)
+        seconds = time.perf_counter() - start
+        del backtest, bars
+
+    print(f"index: {indexed:.2f} s ({bar_rows:,} bars)")
+    print(f"run:   {seconds:.2f} s ({plan_rows:,} plans, {plan_rows / seconds:,.0f} plans/s)")
+    print(f"outcomes (open, sl, tp): {np.bincount(result['outcome'], minlength=3).tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+from fxplan import Calculator
+from fxplan.batch import BatchCalculator
+from fxplan.sweep import grid_range, sweep
+
+
+def make_plans(rows: int, seed: int = 0, invalid: float = 0.0) -> dict:
+    rng = np.random.default_rng(seed)
+    sl_in_pips = np.round(rng.uniform(5, 100, rows), 1)
+    sl_in_pips[rng.random(rows) < invalid] *= -1
+    return {
+        "is_long": rng.random(rows) < 0.5,
+        "entry_price": np.round(rng.uniform(180, 200, rows), 3),
+        "sl_in_pips": sl_in_pips,
+        "tp_in_pips": np.round(rng.uniform(10, 200, rows), 1),
+        "sl_with_commission_in_money": np.round(rng.uniform(50, 1000, rows), 2),
+    }
+
+
+def run_scalar(plans: dict, rows: int) -> float:
+    start = time.perf_counter()
+    for i in range(rows):
+        calc = Calculator()
+        calc.set_symbol("GBPJPY")
+        calc.set_exchange_rate({"symbol": "USDJPY", "rate": 158.968})
+        calc.set_commission_per_lot_in_money(7)
+        try:
+            calc.set_is_long(bool(plans["is_long"][i]))
+            calc.set_entry_price(float(plans["entry_price"][i]))
+            calc.set_sl_in_pips(float(plans["sl_in_pips"][i]))
+            calc.set_tp_in_pips(float(plans["tp_in_pips"][i]))
+            calc.set_sl_with_commission_in_money(float(plans["sl_with_commission_in_money"][i]))
+            calc.calculate()
+            calc.get_result()
+        except ValueError:
+            pass
+    return time.perf_counter() - start
+
+
+def run_batch(plans: dict, error_mode: str = "raise") -> float:
+    start = time.perf_counter()
+    batch = BatchCalculator()
+    batch.set_error_mode(error_mode)
+    batch.set_symbol("GBPJPY")
+    batch.set_exchange_rate({"symbol": "USDJPY", "rate": 158.968})
+    batch.set_commission_per_lot_in_money(7)
+    for name, column in plans.items():
+        getattr(batch, f"set_{name}")(column)
+    batch.calculate()
+    batch.get_result()
+    return time.perf_counter() - start
+
+
+def run_sweep() -> tuple:
+    start = time.perf_counter()
+    result = sweep(
+        "GBPJPY",
+        {
+            "sl_in_pips": grid_range(5, 100, "0.5"),
+            "tp_in_pips": grid_range(10, 200, 5),
+            "sl_with_commission_in_money": grid_range(50, 1000, 25),
+            "is_long": [True, False],
+        },
+        {"entry_price": "190.123", "commission_per_lot_in_money": 7},
+        exchange_rate={"symbol": "USDJPY", "rate": 158.968},
+        fields=("position_size_in_lots", "sl_in_money", "rrr_with_commission"),
+    )
+    return result.get_field("position_size_in_lots").size, time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    plans = make_plans(rows)
+    scalar_rows = min(rows, 5000)
+    scalar_per_row = run_scalar(plans, scalar_rows) / scalar_rows
+    batch_per_row = run_batch(plans) / rows
+    print(f"scalar: {1 / scalar_per_row:,.0f} plans/s")
+    print(f"batch:  {1 / batch_per_row:,.0f} plans/s ({rows} rows)")
+    print(f"speedup: {scalar_per_row / batch_per_row:.1f}x")
+
+    plans = make_plans(rows, invalid=0.05)
+    scalar_per_row = run_scalar(plans, scalar_rows) / scalar_rows
+    batch_per_row = run_batch(plans, "collect") / rows
+    print(f"scalar, 5% invalid: {1 / scalar_per_row:,.0f} plans/s")
+    print(f"batch, 5% invalid:  {1 / batch_per_row:,.0f} plans/s (errors collected)")
+
+    cells, elapsed = run_sweep()
+    print(f"sweep:  {cells / elapsed:,.0f} cells/s ({cells} cells)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fxplan import Calculator, ResultStore
+
+PLAN = {"is_long": True, "entry_price": "1.17968", "sl_in_pips": "50", "tp_in_pips": "100", "sl_in_money": "500"}
+
+
+def result_dicts(calc: Calculator, count: int) -> list:
+    return list(calc.calculate_many(PLAN for _ in range(count)))
+
+
+def result_records(calc: Calculator, count: int) -> list:
+    records = []
+    for _ in range(count):
+        calc.with_inputs(**PLAN).calculate()
+        records.append(calc.get_result_record())
+    return records
+
+
+def result_store(calc: Calculator, count: int) -> ResultStore:
+    store = ResultStore()
+    for _ in range(count):
+        calc.with_inputs(**PLAN).calculate()
+        store.append(calc.get_result_record())
+    return store
+
+
+def calculators(calc: Calculator, count: int) -> list:
+    clones = []
+    for _ in range(count):
+        clone = calc.clone()
+        clone.with_inputs(**PLAN).calculate()
+        clones.append(clone)
+    return clones
+
+
+def bytes_per_plan(store, count: int) -> float:
+    calc = Calculator()
+    calc.set_symbol("EURUSD")
+    store(calc, 100)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    plans = store(calc, count)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del plans
+    return (after - before) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, store in (("result dicts", result_dicts), ("result records", result_records), ("result store", result_store), ("calculators", calculators)):
+        print(f"{name:16} {bytes_per_plan(store, count):8.0f} bytes/plan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fxplan import RateBook
+from fxplan.cli import ChunkFormatter, PlanProcessor, iter_chunks
+from fxplan.parallel import ParallelExecutor
+
+SYMBOLS = ("EURUSD", "GBPJPY", "XAUUSD", "USDJPY")
+ENTRY_PRICES = {"EURUSD": "1.17968", "GBPJPY": "190.123", "XAUUSD": "2400.55", "USDJPY": "158.968"}
+
+
+def create_plans(count: int) -> list:
+    return [
+        (row, {
+            "symbol": SYMBOLS[row % 4], "is_long": row % 3 != 0, "entry_price": ENTRY_PRICES[SYMBOLS[row % 4]],
+            "sl_in_pips": str(20 + row % 60), "tp_in_pips": "100", "commission_per_lot_in_money": "7", "sl_in_money": "500",
+        })
+        for row in range(1, count + 1)
+    ]
+
+
+def measure(plans: list, workers: int, chunk_size: int) -> float:
+    formatter = ChunkFormatter(PlanProcessor(rate_book=RateBook({"USDJPY": "158.968"})), "ndjson")
+    chunks = iter_chunks(plans, chunk_size)
+    started = time.perf_counter()
+    if workers == 0:
+        for _ in map(formatter.process_chunk, chunks):
+            pass
+    else:
+        with ParallelExecutor(formatter, workers) as executor:
+            for _ in executor.map(chunks):
+                pass
+
+    return len(plans) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the throughput of fxplan batches by number of worker processes.")
+    parser.add_argument("-n", "--plans", type=int, default=100000, help="number of plans")
+    parser.add_argument("-c", "--chunk-size", type=int, default=1000, help="number of plans per chunk")
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="numbers of workers to measure")
+    args = parser.parse_args()
+
+    plans = create_plans(args.plans)
+    print(f"{args.plans:,} plans, {os.cpu_count()} CPUs")
+    in_process = measure(plans, 0, args.chunk_size)
+    print(f"{'in-process':12} {in_process:10,.0f} plans/s")
+    for workers in args.workers:
+        throughput = measure(plans, workers, args.chunk_size)
+        print(f"{f'{workers} workers':12} {throughput:10,.0f} plans/s  {throughput / in_process:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
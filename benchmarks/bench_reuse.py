@@ -0,0 +1,61 @@
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fxplan import Calculator
+
+PLAN = {"is_long": True, "entry_price": 1.17968, "sl_in_pips": 50, "tp_in_pips": 100, "sl_in_money": 500}
+
+
+def one_instance_per_trade(count: int) -> list:
+    results = []
+    for _ in range(count):
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        for name, value in PLAN.items():
+            getattr(calc, f"set_{name}")(value)
+        calc.calculate()
+        results.append(calc.get_result())
+    return results
+
+
+def reused_instance(count: int) -> list:
+    calc = Calculator()
+    calc.set_symbol("EURUSD")
+    return list(calc.calculate_many(PLAN for _ in range(count)))
+
+
+def measure(func, count: int) -> dict:
+    func(100)
+
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    results = func(count)
+    retained_blocks = sys.getallocatedblocks() - blocks
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    start = time.perf_counter()
+    func(count)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "retained_blocks": retained_blocks / count,
+        "peak_bytes": peak / count,
+        "microseconds": elapsed / count * 1e6,
+    }
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, func in (("one instance per trade", one_instance_per_trade), ("reused instance", reused_instance)):
+        stats = measure(func, count)
+        print(f"{name:24} {stats['retained_blocks']:6.1f} blocks/calc  {stats['peak_bytes']:8.0f} peak bytes/calc  {stats['microseconds']:6.1f} us/calc")
+
+
+if __name__ == "__main__":
+    main()
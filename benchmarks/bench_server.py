@@ -0,0 +1,143 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+SOURCE = Path(__file__).resolve().parents[1] / "src"
+
+PLAN = {
+    "symbol": "GBPJPY", "is_long": True, "entry_price": "190.123", "sl_in_pips": "35.5", "tp_in_pips": "100",
+    "commission_per_lot_in_money": "7", "sl_with_commission_in_money": "250",
+}
+
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: bytes = b"") -> Tuple[int, bytes]:
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def _client(host: str, port: int, requests: int, body: bytes, latencies: List[float], statuses: List[int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            status, _ = await _request(reader, writer, "POST", "/calculate", body)
+            latencies.append(time.perf_counter() - started)
+            statuses.append(status)
+    finally:
+        writer.close()
+
+
+async def _line_client(path: str, requests: int, body: bytes, latencies: List[float], statuses: List[int]) -> None:
+    reader, writer = await asyncio.open_unix_connection(path)
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            writer.write(body + b"\n")
+            await writer.drain()
+            response = await reader.readline()
+            latencies.append(time.perf_counter() - started)
+            statuses.append(503 if response.startswith(b'{"error":"Server is busy."') else 200)
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, connections: int, requests: int, plans_per_request: int, socket_path: Optional[str] = None) -> dict:
+    body = json.dumps(PLAN if plans_per_request == 1 else [PLAN] * plans_per_request).encode("utf-8")
+    latencies: List[float] = []
+    statuses: List[int] = []
+
+    started = time.perf_counter()
+    if socket_path is None:
+        await asyncio.gather(*(_client(host, port, requests, body, latencies, statuses) for _ in range(connections)))
+    else:
+        await asyncio.gather(*(_line_client(socket_path, requests, body, latencies, statuses) for _ in range(connections)))
+    seconds = time.perf_counter() - started
+
+    if socket_path is None:
+        reader, writer = await asyncio.open_connection(host, port)
+        _, stats = await _request(reader, writer, "GET", "/stats")
+    else:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        writer.write(b'{"command": "stats"}\n')
+        stats = await reader.readline()
+    writer.close()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rejected": statuses.count(503),
+        "seconds": seconds,
+        "requests_per_second": len(latencies) / seconds,
+        "plans_per_second": len(latencies) * plans_per_request / seconds,
+        "p50": latencies[len(latencies) // 2],
+        "p90": latencies[int(len(latencies) * 0.9)],
+        "p99": latencies[int(len(latencies) * 0.99)],
+        "server": json.loads(stats),
+    }
+
+
+def start_server(options: List[str]) -> Tuple[subprocess.Popen, int]:
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from fxplan.cli import main; main()", "serve", "--port", "0", "--rate", "USDJPY=158.968", *options],
+        env={**os.environ, "PYTHONPATH": str(SOURCE)},
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stderr.readline()
+    if not line.startswith("Listening on "):
+        process.kill()
+        raise RuntimeError(f"Server did not start: {line}")
+    address = line.strip().rsplit(":", 1)[1]
+    return process, int(address) if address.isdigit() else 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the fxplan pricing server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="port of a running server (default: start a local one)")
+    parser.add_argument("-c", "--connections", type=int, default=64)
+    parser.add_argument("-n", "--requests", type=int, default=200, help="requests per connection")
+    parser.add_argument("--plans-per-request", type=int, default=1)
+    parser.add_argument("--batch-window", help="batch window in ms of the local server (default: 1, 0 with --socket)")
+    parser.add_argument("--socket", metavar="PATH", help="send JSON lines to a Unix socket daemon instead of HTTP")
+    args = parser.parse_args(argv)
+
+    process = None
+    port = args.port
+    if port is None and (args.socket is None or not os.path.exists(args.socket)):
+        options = [] if args.batch_window is None else ["--batch-window", args.batch_window]
+        process, port = start_server(options if args.socket is None else [*options, "--socket", args.socket])
+
+    try:
+        result = asyncio.run(run_load(args.host, port, args.connections, args.requests, args.plans_per_request, args.socket))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    server = result["server"]
+    print(f"requests: {result['requests']:,} ({result['rejected']:,} rejected) in {result['seconds']:.2f} s")
+    print(f"throughput: {result['requests_per_second']:,.0f} requests/s, {result['plans_per_second']:,.0f} plans/s")
+    print(f"latency: p50 {result['p50'] * 1000:.2f} ms, p90 {result['p90'] * 1000:.2f} ms, p99 {result['p99'] * 1000:.2f} ms")
+    print(f"server: {server['batches']:,} batches, {server['mean_batch_size']:.1f} plans per batch")
+
+
+if __name__ == "__main__":
+    main()
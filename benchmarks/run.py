@@ -0,0 +1,119 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from suite import BENCHMARKS
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results.json"
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+
+
+def measure(name: str, repeat: int) -> Dict[str, Any]:
+    timer = timeit.Timer(BENCHMARKS[name]())
+    number, _ = timer.autorange()
+    seconds = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_ns": min(seconds) * 1e9,
+        "median_ns": statistics.median(seconds) * 1e9,
+        "ops_per_second": 1 / min(seconds),
+    }
+
+
+def run(names, repeat: int) -> Dict[str, Any]:
+    results = {}
+    width = max(map(len, names))
+    for name in names:
+        results[name] = measure(name, repeat)
+        print(f"{name:{width}} {results[name]['min_ns']:12,.0f} ns/op  {results[name]['ops_per_second']:12,.0f} ops/s")
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    regressions = 0
+    width = max(map(len, report["benchmarks"]))
+    print(f"\n{'benchmark':{width}} {'baseline':>12} {'current':>12} {'change':>8}")
+
+    for name, result in report["benchmarks"].items():
+        expected = baseline["benchmarks"].get(name)
+        if expected is None:
+            print(f"{name:{width}} {'-':>12} {result['min_ns']:12,.0f} {'new':>8}")
+            continue
+
+        change = result["min_ns"] / expected["min_ns"] - 1
+        flag = ""
+        if change > threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{name:{width}} {expected['min_ns']:12,.0f} {result['min_ns']:12,.0f} {change:+8.1%}{flag}")
+
+    if (baseline.get("python"), baseline.get("machine")) != (report["python"], report["machine"]):
+        print(f"\nWarning: the baseline was recorded on Python {baseline.get('python')} ({baseline.get('machine')}).")
+
+    return regressions
+
+
+def load(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save(report: Dict[str, Any], path: Path) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4)
+        file.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the fxplan benchmark suite.")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of timing rounds per benchmark")
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_OUTPUT, help="where to write the results")
+    parser.add_argument("-b", "--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline to compare against")
+    parser.add_argument("-t", "--threshold", type=float, default=0.15, help="slowdown ratio reported as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline as well")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if not names:
+        parser.error(f"No benchmark matches '{args.filter}'.")
+
+    report = run(names, args.repeat)
+    save(report, args.output)
+
+    if args.save_baseline:
+        save(report, args.baseline)
+        return
+
+    baseline = load(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one.")
+        return
+
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n{regressions} benchmark(s) are more than {args.threshold:.0%} slower than the baseline.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
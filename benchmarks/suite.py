@@ -0,0 +1,144 @@
+import io
+import sys
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fxplan import Calculator, RateBook, Symbol, TradePlan
+from fxplan.cache import ResultCache
+from fxplan.fanout import Account, fan_out
+from fxplan.live import Quote, RepricingEngine
+from fxplan.portfolio import Portfolio
+from fxplan.serialization import ResultWriter
+from fxplan.utils import parse_symbol, to_decimal
+
+Benchmark = Callable[[], Callable[[], Any]]
+
+SAME_CURRENCY_PLANS = {
+    "sl_price-tp_price-lots": {
+        "is_long": True, "entry_price": "1.17968", "sl_price": "1.17468", "tp_price": "1.18968", "position_size_in_lots": "1.25",
+    },
+    "sl_pips-tp_pips-sl_money": {
+        "is_long": False, "entry_price": "1.17968", "sl_in_pips": "50", "tp_in_pips": "100", "sl_in_money": "500",
+    },
+    "sl_points-tp_points-sl_with_commission": {
+        "is_long": True, "entry_price": "1.17968", "sl_in_points": "500", "tp_in_points": "1000",
+        "commission_per_lot_in_money": "7", "sl_with_commission_in_money": "500",
+    },
+}
+
+CROSS_CURRENCY_PLAN = {
+    "is_long": True, "entry_price": "190.123", "sl_in_pips": "35.5", "tp_in_pips": "100",
+    "commission_per_lot_in_money": "7", "sl_with_commission_in_money": "250",
+}
+
+
+def _calculate(
+    symbol: str, plan: Dict[str, Any], exchange_rate: Dict[str, Any] = None, cls: type = Calculator, cache: ResultCache = None,
+) -> Callable[[], Any]:
+    calc = cls()
+    calc.set_symbol(symbol)
+    if exchange_rate is not None:
+        calc.set_exchange_rate(exchange_rate)
+    calc.set_cache(cache)
+
+    def run() -> None:
+        calc.with_inputs(**plan)
+        calc.calculate()
+
+    return run
+
+
+def _reprice(setter: str, values: tuple) -> Callable[[], Any]:
+    calc = Calculator()
+    calc.set_symbol("GBPJPY")
+    calc.set_exchange_rate({"symbol": "USDJPY", "rate": "158.968"})
+    calc.with_inputs(**CROSS_CURRENCY_PLAN).calculate()
+    setter = getattr(calc, setter)
+    ticks = iter(values * 1000000)
+
+    def run() -> None:
+        setter(next(ticks))
+        calc.calculate()
+
+    return run
+
+
+def _result_as_json(convert_numbers_to: str, indent: Optional[int] = 4) -> Callable[[], Any]:
+    calc = Calculator()
+    calc.set_symbol("EURUSD")
+    calc.with_inputs(**SAME_CURRENCY_PLANS["sl_pips-tp_pips-sl_money"]).calculate()
+    return lambda: calc.get_result_as_json(convert_numbers_to, indent)
+
+
+def _write_results(count: int) -> Callable[[], Any]:
+    calc = Calculator()
+    calc.set_symbol("EURUSD")
+    calc.with_inputs(**SAME_CURRENCY_PLANS["sl_pips-tp_pips-sl_money"]).calculate()
+    results = [calc.get_result_record()] * count
+
+    def run() -> None:
+        with ResultWriter(io.BytesIO()) as writer:
+            writer.write_many(results)
+
+    return run
+
+
+def _live_quote(plans: int) -> Callable[[], Any]:
+    engine = RepricingEngine(RateBook({"USDJPY": "158.968"}))
+    for plan_id in range(plans):
+        engine.subscribe(plan_id, TradePlan("GBPJPY", **CROSS_CURRENCY_PLAN), follow_entry=plan_id % 2 == 0)
+    quotes = iter([Quote("USDJPY", "158.968"), Quote("USDJPY", "150.123")] * 1000000)
+    return lambda: engine.on_quote(next(quotes))
+
+
+def _fan_out(accounts: int) -> Callable[[], Any]:
+    plan = TradePlan("GBPJPY", True, "190.123", sl_in_pips="35.5", tp_in_pips=100)
+    rates = RateBook({"USDJPY": "158.968", "EURUSD": "1.0876"})
+    table = [
+        Account(account_id, balance=10000 + account_id, risk_in_percent=1, currency=("USD", "EUR", "JPY")[account_id % 3], commission_per_lot_in_money=7)
+        for account_id in range(accounts)
+    ]
+    return lambda: fan_out(plan, table, rates)
+
+
+def _portfolio_rate(plans: int) -> Callable[[], Any]:
+    portfolio = Portfolio(RateBook({"USDJPY": "158.968", "EURUSD": "1.0876", "GBPUSD": "1.2712"}), reporting_currency="EUR")
+    for plan_id in range(plans):
+        portfolio.add(plan_id, TradePlan("GBPJPY", **CROSS_CURRENCY_PLAN))
+    rates = iter([Decimal("158.968"), Decimal("150.123")] * 1000000)
+
+    def run() -> Decimal:
+        portfolio.set_rate("USDJPY", next(rates))
+        return portfolio.get_total_risk()
+
+    return run
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    **{
+        f"calculate[same_currency,{mode}]": (lambda plan=plan: _calculate("EURUSD", plan))
+        for mode, plan in SAME_CURRENCY_PLANS.items()
+    },
+    "calculate[cross_currency,commission]": lambda: _calculate("GBPJPY", CROSS_CURRENCY_PLAN, {"symbol": "USDJPY", "rate": "158.968"}),
+    "calculate[cached,cross_currency,commission]": lambda: _calculate(
+        "GBPJPY", CROSS_CURRENCY_PLAN, {"symbol": "USDJPY", "rate": "158.968"}, cache=ResultCache()
+    ),
+    "reprice[entry_price]": lambda: _reprice("set_entry_price", (Decimal("190.123"), Decimal("190.125"))),
+    "reprice[tp_in_pips]": lambda: _reprice("set_tp_in_pips", (Decimal("100"), Decimal("120"))),
+    "symbol[EURUSD]": lambda: lambda: Symbol("EURUSD"),
+    "symbol[custom]": lambda: lambda: Symbol("BTCUSD", lot_size="1", pip_size="1", digits="2"),
+    "to_decimal[float]": lambda: lambda: to_decimal(1.17968),
+    "to_decimal[str]": lambda: lambda: to_decimal("1.17968"),
+    "to_decimal[Decimal]": lambda: (lambda value=Decimal("1.17968"): to_decimal(value)),
+    "parse_symbol": lambda: lambda: parse_symbol("eur/usd"),
+    "result_as_json[string]": lambda: _result_as_json("string"),
+    "result_as_json[float]": lambda: _result_as_json("float"),
+    "result_as_json[compact]": lambda: _result_as_json("string", None),
+    "write_results[ndjson,100]": lambda: _write_results(100),
+    "live_quote[cross_rate,100]": lambda: _live_quote(100),
+    "fan_out[accounts,1000]": lambda: _fan_out(1000),
+    "portfolio_rate[1000]": lambda: _portfolio_rate(1000),
+}
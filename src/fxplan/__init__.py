@@ -1,4 +1,33 @@
-from .calculator import Calculator
-from .symbol import Symbol
+from importlib import import_module
 
-__all__ = ["Calculator", "Symbol"]
+# The public names are imported on first use, so that light entry points such as
+# fxplan.client start without loading the calculators.
+_EXPORTS = {
+    "Calculator": "calculator",
+    "ContractSpecStore": "specs",
+    "Instrumentation": "instrumentation",
+    "PlanResult": "plan",
+    "RateBook": "rates",
+    "ResultStore": "result",
+    "Symbol": "symbol",
+    "SymbolRegistry": "registry",
+    "TradePlan": "plan",
+    "compute": "plan",
+    "default_registry": "registry",
+}
+
+__all__ = ["Calculator", "ContractSpecStore", "Instrumentation", "PlanResult", "RateBook", "ResultStore", "Symbol", "SymbolRegistry", "TradePlan", "compute", "default_registry"]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
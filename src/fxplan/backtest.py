@@ -0,0 +1,200 @@
+import os
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from .result import ResultStore
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("Backtests require numpy. Install it with 'pip install fxplan[numpy]'.") from e
+
+BAR_DTYPE = np.dtype([("time", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8")])
+BAR_FIELDS = BAR_DTYPE.names
+
+OUTCOME_OPEN = 0
+OUTCOME_SL = 1
+OUTCOME_TP = 2
+
+PLAN_FIELDS = ("is_long", "sl_price", "tp_price", "sl_with_commission_in_money", "tp_with_commission_in_money")
+
+_BLOCK_SIZE = 64
+_PLANS_PER_SEARCH = 65536
+
+Plans = Union[ResultStore, Mapping[str, Any]]
+
+
+class BarSeries:
+    def __init__(self, bars: "np.ndarray") -> None:
+        if not isinstance(bars, np.ndarray) or bars.dtype != BAR_DTYPE or bars.ndim != 1:
+            raise TypeError("Bars must be a one-dimensional array of BAR_DTYPE.")
+
+        if len(bars) > 1 and np.any(bars["time"][1:] < bars["time"][:-1]):
+            raise ValueError("Bar times must be sorted.")
+
+        self._bars = bars
+
+    @classmethod
+    def from_arrays(cls, time: Any, open: Any, high: Any, low: Any, close: Any) -> "BarSeries":
+        columns = [np.asarray(column) for column in (time, open, high, low, close)]
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("All columns must have the same length.")
+
+        bars = np.empty(len(columns[0]), dtype=BAR_DTYPE)
+        for name, column in zip(BAR_FIELDS, columns):
+            bars[name] = column
+        return cls(bars)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "BarSeries":
+        return cls(np.load(path, mmap_mode="r", allow_pickle=False))
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        np.save(path, self._bars, allow_pickle=False)
+
+    def get_bars(self) -> "np.ndarray":
+        return self._bars
+
+    def get_column(self, field: str) -> "np.ndarray":
+        if field not in BAR_FIELDS:
+            raise ValueError(f"Field '{field}' is not a bar field.")
+
+        return self._bars[field]
+
+    def __len__(self) -> int:
+        return len(self._bars)
+
+
+class _CrossingIndex:
+    # Block extremes of a column, _BLOCK_SIZE times smaller per level, searched top-down
+    # for the first bar at or after a start bar that crosses a threshold.
+    def __init__(self, values: "np.ndarray", above: bool) -> None:
+        self._above = above
+        self._reduce = np.maximum if above else np.minimum
+        self._levels = [values]
+        while len(self._levels[-1]) > _BLOCK_SIZE:
+            self._levels.append(self._reduce_blocks(self._levels[-1]))
+
+    def _reduce_blocks(self, values: "np.ndarray") -> "np.ndarray":
+        full = len(values) // _BLOCK_SIZE * _BLOCK_SIZE
+        step = _BLOCK_SIZE * 16384
+        blocks = [
+            self._reduce.reduce(np.asarray(values[start:min(start + step, full)]).reshape(-1, _BLOCK_SIZE), axis=1)
+            for start in range(0, full, step)
+        ]
+        if full < len(values):
+            blocks.append(self._reduce.reduce(np.asarray(values[full:]), keepdims=True))
+        return np.concatenate(blocks) if blocks else np.empty(0)
+
+    def _search(self, level: int, positions: "np.ndarray", ends: "np.ndarray", thresholds: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        values = self._levels[level]
+        offsets = np.arange(_BLOCK_SIZE)
+        indexes = positions[:, None] + offsets
+        valid = indexes < ends[:, None]
+        window = values[np.minimum(indexes, len(values) - 1)]
+        crossed = valid & (window >= thresholds[:, None] if self._above else window <= thresholds[:, None])
+        return crossed.any(axis=1), positions + crossed.argmax(axis=1)
+
+    def find_first(self, starts: "np.ndarray", thresholds: "np.ndarray") -> "np.ndarray":
+        if len(starts) > _PLANS_PER_SEARCH:
+            return np.concatenate([
+                self.find_first(starts[start:start + _PLANS_PER_SEARCH], thresholds[start:start + _PLANS_PER_SEARCH])
+                for start in range(0, len(starts), _PLANS_PER_SEARCH)
+            ])
+
+        size = len(self._levels[0])
+        first = np.full(len(starts), size, dtype=np.int64)
+        pending = np.flatnonzero(starts < size)
+        positions = starts[pending].astype(np.int64)
+        found: List[Tuple[int, "np.ndarray", "np.ndarray"]] = []
+
+        for level in range(len(self._levels)):
+            if not pending.size:
+                break
+
+            length = len(self._levels[level])
+            ends = np.minimum((positions // _BLOCK_SIZE + 1) * _BLOCK_SIZE, length)
+            if level == len(self._levels) - 1:
+                ends = np.full(len(positions), length)
+
+            hit, indexes = self._search(level, positions, ends, thresholds[pending])
+            found.append((level, pending[hit], indexes[hit]))
+            pending, positions = pending[~hit], positions[~hit] // _BLOCK_SIZE + 1
+
+        for level, plans, indexes in found:
+            for lower in range(level - 1, -1, -1):
+                positions = indexes * _BLOCK_SIZE
+                ends = np.minimum(positions + _BLOCK_SIZE, len(self._levels[lower]))
+                _, indexes = self._search(lower, positions, ends, thresholds[plans])
+            first[plans] = indexes
+
+        return first
+
+
+class Backtest:
+    def __init__(self, bars: BarSeries) -> None:
+        if not isinstance(bars, BarSeries):
+            raise TypeError("Bars must be a BarSeries object.")
+
+        self._bars = bars
+        self._high_index: Optional[_CrossingIndex] = None
+        self._low_index: Optional[_CrossingIndex] = None
+
+    def get_bars(self) -> BarSeries:
+        return self._bars
+
+    def _get_indexes(self) -> Tuple[_CrossingIndex, _CrossingIndex]:
+        if self._high_index is None:
+            self._high_index = _CrossingIndex(self._bars.get_column("high"), above=True)
+            self._low_index = _CrossingIndex(self._bars.get_column("low"), above=False)
+        return self._high_index, self._low_index
+
+    def _get_plan_columns(self, plans: Plans) -> Dict[str, "np.ndarray"]:
+        if isinstance(plans, ResultStore):
+            get_column = plans.get_column
+        elif isinstance(plans, Mapping):
+            missing = [field for field in PLAN_FIELDS if field not in plans]
+            if missing:
+                raise ValueError(f"Plans must have a '{missing[0]}' column.")
+            get_column = plans.__getitem__
+        else:
+            raise TypeError("Plans must be a ResultStore or a dictionary of columns.")
+
+        columns = {field: np.asarray(get_column(field), dtype=bool if field == "is_long" else np.float64) for field in PLAN_FIELDS}
+        if len({column.shape for column in columns.values()}) != 1:
+            raise ValueError("All columns must have the same length.")
+        return columns
+
+    def run(self, entry_times: Any, plans: Plans) -> Dict[str, "np.ndarray"]:
+        columns = self._get_plan_columns(plans)
+        entry_times = np.asarray(entry_times, dtype=np.int64)
+        if entry_times.shape != columns["is_long"].shape:
+            raise ValueError("Entry times must have the same length as the plans.")
+
+        high_index, low_index = self._get_indexes()
+        is_long = columns["is_long"]
+        starts = np.searchsorted(self._bars.get_column("time"), entry_times, side="left")
+
+        high_cross = high_index.find_first(starts, np.where(is_long, columns["tp_price"], columns["sl_price"]))
+        low_cross = low_index.find_first(starts, np.where(is_long, columns["sl_price"], columns["tp_price"]))
+        sl_index = np.where(is_long, low_cross, high_cross)
+        tp_index = np.where(is_long, high_cross, low_cross)
+
+        size = len(self._bars)
+        exit_index = np.minimum(sl_index, tp_index)
+        closed = exit_index < size
+        # Both levels inside one bar cannot be ordered from OHLC data, so the stop loss is assumed first.
+        outcome = np.where(~closed, OUTCOME_OPEN, np.where(sl_index <= tp_index, OUTCOME_SL, OUTCOME_TP)).astype(np.int8)
+        pnl = np.select(
+            [outcome == OUTCOME_SL, outcome == OUTCOME_TP],
+            [-columns["sl_with_commission_in_money"], columns["tp_with_commission_in_money"]],
+            0.0,
+        )
+        times = self._bars.get_column("time")
+
+        return {
+            "entry_index": starts,
+            "exit_index": np.where(closed, exit_index, -1),
+            "exit_time": np.where(closed, times[np.minimum(exit_index, size - 1)] if size else 0, -1),
+            "outcome": outcome,
+            "same_bar": closed & (sl_index == tp_index),
+            "pnl": pnl,
+        }
@@ -0,0 +1,663 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .symbol import Symbol
+from .registry import default_registry
+from .calculator import Calculator
+from .converter import resolve_exchange_direction
+from .rates import RateBook
+from .utils import *
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("BatchCalculator requires numpy. Install it with 'pip install fxplan[numpy]'.") from e
+
+
+# Quantized values are kept as integer-valued float64 arrays (price units, tenths of
+# pips, hundredths of lots, cents), which are exact below 2**53.
+_EXACT_LIMIT = float(2 ** 53)
+_COMMISSION_SCALE = 10 ** 6
+
+ERROR_MODES = ("raise", "collect")
+
+ERROR_NONE = 0
+ERROR_INVALID_VALUE = 1
+ERROR_MISSING_VALUE = 2
+ERROR_CONFLICTING_VALUES = 3
+ERROR_PRICE_RELATION = 4
+ERROR_EXCHANGE_RATE = 5
+ERROR_POSITION_SIZE = 6
+
+_LABELS = {
+    "position_size_in_lots": "Position size",
+    "entry_price": "Entry price",
+    "sl_price": "Stop loss price",
+    "tp_price": "Take profit price",
+    "sl_in_pips": "Stop loss in pips",
+    "tp_in_pips": "Take profit in pips",
+    "sl_in_points": "Stop loss in points",
+    "tp_in_points": "Take profit in points",
+    "sl_in_money": "Stop loss in money",
+    "commission_per_lot_in_money": "Commission per lot in money",
+    "sl_with_commission_in_money": "Stop loss with commission in money",
+}
+
+OUTPUT_FIELDS = (
+    "is_long",
+    "position_size_in_lots",
+    "entry_price",
+    "sl_price",
+    "tp_price",
+    "commission_per_lot_in_money",
+    "commission_per_lot_in_pips",
+    "commission_in_money",
+    "sl_in_pips",
+    "tp_in_pips",
+    "sl_in_points",
+    "tp_in_points",
+    "sl_in_money",
+    "tp_in_money",
+    "rrr",
+    "sl_with_commission_in_money",
+    "tp_with_commission_in_money",
+    "rrr_with_commission",
+)
+
+
+def _to_column(values: Any) -> "np.ndarray":
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(f"Cannot convert values '{values}' to a numeric column.")
+
+
+def _to_column_by_cell(values: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+    cells = np.asarray(values, dtype=object)
+    column = np.full(cells.shape, np.nan)
+    invalid = np.zeros(cells.shape, dtype=bool)
+    for index, value in np.ndenumerate(cells):
+        if value is None:
+            continue
+        try:
+            column[index] = float(value)
+        except (TypeError, ValueError):
+            invalid[index] = True
+
+    return column, invalid
+
+
+def _is_on_grid(values: "np.ndarray", scale: float) -> "np.ndarray":
+    scaled = values * scale
+    return np.abs(scaled - np.rint(scaled)) <= SNAP_TOLERANCE * np.maximum(np.abs(scaled), 1.0)
+
+
+def _decimal_exponent(value: Decimal) -> int:
+    return max(0, -value.normalize().as_tuple().exponent)
+
+
+class BatchCalculator:
+    def __init__(self):
+        self._symbol: Optional[Symbol] = None
+        self._target_currency: str = "USD"
+        self._exchange_rate: dict = {"symbol": None, "rate": None}
+        self._rate_book: Optional[RateBook] = None
+        self._is_long: Optional[np.ndarray] = None
+        self._entry_price: Optional[np.ndarray] = None
+        self._sl_price: Optional[np.ndarray] = None
+        self._tp_price: Optional[np.ndarray] = None
+        self._sl_in_pips: Optional[np.ndarray] = None
+        self._tp_in_pips: Optional[np.ndarray] = None
+        self._sl_in_points: Optional[np.ndarray] = None
+        self._tp_in_points: Optional[np.ndarray] = None
+        self._position_size_in_lots: Optional[np.ndarray] = None
+        self._sl_in_money: Optional[np.ndarray] = None
+        self._sl_with_commission_in_money: Optional[np.ndarray] = None
+        self._commission_per_lot_in_money: np.ndarray = np.float64(0)
+        self._raw_inputs: Dict[str, np.ndarray] = {}
+        self._input_errors: Dict[str, List[Tuple[np.ndarray, int, str]]] = {}
+        self._error_mode: str = "raise"
+        self._error_code: Optional[np.ndarray] = None
+        self._error_message_index: Optional[np.ndarray] = None
+        self._error_messages: List[Optional[str]] = [None]
+        self._result: Dict[str, np.ndarray] = {}
+
+    def set_error_mode(self, mode: str):
+        if mode not in ERROR_MODES:
+            raise ValueError("Error mode can be 'raise' or 'collect' only.")
+
+        self._error_mode = mode
+
+    def get_error_mode(self) -> str:
+        return self._error_mode
+
+    def set_symbol(self, symbol: Union[Symbol, str]):
+        if self._symbol is not None:
+            raise ValueError("Symbol is already set.")
+
+        if isinstance(symbol, Symbol):
+            self._symbol = symbol
+        elif isinstance(symbol, str):
+            self._symbol = default_registry.get(symbol)
+        else:
+            raise TypeError("Symbol must be a string or a Symbol object.")
+
+        self._set_symbol_units()
+
+    def _set_symbol_units(self) -> None:
+        digits = self._symbol.get_digits()
+        if digits != digits.to_integral_value():
+            raise ValueError("Digits must be an integer in batch calculations.")
+
+        pip_size = self._symbol.get_pip_size()
+        lot_size = self._symbol.get_lot_size()
+        unit_exponent = max(int(digits), _decimal_exponent(pip_size / 10))
+        lot_exponent = _decimal_exponent(lot_size)
+
+        self._price_scale = float(10 ** int(digits))
+        self._unit_scale = float(10 ** unit_exponent)
+        self._price_to_units = float(10 ** (unit_exponent - int(digits)))
+        self._pip_units = float(pip_size * 10 ** unit_exponent)
+        self._point_units = float(pip_size * 10 ** unit_exponent / 10)
+        self._lot_units = float(lot_size * 10 ** lot_exponent)
+        self._lot_scale = float(10 ** lot_exponent)
+
+    def _raise_error_if_symbol_is_not_set(self) -> None:
+        if self._symbol is None:
+            raise ValueError("Symbol must be set before setting other fields.")
+
+    def set_target_currency(self, value: str):
+        if not isinstance(value, str):
+            raise TypeError("Target currency must be a string.")
+
+        self._target_currency = parse_currency(value)
+
+    def set_exchange_rate(self, value: Union[dict, RateBook]):
+        if isinstance(value, RateBook):
+            self._exchange_rate = {"symbol": None, "rate": None}
+            self._rate_book = value
+            return
+
+        if not isinstance(value, dict):
+            raise TypeError("Exchange rate must be a dictionary or a RateBook object.")
+
+        rate = value.get("rate")
+        self._exchange_rate = {"symbol": value.get("symbol"), "rate": None if rate is None else _to_column(rate)}
+        self._rate_book = None
+
+    def set_is_long(self, values: Any):
+        values = np.asarray(values)
+
+        if values.dtype != np.bool_:
+            raise TypeError("Is long must be a boolean.")
+
+        self._is_long = values
+
+    def set_position_size_in_lots(self, values: Any):
+        raw = self._to_input_column("position_size_in_lots", values)
+        values = floor_to_units(raw, 100)
+
+        self._check_input("position_size_in_lots", values <= 0, "Position size must be positive.")
+
+        self._set_input("position_size_in_lots", raw, values)
+
+    def set_entry_price(self, values: Any):
+        self._raise_error_if_symbol_is_not_set()
+        raw = self._to_input_column("entry_price", values)
+        values = floor_to_units(raw, self._price_scale) * self._price_to_units
+
+        self._check_input("entry_price", values <= 0, "Entry price must be positive.")
+
+        self._set_input("entry_price", raw, values)
+
+    def set_sl_price(self, values: Any):
+        self._raise_error_if_symbol_is_not_set()
+        raw = self._to_input_column("sl_price", values)
+        values = floor_to_units(raw, self._price_scale) * self._price_to_units
+
+        self._check_input("sl_price", values <= 0, "Stop loss price must be positive.")
+
+        self._set_input("sl_price", raw, values)
+
+    def set_tp_price(self, values: Any):
+        self._raise_error_if_symbol_is_not_set()
+        raw = self._to_input_column("tp_price", values)
+        values = floor_to_units(raw, self._price_scale) * self._price_to_units
+
+        self._check_input("tp_price", values <= 0, "Take profit price must be positive.")
+
+        self._set_input("tp_price", raw, values)
+
+    def set_sl_in_pips(self, values: Any):
+        self._raise_error_if_symbol_is_not_set()
+        raw = self._to_input_column("sl_in_pips", values)
+        values = floor_to_units(raw, 10)
+
+        self._check_input("sl_in_pips", values <= 0, "Stop loss in pips must be positive.")
+
+        self._set_input("sl_in_pips", raw, values)
+
+    def set_tp_in_pips(self, values: Any):
+        self._raise_error_if_symbol_is_not_set()
+        raw = self._to_input_column("tp_in_pips", values)
+        values = floor_to_units(raw, 10)
+
+        self._check_input("tp_in_pips", values <= 0, "Take profit in pips must be positive.")
+
+        self._set_input("tp_in_pips", raw, values)
+
+    def set_sl_in_points(self, values: Any):
+        self._raise_error_if_symbol_is_not_set()
+        raw = self._to_input_column("sl_in_points", values)
+        values = floor_to_units(raw, 1)
+
+        self._check_input("sl_in_points", values <= 0, "Stop loss in points must be positive.")
+
+        self._set_input("sl_in_points", raw, values)
+
+    def set_tp_in_points(self, values: Any):
+        self._raise_error_if_symbol_is_not_set()
+        raw = self._to_input_column("tp_in_points", values)
+        values = floor_to_units(raw, 1)
+
+        self._check_input("tp_in_points", values <= 0, "Take profit in points must be positive.")
+
+        self._set_input("tp_in_points", raw, values)
+
+    def set_sl_in_money(self, values: Any):
+        values = self._to_input_column("sl_in_money", values)
+
+        self._check_input("sl_in_money", values <= 0, "Stop loss in money must be positive.")
+
+        self._set_input("sl_in_money", values, values)
+
+    def set_commission_per_lot_in_money(self, values: Any):
+        values = self._to_input_column("commission_per_lot_in_money", values)
+
+        self._check_input("commission_per_lot_in_money", values < 0, "Commission per lot in money must be non-negative.")
+
+        self._set_input("commission_per_lot_in_money", values, np.nan_to_num(values, nan=0.0))
+
+    def set_sl_with_commission_in_money(self, values: Any):
+        values = self._to_input_column("sl_with_commission_in_money", values)
+
+        self._check_input("sl_with_commission_in_money", values < 0, "Stop loss with commission in money must be non-negative.")
+
+        self._set_input("sl_with_commission_in_money", values, values)
+
+    def _to_input_column(self, name: str, values: Any) -> "np.ndarray":
+        self._input_errors[name] = []
+        if self._error_mode == "raise":
+            return _to_column(values)
+
+        try:
+            return _to_column(values)
+        except ValueError:
+            column, invalid = _to_column_by_cell(values)
+            self._input_errors[name].append((invalid, ERROR_INVALID_VALUE, f"{_LABELS[name]} must be a number."))
+            return column
+
+    def _check_input(self, name: str, mask: "np.ndarray", message: str) -> None:
+        if self._error_mode == "raise" and np.any(mask):
+            raise ValueError(message)
+
+        self._input_errors[name].append((mask, ERROR_INVALID_VALUE, message))
+
+    def _set_input(self, name: str, raw: "np.ndarray", values: "np.ndarray") -> None:
+        self._raw_inputs[name] = raw
+        setattr(self, f"_{name}", values)
+
+    def validate(self) -> Dict[str, "np.ndarray"]:
+        self._validate()
+        return self.get_errors()
+
+    def calculate(self):
+        self._validate()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._calculate_sl_price_and_in_pips_and_in_points()
+            self._calculate_tp_price_and_in_pips_and_in_points()
+            self._calculate_commission_per_lot_in_pips()
+            self._calculate_position_size()
+            self._calculate_sl_in_money()
+            self._calculate_tp_in_money()
+            self._calculate_sl_and_tp_with_commission_in_money()
+            self._calculate_risk_reward_ratio()
+        self._set_result()
+        self._recalculate_inexact_rows()
+        self._set_errors_in_result()
+
+    def _column(self, values: Optional["np.ndarray"]) -> "np.ndarray":
+        if values is None:
+            return np.full(self._shape, np.nan)
+        return np.broadcast_to(values, self._shape)
+
+    def _raise_error_for_rows(self, mask: "np.ndarray", message: str) -> None:
+        rows = np.flatnonzero(mask)
+        if rows.size:
+            raise ValueError(f"Row {rows[0]}: {message}")
+
+    def _flag_rows(self, mask: "np.ndarray", code: int, message: str) -> None:
+        if self._error_mode == "raise":
+            self._raise_error_for_rows(mask, message)
+            return
+
+        rows = np.broadcast_to(mask, self._shape) & (self._error_code == ERROR_NONE)
+        if np.any(rows):
+            self._error_code[rows] = code
+            self._error_message_index[rows] = len(self._error_messages)
+            self._error_messages.append(message)
+
+    def _flag_row(self, index: Tuple[int, ...], code: int, message: str) -> None:
+        if message not in self._error_messages:
+            self._error_messages.append(message)
+
+        self._error_code[index] = code
+        self._error_message_index[index] = self._error_messages.index(message)
+
+    def _flag_all_rows(self, code: int, message: str) -> None:
+        if self._error_mode == "raise":
+            raise ValueError(message)
+
+        self._flag_rows(np.True_, code, message)
+
+    def _validate(self):
+        self._validate_required_fields()
+        self._validate_inputs()
+        self._validate_exchange_rate()
+        self._validate_price_relation()
+        self._validate_one_of_inputs()
+
+    def _validate_required_fields(self):
+        if self._symbol is None:
+            raise ValueError("Symbol is required.")
+
+        if self._is_long is None:
+            raise ValueError("Is long is required.")
+
+        if self._entry_price is None:
+            raise ValueError("Entry price is required.")
+
+        columns = [self._is_long, self._commission_per_lot_in_money]
+        columns += [v for v in self._raw_inputs.values()]
+        if self._exchange_rate["rate"] is not None:
+            columns.append(self._exchange_rate["rate"])
+
+        try:
+            self._shape = np.broadcast_shapes(*[np.shape(c) for c in columns])
+        except ValueError:
+            raise ValueError("All columns must have the same length.")
+
+        self._error_code = np.zeros(self._shape, dtype=np.int8)
+        self._error_message_index = np.zeros(self._shape, dtype=np.intp)
+        self._error_messages = [None]
+        self._flag_rows(np.isnan(self._column(self._entry_price)), ERROR_MISSING_VALUE, "Entry price is required.")
+
+    def _validate_inputs(self):
+        for checks in self._input_errors.values():
+            for mask, code, message in checks:
+                self._flag_rows(mask, code, message)
+
+    def _validate_exchange_rate(self):
+        self._conversion_steps = None
+
+        if self._symbol.get_quote_currency() == self._target_currency:
+            return
+
+        exchange_pair = f"{self._symbol.get_quote_currency()}{self._target_currency}"
+        reverse_exchange_pair = f"{self._target_currency}{self._symbol.get_quote_currency()}"
+
+        if self._rate_book is not None:
+            if not self._rate_book.has_path(self._symbol.get_quote_currency(), self._target_currency):
+                self._flag_all_rows(ERROR_EXCHANGE_RATE, f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
+                return
+
+            converter = self._rate_book.get_converter(self._symbol.get_quote_currency(), self._target_currency)
+            self._conversion_steps = [(float(rate), multiply) for rate, multiply in converter.get_steps()]
+            return
+
+        if self._exchange_rate["symbol"] is None or self._exchange_rate["rate"] is None:
+            self._flag_all_rows(ERROR_EXCHANGE_RATE, f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
+            return
+
+        base, quote = parse_symbol(self._exchange_rate["symbol"])
+
+        if self._symbol.get_quote_currency() != base and self._symbol.get_quote_currency() != quote:
+            self._flag_all_rows(ERROR_EXCHANGE_RATE, f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
+            return
+
+        if self._target_currency != base and self._target_currency != quote:
+            self._flag_all_rows(ERROR_EXCHANGE_RATE, f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
+            return
+
+        rate = self._column(self._exchange_rate["rate"])
+        self._flag_rows(np.isnan(rate), ERROR_EXCHANGE_RATE, f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
+        self._flag_rows(rate <= 0, ERROR_EXCHANGE_RATE, "Exchange rate rate must be positive.")
+
+        multiply = resolve_exchange_direction(self._exchange_rate["symbol"], self._symbol.get_quote_currency(), self._target_currency)
+        self._conversion_steps = [(rate, multiply)]
+
+    def _validate_price_relation(self):
+        is_long = self._column(self._is_long)
+        entry = self._column(self._entry_price)
+        sl = self._column(self._sl_price)
+        tp = self._column(self._tp_price)
+
+        self._flag_rows(is_long & (sl >= entry), ERROR_PRICE_RELATION, "Stop loss price must be lower than entry price in a long position.")
+        self._flag_rows(~is_long & (sl <= entry), ERROR_PRICE_RELATION, "Stop loss price must be greater than entry price in a short position.")
+        self._flag_rows(is_long & (tp <= entry), ERROR_PRICE_RELATION, "Take profit price must be greater than entry price in a long position.")
+        self._flag_rows(~is_long & (tp >= entry), ERROR_PRICE_RELATION, "Take profit price must be lower than entry price in a short position.")
+
+    def _validate_one_of_inputs(self):
+        for inputs, missing_message, conflict_message in (
+            (
+                (self._sl_price, self._sl_in_pips, self._sl_in_points),
+                "One of the stop loss price, stop loss in pips or stop loss in points must be set.",
+                "Only one of the stop loss price, stop loss in pips or stop loss in points is set.",
+            ),
+            (
+                (self._tp_price, self._tp_in_pips, self._tp_in_points),
+                "One of the take profit price, take profit in pips or take profit in points must be set.",
+                "Only one of the take profit price, take profit in pips or take profit in points is set.",
+            ),
+        ):
+            count = sum(~np.isnan(self._column(values)) for values in inputs)
+            self._flag_rows(count == 0, ERROR_MISSING_VALUE, missing_message)
+            self._flag_rows(count > 1, ERROR_CONFLICTING_VALUES, conflict_message)
+
+        count = sum(
+            ~np.isnan(self._column(values))
+            for values in (self._position_size_in_lots, self._sl_in_money, self._sl_with_commission_in_money)
+        )
+        self._flag_rows(
+            count != 1,
+            ERROR_CONFLICTING_VALUES,
+            "Only one of the position size in lots, stop loss in money or stop loss with commission in money is set.",
+        )
+
+    def _calculate_sl_price_and_in_pips_and_in_points(self):
+        self._sl_distance, self._sl_price_out, self._sl_in_pips_out, self._sl_in_points_out = self._calculate_distance(
+            self._sl_price, self._sl_in_pips, self._sl_in_points, -1,
+        )
+
+    def _calculate_tp_price_and_in_pips_and_in_points(self):
+        self._tp_distance, self._tp_price_out, self._tp_in_pips_out, self._tp_in_points_out = self._calculate_distance(
+            self._tp_price, self._tp_in_pips, self._tp_in_points, 1,
+        )
+
+    def _calculate_distance(self, price, pips, points, long_sign) -> Tuple["np.ndarray", ...]:
+        entry = self._column(self._entry_price)
+        price = self._column(price)
+        pips = self._column(pips)
+        points = self._column(points)
+
+        price_set = ~np.isnan(price)
+        pips_set = ~np.isnan(pips)
+
+        tenths = np.where(pips_set, pips, points)
+        distance = np.where(price_set, np.abs(entry - price), tenths * self._point_units)
+        sign = np.where(self._column(self._is_long), long_sign, -long_sign)
+
+        price_out = np.where(price_set, price, entry + sign * distance)
+        in_pips = np.where(price_set, distance / self._pip_units, tenths / 10)
+        in_points = np.where(price_set, np.floor_divide(distance, self._point_units), tenths)
+
+        return distance, price_out, in_pips, in_points
+
+    def _to_quote(self, amount: "np.ndarray") -> "np.ndarray":
+        for rate, multiply in reversed(self._conversion_steps or ()):
+            amount = amount / rate if multiply else amount * rate
+        return amount
+
+    def _to_target(self, amount: "np.ndarray") -> "np.ndarray":
+        for rate, multiply in self._conversion_steps or ():
+            amount = amount * rate if multiply else amount / rate
+        return amount
+
+    def _calculate_commission_per_lot_in_pips(self):
+        self._commission_per_lot_in_quote = self._to_quote(self._column(self._commission_per_lot_in_money))
+        self._commission_per_lot_in_pips_out = self._commission_per_lot_in_quote * self._unit_scale / self._pip_units / self._lot_units * self._lot_scale
+
+    def _calculate_position_size(self):
+        lots = self._column(self._position_size_in_lots)
+        sl_in_money = self._column(self._sl_in_money)
+        sl_with_commission_in_money = self._column(self._sl_with_commission_in_money)
+
+        lots_set = ~np.isnan(lots)
+        money_set = ~np.isnan(sl_in_money)
+
+        sl_per_lot_in_quote = self._sl_distance * self._lot_units / (self._unit_scale * self._lot_scale)
+        by_money = floor_to_units(self._to_quote(sl_in_money) / sl_per_lot_in_quote, 100)
+        by_money_with_commission = floor_to_units(
+            self._to_quote(sl_with_commission_in_money) / (sl_per_lot_in_quote + self._commission_per_lot_in_quote), 100
+        )
+
+        self._position_size_in_lots_out = np.where(lots_set, lots, np.where(money_set, by_money, by_money_with_commission))
+
+    def _calculate_money_in_cents(self, distance: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        numerator = distance * self._lot_units * self._position_size_in_lots_out
+        denominator = self._unit_scale * self._lot_scale
+
+        if self._conversion_steps is None:
+            cents = np.floor_divide(numerator, denominator)
+        else:
+            cents = floor_to_units(self._to_target(numerator / denominator), 1)
+
+        return cents, numerator >= _EXACT_LIMIT
+
+    def _calculate_sl_in_money(self):
+        self._sl_in_cents, self._sl_in_money_inexact = self._calculate_money_in_cents(self._sl_distance)
+
+    def _calculate_tp_in_money(self):
+        self._tp_in_cents, self._tp_in_money_inexact = self._calculate_money_in_cents(self._tp_distance)
+
+    def _calculate_sl_and_tp_with_commission_in_money(self):
+        commission = self._column(self._commission_per_lot_in_money)
+        commission_units = np.rint(commission * _COMMISSION_SCALE)
+        commission_in_units = commission_units * self._position_size_in_lots_out
+        cents_to_units = _COMMISSION_SCALE
+
+        self._commission_in_money_out = commission_in_units / (_COMMISSION_SCALE * 100)
+        self._sl_with_commission_in_units = self._sl_in_cents * cents_to_units + commission_in_units
+        self._tp_with_commission_in_units = self._tp_in_cents * cents_to_units - commission_in_units
+        self._commission_inexact = ~_is_on_grid(commission, _COMMISSION_SCALE) | (
+            self._sl_with_commission_in_units >= _EXACT_LIMIT
+        )
+
+    def _calculate_risk_reward_ratio(self):
+        self._rrr_out = np.floor_divide(100 * self._tp_distance, self._sl_distance) / 100
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = self._tp_with_commission_in_units / self._sl_with_commission_in_units
+        self._rrr_with_commission_out = floor_to_units(ratio, 100) / 100
+        self._rrr_with_commission_undefined = self._sl_with_commission_in_units == 0
+
+    def _set_result(self):
+        price_scale = self._unit_scale
+        commission_scale = _COMMISSION_SCALE * 100
+
+        self._result = {
+            "is_long": np.array(self._column(self._is_long)),
+            "position_size_in_lots": self._position_size_in_lots_out / 100,
+            "entry_price": self._column(self._entry_price) / price_scale,
+            "sl_price": self._sl_price_out / price_scale,
+            "tp_price": self._tp_price_out / price_scale,
+            "commission_per_lot_in_money": np.array(self._column(self._commission_per_lot_in_money)),
+            "commission_per_lot_in_pips": self._commission_per_lot_in_pips_out,
+            "commission_in_money": self._commission_in_money_out,
+            "sl_in_pips": self._sl_in_pips_out,
+            "tp_in_pips": self._tp_in_pips_out,
+            "sl_in_points": self._sl_in_points_out,
+            "tp_in_points": self._tp_in_points_out,
+            "sl_in_money": self._sl_in_cents / 100,
+            "tp_in_money": self._tp_in_cents / 100,
+            "rrr": self._rrr_out,
+            "sl_with_commission_in_money": self._sl_with_commission_in_units / commission_scale,
+            "tp_with_commission_in_money": self._tp_with_commission_in_units / commission_scale,
+            "rrr_with_commission": self._rrr_with_commission_out,
+        }
+
+    def _recalculate_inexact_rows(self):
+        inexact = self._sl_in_money_inexact | self._tp_in_money_inexact | self._commission_inexact
+        inexact = (inexact | self._rrr_with_commission_undefined) & (self._error_code == ERROR_NONE)
+
+        for index in zip(*np.nonzero(inexact)):
+            try:
+                result = self._calculate_row_with_scalar(index)
+            except (ValueError, ArithmeticError) as error:
+                if self._error_mode == "raise":
+                    raise
+                message = str(error) if isinstance(error, ValueError) else "Risk is too small for the minimum position size."
+                self._flag_row(index, ERROR_POSITION_SIZE, message)
+                continue
+
+            for field in OUTPUT_FIELDS:
+                self._result[field][index] = self._scalar_field(result, field)
+
+    def _calculate_row_with_scalar(self, index: Tuple[int, ...]) -> Dict[str, Any]:
+        calc = Calculator()
+        calc.set_symbol(self._symbol)
+        calc.set_target_currency(self._target_currency)
+
+        if self._rate_book is not None:
+            calc.set_exchange_rate(self._rate_book)
+        elif self._conversion_steps is not None:
+            rate = float(self._column(self._exchange_rate["rate"])[index])
+            calc.set_exchange_rate({"symbol": self._exchange_rate["symbol"], "rate": rate})
+
+        calc.set_is_long(bool(self._column(self._is_long)[index]))
+
+        for name, raw in self._raw_inputs.items():
+            value = float(np.broadcast_to(raw, self._shape)[index])
+            if not np.isnan(value):
+                getattr(calc, f"set_{name}")(value)
+
+        calc.calculate()
+        return calc.get_result()
+
+    def _scalar_field(self, result: Dict[str, Any], field: str) -> Any:
+        for group in ("rr_in_pips", "rr_in_points", "rr_in_money", "rr_with_commission_in_money"):
+            if field in result[group]:
+                return float(result[group][field])
+
+        return result[field] if field == "is_long" else float(result[field])
+
+    def _set_errors_in_result(self):
+        if self._error_mode == "raise":
+            return
+
+        invalid = self._error_code != ERROR_NONE
+        if np.any(invalid):
+            for field in OUTPUT_FIELDS[1:]:
+                self._result[field] = np.where(invalid, np.nan, self._result[field])
+        self._result.update(self.get_errors())
+
+    def get_errors(self) -> Dict[str, "np.ndarray"]:
+        if self._error_code is None:
+            raise AttributeError("Batch is not validated yet.")
+
+        return {
+            "error_code": self._error_code,
+            "error_message": np.array(self._error_messages, dtype=object)[self._error_message_index],
+        }
+
+    def get_result(self) -> Dict[str, "np.ndarray"]:
+        return self._result
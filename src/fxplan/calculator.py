@@ -1,30 +1,126 @@
+import functools
 from decimal import Decimal, ROUND_FLOOR
-from typing import Dict, Any
-from .calculator_base import CalculatorBase
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from .calculator_base import CalculatorBase, INPUTS, INPUT_FLAGS
+from .converter import get_converter
+from .result import Result
 from .utils import *
 
 
+def resolve_stage_inputs(dependencies: Dict[str, Tuple[str, ...]]) -> Dict[str, int]:
+    resolved = {}
+    for stage, names in dependencies.items():
+        inputs = 0
+        for name in names:
+            inputs |= resolved[name] if name in resolved else INPUT_FLAGS[name]
+        resolved[stage] = inputs
+
+    return resolved
+
+
+@functools.lru_cache(maxsize=None)
+def _select_stages(cls: type, changed_inputs: int) -> Tuple[str, ...]:
+    return tuple(stage for stage in cls._CALCULATION_STAGES if cls._STAGE_INPUTS[stage] & changed_inputs)
+
+
 class Calculator(CalculatorBase):
+    __slots__ = ()
+
+    _CALCULATION_STAGES = (
+        "_validate",
+        "_calculate_sl_price_and_in_pips_and_in_points",
+        "_calculate_tp_price_and_in_pips_and_in_points",
+        "_calculate_commission_per_lot_in_pips",
+        "_calculate_position_size",
+        "_calculate_sl_in_money",
+        "_calculate_tp_in_money",
+        "_calculate_sl_and_tp_with_commission_in_money",
+        "_calculate_risk_reward_ratio",
+        "_set_result",
+    )
+
+    _STAGE_INPUTS = resolve_stage_inputs({
+        "_validate": INPUTS,
+        "_calculate_sl_price_and_in_pips_and_in_points": ("symbol", "is_long", "entry_price", "sl"),
+        "_calculate_tp_price_and_in_pips_and_in_points": ("symbol", "is_long", "entry_price", "tp"),
+        "_calculate_commission_per_lot_in_pips": ("symbol", "commission", "exchange_rate"),
+        "_calculate_position_size": (
+            "position_size", "exchange_rate", "_calculate_sl_price_and_in_pips_and_in_points", "_calculate_commission_per_lot_in_pips",
+        ),
+        "_calculate_sl_in_money": ("exchange_rate", "_calculate_sl_price_and_in_pips_and_in_points", "_calculate_position_size"),
+        "_calculate_tp_in_money": ("exchange_rate", "_calculate_tp_price_and_in_pips_and_in_points", "_calculate_position_size"),
+        "_calculate_sl_and_tp_with_commission_in_money": ("commission", "_calculate_sl_in_money", "_calculate_tp_in_money"),
+        "_calculate_risk_reward_ratio": (
+            "_calculate_sl_price_and_in_pips_and_in_points", "_calculate_tp_price_and_in_pips_and_in_points",
+            "_calculate_sl_and_tp_with_commission_in_money",
+        ),
+        "_set_result": INPUTS,
+    })
+
+    _INPUT_STAGES = {
+        "sl": "_calculate_sl_price_and_in_pips_and_in_points",
+        "tp": "_calculate_tp_price_and_in_pips_and_in_points",
+        "position_size": "_calculate_position_size",
+    }
+
     def __init__(self):
         super().__init__()
 
     def calculate(self):
-        self._validate()
-        self._calculate_sl_price_and_in_pips_and_in_points()
-        self._calculate_tp_price_and_in_pips_and_in_points()
-        self._calculate_commission_per_lot_in_pips()
-        self._calculate_position_size()
-        self._calculate_sl_in_money()
-        self._calculate_tp_in_money()
-        self._calculate_sl_and_tp_with_commission_in_money()
-        self._calculate_risk_reward_ratio()
-        self._set_result()
+        changed_inputs = self._changed_inputs
+        if self._rate_book is not None and self._rate_book.get_version() != self._rate_book_version:
+            changed_inputs = self._changed_inputs = changed_inputs | INPUT_FLAGS["exchange_rate"]
+
+        if not changed_inputs:
+            return
+
+        if self._cache is not None:
+            return self._calculate_with_cache(changed_inputs)
+
+        stages = _select_stages(type(self), changed_inputs)
+        if self._instrumentation is not None:
+            return self._instrumentation.run(self, stages)
+
+        for stage in stages:
+            getattr(self, stage)()
+
+    def _calculate_with_cache(self, changed_inputs: int):
+        key = self._get_cache_key()
+        version = self._rate_book.get_version() if self._rate_book is not None else None
+        result = self._cache.get(key, version)
+        if result is not None:
+            result.restore_calculator(self)
+            self._result = result
+            self._rate_book_version = version
+            self._changed_inputs = 0
+            return
+
+        stages = _select_stages(type(self), changed_inputs)
+        if self._instrumentation is not None:
+            self._instrumentation.run(self, stages)
+        else:
+            for stage in stages:
+                getattr(self, stage)()
+
+        self._cache.put(key, version, self._result)
+
+    def calculate_many(self, plans: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for plan in plans:
+            self.with_inputs(**plan)
+            self.calculate()
+            yield self.get_result()
 
     def _validate(self):
+        self._restore_changed_inputs()
         self._validate_required_fields()
         self._validate_exchange_rate()
         self._validate_price_relation()
 
+    def _restore_changed_inputs(self):
+        for group, stage in self._INPUT_STAGES.items():
+            if self._changed_inputs & self._STAGE_INPUTS[stage]:
+                self._restore_input(group)
+
     def _validate_required_fields(self):
         if self._symbol is None:
             raise ValueError("Symbol is required.")
@@ -37,11 +133,28 @@ class Calculator(CalculatorBase):
 
     def _validate_exchange_rate(self):
         if self._symbol.get_quote_currency() == self._target_currency:
+            if self._rate_book is not None:
+                self._exchange_rate = {"symbol": None, "rate": None}
             return
 
         exchange_pair = f"{self._symbol.get_quote_currency()}{self._target_currency}"
         reverse_exchange_pair = f"{self._target_currency}{self._symbol.get_quote_currency()}"
 
+        if self._rate_book is not None:
+            if not self._rate_book.has_path(self._symbol.get_quote_currency(), self._target_currency):
+                raise ValueError(f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
+
+            self._converters = (
+                self._rate_book.get_converter(self._symbol.get_quote_currency(), self._target_currency),
+                self._rate_book.get_converter(self._target_currency, self._symbol.get_quote_currency()),
+            )
+            self._rate_book_version = self._rate_book.get_version()
+            self._exchange_rate = {"symbol": exchange_pair, "rate": self._converters[0].get_factor()}
+            return
+
+        if self._converters is not None:
+            return
+
         if self._exchange_rate is None or self._exchange_rate["symbol"] is None or self._exchange_rate["rate"] is None:
             raise ValueError(f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
 
@@ -56,6 +169,11 @@ class Calculator(CalculatorBase):
         if self._target_currency != base and self._target_currency != quote:
             raise ValueError(f"Exchange rate of '{exchange_pair}' or '{reverse_exchange_pair}' is required.")
 
+        self._converters = (
+            get_converter(self._exchange_rate["symbol"], self._exchange_rate["rate"], self._symbol.get_quote_currency(), self._target_currency),
+            get_converter(self._exchange_rate["symbol"], self._exchange_rate["rate"], self._target_currency, self._symbol.get_quote_currency()),
+        )
+
     def _validate_price_relation(self):
         if self._sl_price is not None:
             if self._is_long and self._sl_price >= self._entry_price:
@@ -119,22 +237,23 @@ class Calculator(CalculatorBase):
 
     def _calculate_sl_in_points_by_pips(self):
         self._sl_in_points = convert_pips_to_points(self._sl_in_pips)
-        self._sl_in_points = self._sl_in_points.quantize(Decimal("1"), rounding=ROUND_FLOOR)
+        self._sl_in_points = self._sl_in_points.quantize(POINTS_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_tp_in_points_by_pips(self):
         self._tp_in_points = convert_pips_to_points(self._tp_in_pips)
-        self._tp_in_points = self._tp_in_points.quantize(Decimal("1"), rounding=ROUND_FLOOR)
+        self._tp_in_points = self._tp_in_points.quantize(POINTS_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_sl_in_pips_by_points(self):
         self._sl_in_pips = convert_points_to_pips(self._sl_in_points)
-        self._sl_in_pips = self._sl_in_pips.quantize(Decimal("0.1"), rounding=ROUND_FLOOR)
+        self._sl_in_pips = self._sl_in_pips.quantize(PIPS_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_tp_in_pips_by_points(self):
         self._tp_in_pips = convert_points_to_pips(self._tp_in_points)
-        self._tp_in_pips = self._tp_in_pips.quantize(Decimal("0.1"), rounding=ROUND_FLOOR)
+        self._tp_in_pips = self._tp_in_pips.quantize(PIPS_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_commission_per_lot_in_pips(self):
         if self._commission_per_lot_in_money == 0:
+            self._commission_per_lot_in_pips = Decimal(0)
             return
 
         if self._symbol.get_quote_currency() == self._target_currency:
@@ -142,16 +261,17 @@ class Calculator(CalculatorBase):
         else:
             commission_per_lot_in_quote = self._exchange_currency(self._commission_per_lot_in_money, self._target_currency)
 
-        self._commission_per_lot_in_pips = commission_per_lot_in_quote / self._symbol.get_pip_size() / self._symbol.get_lot_size()
+        self._commission_per_lot_in_pips = commission_per_lot_in_quote / self._symbol.get_pip_value_per_lot()
 
     def _exchange_currency(self, source_amount: Decimal, source_currency: str) -> Decimal:
-        exchange_result = exchange_currency_by_rate(
-            source_amount=source_amount,
-            source_currency=source_currency,
-            exchange_symbol=self._exchange_rate["symbol"],
-            exchange_rate=self._exchange_rate["rate"],
-        )
-        return exchange_result[0]
+        if source_amount <= 0:
+            raise ValueError("Source amount must be positive.")
+
+        to_target_converter, to_quote_converter = self._converters
+
+        if source_currency == self._target_currency:
+            return to_quote_converter.convert(source_amount)
+        return to_target_converter.convert(source_amount)
 
     def _calculate_position_size(self):
         if self._position_size_in_lots is not None and self._sl_in_money is None and self._sl_with_commission_in_money is None:
@@ -169,8 +289,8 @@ class Calculator(CalculatorBase):
         else:
             sl_in_quote = self._exchange_currency(self._sl_in_money, self._target_currency)
 
-        position_size = sl_in_quote / (self._sl_in_pips * self._symbol.get_pip_size() * self._symbol.get_lot_size())
-        self._position_size_in_lots = position_size.quantize(Decimal('0.01'), rounding=ROUND_FLOOR)
+        position_size = sl_in_quote / (self._sl_in_pips * self._symbol.get_pip_value_per_lot())
+        self._position_size_in_lots = position_size.quantize(LOTS_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_position_size_by_sl_with_commission_in_money(self):
         if self._symbol.get_quote_currency() == self._target_currency:
@@ -179,8 +299,8 @@ class Calculator(CalculatorBase):
             sl_with_commission_in_quote = self._exchange_currency(self._sl_with_commission_in_money, self._target_currency)
 
         sl_with_commission_in_pips = self._sl_in_pips + self._commission_per_lot_in_pips
-        position_size = sl_with_commission_in_quote / (sl_with_commission_in_pips * self._symbol.get_pip_size() * self._symbol.get_lot_size())
-        self._position_size_in_lots = position_size.quantize(Decimal('0.01'), rounding=ROUND_FLOOR)
+        position_size = sl_with_commission_in_quote / (sl_with_commission_in_pips * self._symbol.get_pip_value_per_lot())
+        self._position_size_in_lots = position_size.quantize(LOTS_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_sl_in_money(self):
         sl_in_quote = abs(self._entry_price - self._sl_price) * self._symbol.get_lot_size() * self._position_size_in_lots
@@ -190,7 +310,7 @@ class Calculator(CalculatorBase):
         else:
             self._sl_in_money = self._exchange_currency(sl_in_quote, self._symbol.get_quote_currency())
 
-        self._sl_in_money = self._sl_in_money.quantize(Decimal("0.01"), rounding=ROUND_FLOOR)
+        self._sl_in_money = self._sl_in_money.quantize(MONEY_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_tp_in_money(self):
         tp_in_quote = abs(self._entry_price - self._tp_price) * self._symbol.get_lot_size() * self._position_size_in_lots
@@ -200,7 +320,7 @@ class Calculator(CalculatorBase):
         else:
             self._tp_in_money = self._exchange_currency(tp_in_quote, self._symbol.get_quote_currency())
 
-        self._tp_in_money = self._tp_in_money.quantize(Decimal("0.01"), rounding=ROUND_FLOOR)
+        self._tp_in_money = self._tp_in_money.quantize(MONEY_PRECISION, rounding=ROUND_FLOOR)
 
     def _calculate_sl_and_tp_with_commission_in_money(self):
         self._commission_in_money = self._commission_per_lot_in_money * self._position_size_in_lots
@@ -209,18 +329,20 @@ class Calculator(CalculatorBase):
 
     def _calculate_risk_reward_ratio(self):
         self._rrr = self._tp_in_pips / self._sl_in_pips
-        self._rrr = self._rrr.quantize(Decimal("0.01"), rounding=ROUND_FLOOR)
+        self._rrr = self._rrr.quantize(RRR_PRECISION, rounding=ROUND_FLOOR)
 
         self._rrr_with_commission = self._tp_with_commission_in_money / self._sl_with_commission_in_money
-        self._rrr_with_commission = self._rrr_with_commission.quantize(Decimal("0.01"), rounding=ROUND_FLOOR)
+        self._rrr_with_commission = self._rrr_with_commission.quantize(RRR_PRECISION, rounding=ROUND_FLOOR)
 
     def _set_result(self):
-        for k, v in vars(self).items():
-            if k.startswith('_') and k != '_result':
-                setattr(self._result, k, v)
+        self._result = Result.from_calculator(self)
+        self._changed_inputs = 0
 
     def get_result(self) -> Dict[str, Any]:
         return self._result.get_result()
 
-    def get_result_as_json(self, convert_numbers_to: str = "string") -> str:
-        return self._result.get_result_as_json(convert_numbers_to)
+    def get_result_record(self) -> Result:
+        return self._result
+
+    def get_result_as_json(self, convert_numbers_to: str = "string", indent: Optional[int] = 4) -> str:
+        return self._result.get_result_as_json(convert_numbers_to, indent)
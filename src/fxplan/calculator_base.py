@@ -1,15 +1,74 @@
+import copy
 from decimal import Decimal, ROUND_FLOOR
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from .symbol import Symbol
+from .registry import default_registry
 from .result import Result
+from .rates import RateBook
+from .instrumentation import Instrumentation
+from .cache import ResultCache
 from .utils import *
 
+INPUTS = ("symbol", "is_long", "entry_price", "sl", "tp", "position_size", "commission", "exchange_rate")
+INPUT_FLAGS = {name: 1 << index for index, name in enumerate(INPUTS)}
+ALL_INPUTS = (1 << len(INPUTS)) - 1
+INPUT_FIELDS = {
+    "sl": ("_sl_price", "_sl_in_pips", "_sl_in_points"),
+    "tp": ("_tp_price", "_tp_in_pips", "_tp_in_points"),
+    "position_size": ("_position_size_in_lots", "_sl_in_money", "_sl_with_commission_in_money"),
+}
+
 
 class CalculatorBase:
+    __slots__ = (
+        "_symbol",
+        "_symbol_name",
+        "_target_currency",
+        "_exchange_rate",
+        "_rate_book",
+        "_rate_book_version",
+        "_converters",
+        "_commission_per_lot_in_money",
+        "_instrumentation",
+        "_cache",
+        "_result",
+        "_changed_inputs",
+        "_sl_input",
+        "_tp_input",
+        "_position_size_input",
+        "_is_long",
+        "_position_size_in_lots",
+        "_entry_price",
+        "_sl_price",
+        "_tp_price",
+        "_sl_in_pips",
+        "_tp_in_pips",
+        "_sl_in_points",
+        "_tp_in_points",
+        "_sl_in_money",
+        "_tp_in_money",
+        "_commission_per_lot_in_pips",
+        "_commission_in_money",
+        "_sl_with_commission_in_money",
+        "_tp_with_commission_in_money",
+        "_rrr",
+        "_rrr_with_commission",
+    )
+
     def __init__(self):
         self._symbol: Union[Symbol, str, None] = None
+        self._symbol_name: Optional[str] = None
         self._target_currency: Optional[str] = "USD"
         self._exchange_rate: Optional[dict] = {"symbol": None, "rate": None}
+        self._rate_book: Optional[RateBook] = None
+        self._rate_book_version: Optional[int] = None
+        self._converters: Optional[tuple] = None
+        self._commission_per_lot_in_money: Decimal = Decimal(0)
+        self._instrumentation: Optional[Instrumentation] = None
+        self._cache: Optional[ResultCache] = None
+        self.reset()
+
+    def reset(self):
         self._is_long: Optional[bool] = None
         self._position_size_in_lots: Optional[Decimal] = None
         self._entry_price: Optional[Decimal] = None
@@ -21,7 +80,6 @@ class CalculatorBase:
         self._tp_in_points: Optional[Decimal] = None
         self._sl_in_money: Optional[Decimal] = None
         self._tp_in_money: Optional[Decimal] = None
-        self._commission_per_lot_in_money: Decimal = Decimal(0)
         self._commission_per_lot_in_pips: Decimal = Decimal(0)
         self._commission_in_money: Decimal = Decimal(0)
         self._sl_with_commission_in_money: Optional[Decimal] = None
@@ -29,6 +87,94 @@ class CalculatorBase:
         self._rrr: Optional[Decimal] = None
         self._rrr_with_commission: Optional[Decimal] = None
         self._result: Result = Result()
+        self._changed_inputs: int = ALL_INPUTS
+        self._sl_input: Optional[tuple] = None
+        self._tp_input: Optional[tuple] = None
+        self._position_size_input: Optional[tuple] = None
+
+    def _restore_input(self, group: str) -> None:
+        for field in INPUT_FIELDS[group]:
+            setattr(self, field, None)
+
+        given = getattr(self, f"_{group}_input")
+        if given is not None:
+            setattr(self, *given)
+
+    def with_inputs(self, **kwargs: Any):
+        self.reset()
+
+        if "symbol" in kwargs:
+            symbol = kwargs["symbol"]
+            if self._symbol is None:
+                self.set_symbol(symbol)
+            elif not self._is_symbol(symbol):
+                name = symbol.get_symbol() if isinstance(symbol, Symbol) else symbol
+                raise ValueError(f"Symbol '{name}' does not match the calculator symbol '{self._symbol.get_symbol()}'.")
+
+        for name, value in kwargs.items():
+            if name == "symbol":
+                continue
+
+            setter = getattr(self, f"set_{name}", None)
+            if setter is None:
+                raise ValueError(f"Unknown input '{name}'.")
+
+            setter(value)
+
+        return self
+
+    def _is_symbol(self, symbol: Union[Symbol, str]) -> bool:
+        if isinstance(symbol, Symbol):
+            return symbol is self._symbol
+        if isinstance(symbol, str):
+            return normalize_symbol(symbol) == self._symbol.get_symbol()
+
+        raise TypeError("Symbol must be a string or a Symbol object.")
+
+    def clone(self):
+        clone = copy.copy(self)
+        clone._exchange_rate = dict(self._exchange_rate)
+        clone._result = Result()
+        clone._changed_inputs = ALL_INPUTS
+        return clone
+
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]):
+        if instrumentation is not None and not isinstance(instrumentation, Instrumentation):
+            raise TypeError("Instrumentation must be an Instrumentation object or None.")
+
+        self._instrumentation = instrumentation
+
+    def get_instrumentation(self) -> Optional[Instrumentation]:
+        return self._instrumentation
+
+    def set_cache(self, cache: Optional[ResultCache]):
+        if cache is not None and not isinstance(cache, ResultCache):
+            raise TypeError("Cache must be a ResultCache object or None.")
+
+        self._cache = cache
+
+    def get_cache(self) -> Optional[ResultCache]:
+        return self._cache
+
+    def _get_cache_key(self) -> tuple:
+        if self._rate_book is not None:
+            exchange_rate = self._rate_book
+        else:
+            exchange_rate = (self._exchange_rate["symbol"], str(self._exchange_rate["rate"]))
+
+        return (
+            type(self),
+            self._symbol,
+            self._symbol_name,
+            self._target_currency,
+            exchange_rate,
+            str(self._commission_per_lot_in_money),
+            self._is_long,
+            self._entry_price,
+            self._sl_input,
+            self._tp_input,
+            self._position_size_input,
+        )
 
     def set_symbol(self, symbol: Union[Symbol, str]):
         if self._symbol is not None:
@@ -36,11 +182,15 @@ class CalculatorBase:
 
         if isinstance(symbol, Symbol):
             self._symbol = symbol
+            self._symbol_name = symbol.get_symbol()
         elif isinstance(symbol, str):
-            self._symbol = Symbol(symbol)
+            self._symbol = default_registry.get(symbol)
+            self._symbol_name = symbol
         else:
             raise TypeError("Symbol must be a string or a Symbol object.")
 
+        self._changed_inputs = ALL_INPUTS
+
     def _raise_error_if_symbol_is_not_set(self) -> None:
         if self._symbol is None:
             raise ValueError("Symbol must be set before setting other fields.")
@@ -50,22 +200,37 @@ class CalculatorBase:
             raise TypeError("Target currency must be a string.")
 
         self._target_currency = parse_currency(value)
+        self._converters = None
+        self._changed_inputs |= INPUT_FLAGS["exchange_rate"]
+
+    def set_exchange_rate(self, value: Union[dict, RateBook]):
+        if isinstance(value, RateBook):
+            self._exchange_rate = {"symbol": None, "rate": None}
+            self._rate_book = value
+            self._rate_book_version = None
+            self._converters = None
+            self._changed_inputs |= INPUT_FLAGS["exchange_rate"]
+            return
 
-    def set_exchange_rate(self, value: dict):
         if not isinstance(value, dict):
-            raise TypeError("Exchange rate must be a dictionary.")
+            raise TypeError("Exchange rate must be a dictionary or a RateBook object.")
 
         self._exchange_rate = {"symbol": value.get("symbol"), "rate": to_decimal(value.get("rate"))}
+        self._rate_book = None
+        self._rate_book_version = None
+        self._converters = None
+        self._changed_inputs |= INPUT_FLAGS["exchange_rate"]
 
     def set_is_long(self, value: bool):
         if not isinstance(value, bool):
             raise TypeError("Is long must be a boolean.")
 
         self._is_long = value
+        self._changed_inputs |= INPUT_FLAGS["is_long"]
 
     def set_position_size_in_lots(self, value: Union[Decimal, int, float, str]):
         value = to_decimal(value)
-        value = value.quantize(Decimal('0.01'), rounding=ROUND_FLOOR)
+        value = value.quantize(LOTS_PRECISION, rounding=ROUND_FLOOR)
 
         if value <= 0:
             raise ValueError("Position size must be positive.")
@@ -73,6 +238,8 @@ class CalculatorBase:
         self._position_size_in_lots = value
         self._sl_in_money = None
         self._sl_with_commission_in_money = None
+        self._position_size_input = ("_position_size_in_lots", value)
+        self._changed_inputs |= INPUT_FLAGS["position_size"]
 
     def set_entry_price(self, value: Union[Decimal, int, float, str]):
         self._raise_error_if_symbol_is_not_set()
@@ -84,6 +251,7 @@ class CalculatorBase:
             raise ValueError("Entry price must be positive.")
 
         self._entry_price = value
+        self._changed_inputs |= INPUT_FLAGS["entry_price"]
 
     def set_sl_price(self, value: Union[Decimal, int, float, str]):
         self._raise_error_if_symbol_is_not_set()
@@ -97,6 +265,8 @@ class CalculatorBase:
         self._sl_price = value
         self._sl_in_pips = None
         self._sl_in_points = None
+        self._sl_input = ("_sl_price", value)
+        self._changed_inputs |= INPUT_FLAGS["sl"]
 
     def set_tp_price(self, value: Union[Decimal, int, float, str]):
         self._raise_error_if_symbol_is_not_set()
@@ -110,12 +280,14 @@ class CalculatorBase:
         self._tp_price = value
         self._tp_in_pips = None
         self._tp_in_points = None
+        self._tp_input = ("_tp_price", value)
+        self._changed_inputs |= INPUT_FLAGS["tp"]
 
     def set_sl_in_pips(self, value: Union[Decimal, int, float, str]):
         self._raise_error_if_symbol_is_not_set()
 
         value = to_decimal(value)
-        value = value.quantize(Decimal("0.1"), rounding=ROUND_FLOOR)
+        value = value.quantize(PIPS_PRECISION, rounding=ROUND_FLOOR)
 
         if value <= 0:
             raise ValueError("Stop loss in pips must be positive.")
@@ -123,12 +295,14 @@ class CalculatorBase:
         self._sl_in_pips = value
         self._sl_price = None
         self._sl_in_points = None
+        self._sl_input = ("_sl_in_pips", value)
+        self._changed_inputs |= INPUT_FLAGS["sl"]
 
     def set_tp_in_pips(self, value: Union[Decimal, int, float, str]):
         self._raise_error_if_symbol_is_not_set()
 
         value = to_decimal(value)
-        value = value.quantize(Decimal("0.1"), rounding=ROUND_FLOOR)
+        value = value.quantize(PIPS_PRECISION, rounding=ROUND_FLOOR)
 
         if value <= 0:
             raise ValueError("Take profit in pips must be positive.")
@@ -136,12 +310,14 @@ class CalculatorBase:
         self._tp_in_pips = value
         self._tp_price = None
         self._tp_in_points = None
+        self._tp_input = ("_tp_in_pips", value)
+        self._changed_inputs |= INPUT_FLAGS["tp"]
 
     def set_sl_in_points(self, value: Union[Decimal, int, float, str]):
         self._raise_error_if_symbol_is_not_set()
 
         value = to_decimal(value)
-        value = value.quantize(Decimal("1"), rounding=ROUND_FLOOR)
+        value = value.quantize(POINTS_PRECISION, rounding=ROUND_FLOOR)
 
         if value <= 0:
             raise ValueError("Stop loss in points must be positive.")
@@ -149,12 +325,14 @@ class CalculatorBase:
         self._sl_in_points = value
         self._sl_price = None
         self._sl_in_pips = None
+        self._sl_input = ("_sl_in_points", value)
+        self._changed_inputs |= INPUT_FLAGS["sl"]
 
     def set_tp_in_points(self, value: Union[Decimal, int, float, str]):
         self._raise_error_if_symbol_is_not_set()
 
         value = to_decimal(value)
-        value = value.quantize(Decimal("1"), rounding=ROUND_FLOOR)
+        value = value.quantize(POINTS_PRECISION, rounding=ROUND_FLOOR)
 
         if value <= 0:
             raise ValueError("Take profit in points must be positive.")
@@ -162,6 +340,8 @@ class CalculatorBase:
         self._tp_in_points = value
         self._tp_price = None
         self._tp_in_pips = None
+        self._tp_input = ("_tp_in_points", value)
+        self._changed_inputs |= INPUT_FLAGS["tp"]
 
     def set_sl_in_money(self, value: Union[Decimal, int, float, str]):
         value = to_decimal(value)
@@ -172,6 +352,8 @@ class CalculatorBase:
         self._sl_in_money = value
         self._position_size_in_lots = None
         self._sl_with_commission_in_money = None
+        self._position_size_input = ("_sl_in_money", value)
+        self._changed_inputs |= INPUT_FLAGS["position_size"]
 
     def set_commission_per_lot_in_money(self, value: Union[Decimal, int, float, str]):
         value = to_decimal(value)
@@ -180,6 +362,7 @@ class CalculatorBase:
             raise ValueError("Commission per lot in money must be non-negative.")
 
         self._commission_per_lot_in_money = value
+        self._changed_inputs |= INPUT_FLAGS["commission"]
 
     def set_sl_with_commission_in_money(self, value: Union[Decimal, int, float, str]):
         value = to_decimal(value)
@@ -190,3 +373,5 @@ class CalculatorBase:
         self._sl_with_commission_in_money = value
         self._position_size_in_lots = None
         self._sl_in_money = None
+        self._position_size_input = ("_sl_with_commission_in_money", value)
+        self._changed_inputs |= INPUT_FLAGS["position_size"]
@@ -0,0 +1,370 @@
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from .calculator import Calculator
+from .client import DEFAULT_SOCKET
+from .parallel import ParallelExecutor
+from .rates import RateBook
+from .registry import default_registry
+from .result import RESULT_FIELDS, Result
+from .serialization import dumps
+from .specs import ContractSpecStore
+
+FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+BOOLEANS = {
+    "true": True, "1": True, "yes": True, "long": True, "buy": True,
+    "false": False, "0": False, "no": False, "short": False, "sell": False,
+}
+DEFAULT_CHUNK_SIZE = 1000
+
+Plan = Union[Dict[str, Any], Exception]
+Output = Tuple[int, Optional[Result], Optional[str]]
+
+
+def read_csv_plans(file: IO[str]) -> Iterator[Tuple[int, Plan]]:
+    for row, record in enumerate(csv.DictReader(file), 1):
+        if None in record:
+            yield row, ValueError("Row has more values than the header.")
+            continue
+
+        yield row, {name: value for name, value in record.items() if value not in ("", None)}
+
+
+def read_ndjson_plans(file: IO[str]) -> Iterator[Tuple[int, Plan]]:
+    for row, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+
+        try:
+            plan = json.loads(line, parse_float=Decimal)
+        except ValueError:
+            yield row, ValueError("Line is not valid JSON.")
+            continue
+
+        if not isinstance(plan, dict):
+            yield row, TypeError("Plan must be a JSON object.")
+            continue
+
+        yield row, {name: value for name, value in plan.items() if value is not None}
+
+
+READERS = {"csv": read_csv_plans, "ndjson": read_ndjson_plans}
+ROW_SETTINGS = frozenset(("target_currency", "exchange_rate"))
+
+
+class PlanProcessor:
+    def __init__(
+        self,
+        symbol: Optional[str] = None,
+        target_currency: Optional[str] = None,
+        rate_book: Optional[RateBook] = None,
+        commission_per_lot_in_money: Union[Decimal, int, float, str] = 0,
+    ) -> None:
+        self._symbol = symbol
+        self._target_currency = target_currency
+        self._rate_book = rate_book
+        self._commission_per_lot_in_money = commission_per_lot_in_money
+        self._calculators: Dict[str, Calculator] = {}
+
+    def get_rate_book(self) -> Optional[RateBook]:
+        return self._rate_book
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {**self.__dict__, "_calculators": {}}
+
+    def _create_calculator(self, symbol: str) -> Calculator:
+        calc = Calculator()
+        calc.set_symbol(symbol)
+        if self._target_currency is not None:
+            calc.set_target_currency(self._target_currency)
+        if self._rate_book is not None:
+            calc.set_exchange_rate(self._rate_book)
+        return calc
+
+    def _get_calculator(self, symbol: str) -> Calculator:
+        calc = self._calculators.get(symbol)
+        if calc is None:
+            calc = self._calculators[symbol] = self._create_calculator(symbol)
+
+        return calc
+
+    def process(self, plan: Dict[str, Any]) -> Result:
+        plan = dict(plan)
+        symbol = plan.pop("symbol", self._symbol)
+        if symbol is None:
+            raise ValueError("Symbol is required.")
+
+        if isinstance(plan.get("is_long"), str):
+            plan["is_long"] = BOOLEANS.get(plan["is_long"].strip().lower(), plan["is_long"])
+        plan.setdefault("commission_per_lot_in_money", self._commission_per_lot_in_money)
+
+        # The shared calculator of a symbol keeps its settings between rows, so a row with
+        # settings of its own gets a calculator of its own.
+        if ROW_SETTINGS.isdisjoint(plan):
+            calc = self._get_calculator(symbol)
+        else:
+            calc = self._create_calculator(symbol)
+        calc.with_inputs(**plan)
+        calc.calculate()
+        return calc.get_result_record()
+
+    def process_chunk(self, chunk: Iterable[Tuple[int, Plan]]) -> List[Output]:
+        outputs = []
+        for row, plan in chunk:
+            try:
+                if isinstance(plan, Exception):
+                    raise plan
+                outputs.append((row, self.process(plan), None))
+            except (ValueError, TypeError, ArithmeticError) as error:
+                outputs.append((row, None, str(error)))
+
+        return outputs
+
+
+def format_ndjson(outputs: Iterable[Output]) -> str:
+    lines = []
+    for row, result, error in outputs:
+        record = {"row": row, "error": error} if result is None else {"row": row, "result": result.get_serializable_result()}
+        lines.append(dumps(record))
+        lines.append("\n")
+
+    return "".join(lines)
+
+
+def format_csv(outputs: Iterable[Output]) -> str:
+    empty = ("",) * len(RESULT_FIELDS)
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(
+        (row, *(empty if result is None else ("" if value is None else value for value in result.get_values())), error or "")
+        for row, result, error in outputs
+    )
+    return buffer.getvalue()
+
+
+FORMATTERS = {"csv": format_csv, "ndjson": format_ndjson}
+HEADERS = {"csv": ",".join(("row", *RESULT_FIELDS, "error")) + "\n", "ndjson": ""}
+
+
+class ChunkFormatter:
+    def __init__(self, processor: PlanProcessor, output_format: str = "ndjson") -> None:
+        if output_format not in FORMATTERS:
+            raise ValueError(f"Output format must be one of {', '.join(map(repr, sorted(FORMATTERS)))}.")
+
+        self._processor = processor
+        self._output_format = output_format
+
+    def process_chunk(self, chunk: Iterable[Tuple[int, Plan]]) -> Tuple[str, int, int]:
+        outputs = self._processor.process_chunk(chunk)
+        errors = sum(1 for _, result, _ in outputs if result is None)
+        return FORMATTERS[self._output_format](outputs), len(outputs), errors
+
+
+def iter_chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(
+    plans: Iterable[Tuple[int, Plan]],
+    processor: PlanProcessor,
+    output: IO[str],
+    output_format: str = "ndjson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    formatter = ChunkFormatter(processor, output_format)
+    rows = errors = 0
+    started = time.perf_counter()
+    executor = ParallelExecutor(formatter, workers) if workers > 1 else None
+    try:
+        output.write(HEADERS[output_format])
+        chunks = iter_chunks(plans, chunk_size)
+        for text, chunk_rows, chunk_errors in map(formatter.process_chunk, chunks) if executor is None else executor.map(chunks):
+            output.write(text)
+            rows += chunk_rows
+            errors += chunk_errors
+    finally:
+        if executor is not None:
+            executor.close()
+
+    seconds = time.perf_counter() - started
+    return {"rows": rows, "errors": errors, "seconds": seconds, "rows_per_second": rows / seconds if seconds else 0.0}
+
+
+def _get_format(path: str, given: Optional[str]) -> str:
+    if given is not None:
+        return given
+    if path == "-":
+        return "ndjson"
+
+    suffix = Path(path).suffix.lower()
+    if suffix not in FORMATS:
+        raise ValueError(f"Format of '{path}' cannot be inferred from its extension.")
+
+    return FORMATS[suffix]
+
+
+def _parse_rate(value: str) -> Tuple[str, str]:
+    symbol, separator, rate = value.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Rate '{value}' must be in the format of SYMBOL=RATE.")
+
+    return symbol, rate
+
+
+def _load_rate_book(rates: Sequence[Tuple[str, str]], rates_path: Optional[str]) -> Optional[RateBook]:
+    if not rates and rates_path is None:
+        return None
+
+    rate_book = RateBook()
+    if rates_path is not None:
+        with open(rates_path, encoding="utf-8") as file:
+            rate_book.update(json.load(file))
+    rate_book.update(dict(rates))
+    return rate_book
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def _create_processor(args: argparse.Namespace, with_rate_book: bool = False) -> PlanProcessor:
+    if args.specs is not None:
+        default_registry.set_spec_store(ContractSpecStore.load(args.specs))
+
+    rate_book = _load_rate_book(args.rate, args.rates)
+    if rate_book is None and with_rate_book:
+        rate_book = RateBook()
+
+    return PlanProcessor(
+        symbol=args.symbol,
+        target_currency=args.target_currency,
+        rate_book=rate_book,
+        commission_per_lot_in_money=args.commission_per_lot_in_money,
+    )
+
+
+def _batch(args: argparse.Namespace) -> int:
+    input_format = _get_format(args.input, args.input_format)
+    output_format = _get_format(args.output, args.output_format)
+    processor = _create_processor(args)
+
+    input_file = _open(args.input, "r")
+    output_file = _open(args.output, "w")
+    try:
+        stats = run_batch(READERS[input_format](input_file), processor, output_file, output_format, args.chunk_size, args.workers)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+        else:
+            output_file.flush()
+
+    if not args.quiet:
+        print(
+            f"Calculated {stats['rows']:,} plans ({stats['errors']:,} errors) in {stats['seconds']:.2f} s "
+            f"({stats['rows_per_second']:,.0f} plans/s).",
+            file=sys.stderr,
+        )
+
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    import asyncio
+    import signal
+    from .server import PricingServer, serve
+
+    processor = _create_processor(args, with_rate_book=args.socket is not None)
+    batch_window = args.batch_window
+    if batch_window is None:
+        batch_window = 0.0 if args.socket is not None else 1.0
+
+    server = PricingServer(
+        processor,
+        batch_window=batch_window / 1000,
+        max_batch_size=args.max_batch_size,
+        max_pending=args.max_pending,
+    )
+
+    def ready(listener: Any) -> None:
+        if args.quiet:
+            return
+        if args.socket is not None:
+            print(f"Listening on unix:{args.socket}", file=sys.stderr, flush=True)
+        else:
+            host, port = listener.sockets[0].getsockname()[:2]
+            print(f"Listening on http://{host}:{port}", file=sys.stderr, flush=True)
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        asyncio.run(serve(server, args.host, args.port, ready, args.socket))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _add_calculation_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--symbol", help="symbol of the plans without a 'symbol' column")
+    parser.add_argument("--target-currency", help="currency of the money values (default: USD)")
+    parser.add_argument("--rate", type=_parse_rate, action="append", default=[], metavar="SYMBOL=RATE", help="exchange rate, e.g. USDJPY=158.968")
+    parser.add_argument("--rates", help="JSON file of exchange rates keyed by symbol")
+    parser.add_argument("--commission-per-lot-in-money", default="0", help="commission of the plans without a commission column")
+    parser.add_argument("--specs", help="CSV or JSON file of contract specs")
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="fxplan", description="Forex trade plan calculations.")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    batch = commands.add_parser("batch", help="calculate trade plans from a CSV or NDJSON file")
+    batch.add_argument("input", nargs="?", default="-", help="CSV or NDJSON file of trade plans ('-' for stdin)")
+    batch.add_argument("-o", "--output", default="-", help="where to write the results ('-' for stdout)")
+    batch.add_argument("--input-format", choices=sorted(READERS), help="format of the input (default: from the extension)")
+    batch.add_argument("--output-format", choices=sorted(FORMATTERS), help="format of the output (default: from the extension)")
+    batch.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="number of plans calculated per chunk")
+    batch.add_argument("-w", "--workers", type=int, default=1, help="number of worker processes (default: 1, in-process)")
+    _add_calculation_arguments(batch)
+    batch.add_argument("-q", "--quiet", action="store_true", help="do not report the throughput")
+    batch.set_defaults(handler=_batch)
+
+    serve = commands.add_parser("serve", help="calculate trade plans posted as JSON over HTTP or a Unix socket")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080)")
+    serve.add_argument("--socket", nargs="?", const=DEFAULT_SOCKET, metavar="PATH", help=f"listen for JSON lines on a Unix socket instead of HTTP (default path: {DEFAULT_SOCKET})")
+    serve.add_argument("--batch-window", type=float, metavar="MS", help="how long to wait for more requests to batch (default: 1 ms, 0 with --socket)")
+    serve.add_argument("--max-batch-size", type=int, default=256, help="number of plans calculated per batch at most")
+    serve.add_argument("--max-pending", type=int, default=4096, help="number of waiting plans before requests are rejected with 503")
+    _add_calculation_arguments(serve)
+    serve.add_argument("-q", "--quiet", action="store_true", help="do not report the address")
+    serve.set_defaults(handler=_serve)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, TypeError) as error:
+        parser.exit(2, f"{parser.prog}: error: {error}\n")
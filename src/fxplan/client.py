@@ -0,0 +1,86 @@
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or "/tmp", "fxplan.sock")
+
+USAGE = """usage: fxplan-client [-s SOCKET] [PLAN | NAME=VALUE ...]
+
+Send one plan to a running 'fxplan serve --socket' daemon and print its JSON response.
+The plan is a JSON object, NAME=VALUE inputs or, when omitted, a JSON line on stdin.
+The exit status is 1 when the response is an error.
+"""
+
+
+def _parse_value(value: str):
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    return value
+
+
+def build_request(arguments) -> bytes:
+    if not arguments:
+        request = sys.stdin.readline().strip()
+    elif len(arguments) == 1 and arguments[0].lstrip().startswith(("{", "[")):
+        request = arguments[0].strip()
+    else:
+        import json
+
+        plan = {}
+        for argument in arguments:
+            name, separator, value = argument.partition("=")
+            if not separator:
+                raise ValueError(f"Input '{argument}' must be in the format of NAME=VALUE.")
+            plan[name] = _parse_value(value)
+        request = json.dumps(plan, separators=(",", ":"))
+
+    if "\n" in request:
+        import json
+
+        request = json.dumps(json.loads(request), separators=(",", ":"))
+    return request.encode("utf-8") + b"\n"
+
+
+def request(payload: bytes, path: str = DEFAULT_SOCKET, timeout: float = 5.0) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(path)
+        connection.sendall(payload)
+
+        chunks = []
+        while True:
+            chunk = connection.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    return b"".join(chunks)
+
+
+def main(argv=None) -> int:
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    path = os.environ.get("FXPLAN_SOCKET", DEFAULT_SOCKET)
+    if arguments and arguments[0] in ("-h", "--help"):
+        sys.stdout.write(USAGE)
+        return 0
+    if arguments and arguments[0] in ("-s", "--socket"):
+        if len(arguments) < 2:
+            sys.stderr.write(USAGE)
+            return 2
+        path, arguments = arguments[1], arguments[2:]
+
+    try:
+        response = request(build_request(arguments), path)
+    except (OSError, ValueError) as error:
+        sys.stderr.write(f"fxplan-client: error: {error}\n")
+        return 2
+
+    sys.stdout.buffer.write(response)
+    sys.stdout.flush()
+    return 1 if response.startswith(b'{"error"') else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import functools
+from decimal import Decimal
+from typing import Iterable, Optional, Tuple, Union
+from .utils import *
+
+
+class CurrencyConverter:
+    def __init__(self, source_currency: str, target_currency: str, steps: Iterable[Tuple[Decimal, bool]]) -> None:
+        self._source_currency: str = source_currency
+        self._target_currency: str = target_currency
+        self._steps: Tuple[Tuple[Decimal, bool], ...] = tuple(steps)
+        self._factor: Optional[Decimal] = None
+
+    def get_source_currency(self) -> str:
+        return self._source_currency
+
+    def get_target_currency(self) -> str:
+        return self._target_currency
+
+    def get_steps(self) -> Tuple[Tuple[Decimal, bool], ...]:
+        return self._steps
+
+    def get_factor(self) -> Decimal:
+        if self._factor is None:
+            self._factor = self.convert(Decimal(1))
+        return self._factor
+
+    def inverse(self) -> "CurrencyConverter":
+        return CurrencyConverter(
+            self._target_currency,
+            self._source_currency,
+            ((rate, not multiply) for rate, multiply in reversed(self._steps)),
+        )
+
+    def convert(self, amount: Decimal) -> Decimal:
+        for rate, multiply in self._steps:
+            amount = amount * rate if multiply else amount / rate
+        return amount
+
+
+def resolve_exchange_direction(exchange_symbol: str, source_currency: str, target_currency: str) -> bool:
+    base, quote = parse_symbol(exchange_symbol)
+
+    if base == quote:
+        raise ValueError("Exchange symbol must contain different base and quote currencies.")
+
+    if (source_currency, target_currency) not in ((base, quote), (quote, base)):
+        raise ValueError(f"Exchange symbol '{base}{quote}' does not convert '{source_currency}' to '{target_currency}'.")
+
+    return source_currency == base
+
+
+def get_converter(
+    exchange_symbol: str,
+    exchange_rate: Union[Decimal, int, float, str],
+    source_currency: str,
+    target_currency: str,
+) -> CurrencyConverter:
+    return _get_converter(exchange_symbol, str(to_decimal(exchange_rate)), source_currency, target_currency)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_converter(exchange_symbol: str, exchange_rate: str, source_currency: str, target_currency: str) -> CurrencyConverter:
+    rate = Decimal(exchange_rate)
+
+    if rate <= 0:
+        raise ValueError("Exchange rate must be positive.")
+
+    multiply = resolve_exchange_direction(exchange_symbol, source_currency, target_currency)
+    return CurrencyConverter(source_currency, target_currency, ((rate, multiply),))
@@ -0,0 +1,130 @@
+from dataclasses import dataclass, fields
+from decimal import Decimal, localcontext
+from typing import Any, Hashable, Iterable, List, Mapping, NamedTuple, Optional, Union
+from .calculator import Calculator
+from .plan import DECIMAL_CONTEXT, TradePlan
+from .rates import RateBook
+from .registry import default_registry
+from .result import Result
+from .symbol import Symbol
+from .utils import *
+
+Number = Union[Decimal, int, float, str]
+Rates = Union[RateBook, Mapping[str, Number], None]
+
+_POSITION_SIZE_FIELDS = ("position_size_in_lots", "sl_in_money", "sl_with_commission_in_money")
+
+
+@dataclass(frozen=True)
+class Account:
+    account_id: Hashable
+    balance: Number
+    risk_in_percent: Optional[Number] = None
+    risk_in_money: Optional[Number] = None
+    currency: str = "USD"
+    commission_per_lot_in_money: Number = 0
+    risk_includes_commission: bool = False
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.currency, str):
+            raise TypeError("Currency must be a string.")
+        object.__setattr__(self, "currency", parse_currency(self.currency))
+
+        for name, message in (
+            ("balance", "Balance must be positive."),
+            ("risk_in_percent", "Risk in percent must be positive."),
+            ("risk_in_money", "Risk in money must be positive."),
+        ):
+            value = getattr(self, name)
+            if value is not None:
+                value = to_decimal(value)
+                if value <= 0:
+                    raise ValueError(message)
+                object.__setattr__(self, name, value)
+
+        commission = to_decimal(self.commission_per_lot_in_money)
+        if commission < 0:
+            raise ValueError("Commission per lot in money must be non-negative.")
+        object.__setattr__(self, "commission_per_lot_in_money", commission)
+
+        if (self.risk_in_percent is None) == (self.risk_in_money is None):
+            raise ValueError("Only one of the risk in money or risk in percent is set.")
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, Any]) -> "Account":
+        unknown = set(values) - {field.name for field in fields(cls)}
+        if unknown:
+            raise ValueError(f"Unknown input '{sorted(unknown)[0]}'.")
+
+        return cls(**values)
+
+    def get_risk_in_money(self) -> Decimal:
+        if self.risk_in_money is not None:
+            return self.risk_in_money
+
+        return self.balance * self.risk_in_percent / 100
+
+
+class AccountResult(NamedTuple):
+    account_id: Hashable
+    result: Optional[Result]
+    error: Optional[str] = None
+
+
+def _get_rate_book(rates: Rates) -> Optional[RateBook]:
+    if rates is None or isinstance(rates, RateBook):
+        return rates
+
+    if not isinstance(rates, dict):
+        raise TypeError("Rates must be a dictionary or a RateBook object.")
+
+    return RateBook(dict(rates))
+
+
+def fan_out(plan: TradePlan, accounts: Iterable[Account], rates: Rates = None) -> List[AccountResult]:
+    if not isinstance(plan, TradePlan):
+        raise TypeError("Plan must be a TradePlan object.")
+
+    inputs = plan.get_inputs()
+    if any(name in inputs for name in _POSITION_SIZE_FIELDS):
+        raise ValueError("Position size of a fanned-out plan is set by the accounts.")
+    inputs.pop("commission_per_lot_in_money", None)
+
+    rate_book = _get_rate_book(rates)
+    outputs = []
+    with localcontext(DECIMAL_CONTEXT):
+        symbol = plan.symbol if isinstance(plan.symbol, Symbol) else default_registry.get(plan.symbol)
+        calc = Calculator()
+        calc.set_symbol(symbol)
+        calc.set_target_currency(symbol.get_quote_currency())
+        if rate_book is not None:
+            calc.set_exchange_rate(rate_book)
+        calc.with_inputs(**inputs, position_size_in_lots=1)
+        calc.calculate()
+
+        for account in accounts:
+            if not isinstance(account, Account):
+                raise TypeError("Account must be an Account object.")
+
+            try:
+                calc.set_target_currency(account.currency)
+                calc.set_commission_per_lot_in_money(account.commission_per_lot_in_money)
+                if account.risk_includes_commission:
+                    calc.set_sl_with_commission_in_money(account.get_risk_in_money())
+                else:
+                    calc.set_sl_in_money(account.get_risk_in_money())
+                calc.calculate()
+            except (ValueError, TypeError) as error:
+                outputs.append(AccountResult(account.account_id, None, str(error)))
+                continue
+            except ArithmeticError:
+                # A risk below the minimum lot floors the position size to zero, and the
+                # money and RRR stages that follow then fail on the zero size.
+                if calc._position_size_in_lots != 0:
+                    raise
+                outputs.append(AccountResult(account.account_id, None, "Risk is too small for the minimum position size."))
+                continue
+
+            outputs.append(AccountResult(account.account_id, calc.get_result_record()))
+
+    return outputs
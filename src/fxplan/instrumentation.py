@@ -0,0 +1,178 @@
+import bisect
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+LATENCY_BUCKETS = (
+    0.000001, 0.0000025, 0.000005,
+    0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1,
+)
+
+
+def normalize_error_message(message: str) -> str:
+    message = re.sub(r"'[^']*'", "'*'", message)
+    return re.sub(r"\d+(\.\d+)?", "N", message)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS) -> None:
+        self._buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._counts: List[int] = [0] * (len(self._buckets) + 1)
+        self._count: int = 0
+        self._sum: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._counts[bisect.bisect_left(self._buckets, seconds)] += 1
+        self._count += 1
+        self._sum += seconds
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_sum(self) -> float:
+        return self._sum
+
+    def get_buckets(self) -> List[Tuple[float, int]]:
+        cumulative = 0
+        buckets = []
+        for bound, count in zip(self._buckets + (float("inf"),), self._counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return buckets
+
+    def get_quantile(self, quantile: float) -> Optional[float]:
+        if not 0 <= quantile <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+
+        if self._count == 0:
+            return None
+
+        rank = quantile * self._count
+        lower = 0.0
+        cumulative = 0
+        for bound, count in zip(self._buckets, self._counts):
+            if count and cumulative + count >= rank:
+                return lower + (bound - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = bound
+        return self._buckets[-1]
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "buckets": {_format_bound(bound): count for bound, count in self.get_buckets()},
+            "p50": self.get_quantile(0.5),
+            "p90": self.get_quantile(0.9),
+            "p99": self.get_quantile(0.99),
+        }
+
+
+class Instrumentation:
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS) -> None:
+        self._buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calculate: LatencyHistogram = LatencyHistogram(self._buckets)
+            self._stages: Dict[str, LatencyHistogram] = {}
+            self._errors: Dict[Tuple[str, str, str], int] = {}
+
+    def run(self, calculator: Any, stages: Iterable[str]) -> None:
+        started = time.perf_counter()
+        stage = None
+        try:
+            for stage in stages:
+                stage_started = time.perf_counter()
+                try:
+                    getattr(calculator, stage)()
+                finally:
+                    self.observe(stage.lstrip("_"), time.perf_counter() - stage_started)
+        except Exception as e:
+            self.record_error(stage.lstrip("_") if stage else "calculate", e)
+            raise
+        finally:
+            self.observe(None, time.perf_counter() - started)
+
+    def observe(self, stage: Optional[str], seconds: float) -> None:
+        with self._lock:
+            if stage is None:
+                histogram = self._calculate
+            else:
+                histogram = self._stages.get(stage)
+                if histogram is None:
+                    histogram = self._stages[stage] = LatencyHistogram(self._buckets)
+            histogram.observe(seconds)
+
+    def record_error(self, stage: str, error: Exception) -> None:
+        key = (stage, type(error).__name__, normalize_error_message(str(error)))
+        with self._lock:
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calculate": self._calculate.get_snapshot(),
+                "stages": {stage: histogram.get_snapshot() for stage, histogram in self._stages.items()},
+                "errors": [
+                    {"stage": stage, "error": error, "message": message, "count": count}
+                    for (stage, error, message), count in self._errors.items()
+                ],
+            }
+
+    def get_prometheus_text(self, prefix: str = "fxplan") -> str:
+        with self._lock:
+            lines = [
+                f"# HELP {prefix}_calculate_duration_seconds Duration of Calculator.calculate() calls.",
+                f"# TYPE {prefix}_calculate_duration_seconds histogram",
+            ]
+            lines += _format_histogram(f"{prefix}_calculate_duration_seconds", {}, self._calculate)
+
+            lines += [
+                f"# HELP {prefix}_stage_duration_seconds Duration of each Calculator.calculate() stage.",
+                f"# TYPE {prefix}_stage_duration_seconds histogram",
+            ]
+            for stage, histogram in self._stages.items():
+                lines += _format_histogram(f"{prefix}_stage_duration_seconds", {"stage": stage}, histogram)
+
+            lines += [
+                f"# HELP {prefix}_stage_errors_total Errors raised by Calculator.calculate() stages.",
+                f"# TYPE {prefix}_stage_errors_total counter",
+            ]
+            for (stage, error, message), count in self._errors.items():
+                labels = _format_labels({"stage": stage, "error": error, "message": message})
+                lines.append(f"{prefix}_stage_errors_total{labels} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_histogram(name: str, labels: Dict[str, str], histogram: LatencyHistogram) -> List[str]:
+    lines = [
+        f"{name}_bucket{_format_labels({**labels, 'le': _format_bound(bound)})} {count}"
+        for bound, count in histogram.get_buckets()
+    ]
+    lines.append(f"{name}_sum{_format_labels(labels)} {histogram.get_sum()!r}")
+    lines.append(f"{name}_count{_format_labels(labels)} {histogram.get_count()}")
+    return lines
@@ -0,0 +1,237 @@
+import csv
+import json
+import queue
+import time
+from decimal import Decimal
+from typing import IO, Any, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+from .calculator import Calculator
+from .instrumentation import LatencyHistogram
+from .plan import TradePlan
+from .rates import RateBook
+from .registry import default_registry
+from .result import RESULT_FIELDS, Result
+from .symbol import Symbol
+from .utils import *
+
+Number = Union[Decimal, int, float, str]
+
+
+class Quote(NamedTuple):
+    symbol: str
+    bid: Number
+    ask: Optional[Number] = None
+    time: Optional[float] = None
+
+
+class Delta(NamedTuple):
+    plan_id: Hashable
+    result: Optional[Result]
+    changes: Dict[str, Tuple[Any, Any]]
+    error: Optional[str] = None
+
+
+class _Subscription:
+    __slots__ = ("plan", "symbol", "calculator", "follow_entry", "result")
+
+    def __init__(self, plan: TradePlan, symbol: Symbol, calculator: Calculator, follow_entry: bool) -> None:
+        self.plan = plan
+        self.symbol = symbol
+        self.calculator = calculator
+        self.follow_entry = follow_entry
+        self.result: Optional[Result] = None
+
+
+def _parse_pair(symbol: str) -> Optional[Tuple[str, str]]:
+    try:
+        return parse_symbol(symbol)
+    except ValueError:
+        return None
+
+
+def _get_changes(previous: Optional[Result], result: Result) -> Dict[str, Tuple[Any, Any]]:
+    values = result.get_values()
+    if previous is None:
+        return {field: (None, value) for field, value in zip(RESULT_FIELDS, values)}
+
+    return {
+        field: (old, new)
+        for field, old, new in zip(RESULT_FIELDS, previous.get_values(), values)
+        if old != new
+    }
+
+
+class RepricingEngine:
+    def __init__(self, rate_book: Optional[RateBook] = None) -> None:
+        if rate_book is not None and not isinstance(rate_book, RateBook):
+            raise TypeError("Rate book must be a RateBook object.")
+
+        self._rate_book = rate_book if rate_book is not None else RateBook()
+        self._subscriptions: Dict[Hashable, _Subscription] = {}
+        self._plans_by_symbol: Dict[str, Dict[Hashable, None]] = {}
+        self._plans_by_pair: Dict[Tuple[str, str], Dict[Hashable, None]] = {}
+        self._pairs_by_rate_symbol: Dict[str, Set[Tuple[str, str]]] = {}
+        self._latency = LatencyHistogram()
+        self._quotes = 0
+        self._repriced = 0
+        self._deltas = 0
+        self._errors = 0
+
+    def get_rate_book(self) -> RateBook:
+        return self._rate_book
+
+    def subscribe(self, plan_id: Hashable, plan: TradePlan, follow_entry: bool = False) -> Optional[Delta]:
+        if not isinstance(plan, TradePlan):
+            raise TypeError("Plan must be a TradePlan object.")
+
+        if plan_id in self._subscriptions:
+            raise ValueError(f"Plan '{plan_id}' is already subscribed.")
+
+        symbol = plan.symbol if isinstance(plan.symbol, Symbol) else default_registry.get(plan.symbol)
+        calculator = Calculator()
+        calculator.set_symbol(symbol)
+        calculator.set_target_currency(plan.target_currency)
+        pair = (symbol.get_quote_currency(), plan.target_currency)
+        if pair[0] != pair[1]:
+            calculator.set_exchange_rate(self._rate_book)
+        calculator.with_inputs(**plan.get_inputs())
+
+        self._subscriptions[plan_id] = _Subscription(plan, symbol, calculator, follow_entry)
+        if follow_entry:
+            self._plans_by_symbol.setdefault(symbol.get_symbol(), {})[plan_id] = None
+        if pair[0] != pair[1]:
+            if pair not in self._plans_by_pair:
+                self._plans_by_pair[pair] = {}
+                self._index_pair(pair)
+            self._plans_by_pair[pair][plan_id] = None
+
+        return self._reprice(plan_id)
+
+    def unsubscribe(self, plan_id: Hashable) -> None:
+        subscription = self._subscriptions.pop(plan_id, None)
+        if subscription is None:
+            raise ValueError(f"Plan '{plan_id}' is not subscribed.")
+
+        symbol = subscription.symbol
+        plans = self._plans_by_symbol.get(symbol.get_symbol())
+        if plans is not None:
+            plans.pop(plan_id, None)
+
+        pair = (symbol.get_quote_currency(), subscription.plan.target_currency)
+        plans = self._plans_by_pair.get(pair)
+        if plans is not None:
+            plans.pop(plan_id, None)
+            if not plans:
+                del self._plans_by_pair[pair]
+                self._rebuild_rate_index()
+
+    def get_result(self, plan_id: Hashable) -> Optional[Result]:
+        subscription = self._subscriptions.get(plan_id)
+        if subscription is None:
+            raise ValueError(f"Plan '{plan_id}' is not subscribed.")
+
+        return subscription.result
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def _index_pair(self, pair: Tuple[str, str]) -> None:
+        if not self._rate_book.has_path(*pair):
+            return
+
+        for rate_symbol, _, _ in self._rate_book.get_conversion_path(*pair):
+            self._pairs_by_rate_symbol.setdefault(rate_symbol, set()).add(pair)
+
+    def _rebuild_rate_index(self) -> None:
+        self._pairs_by_rate_symbol = {}
+        for pair in self._plans_by_pair:
+            self._index_pair(pair)
+
+    def on_quote(self, quote: Quote) -> List[Delta]:
+        started = time.perf_counter()
+        symbol = normalize_symbol(quote.symbol)
+        bid = to_decimal(quote.bid)
+        ask = bid if quote.ask is None else to_decimal(quote.ask)
+        if bid <= 0 or ask < bid:
+            raise ValueError("Quote must have a positive bid that is not greater than the ask.")
+
+        affected: Dict[Hashable, None] = {}
+        for plan_id in self._plans_by_symbol.get(symbol, ()):
+            subscription = self._subscriptions[plan_id]
+            subscription.calculator.set_entry_price(ask if subscription.plan.is_long else bid)
+            affected[plan_id] = None
+
+        pair = _parse_pair(symbol)
+        if pair is not None and pair[0] != pair[1]:
+            is_new = self._rate_book.get_rate(symbol) is None
+            self._rate_book.set_rate(symbol, (bid + ask) / 2)
+            if is_new:
+                self._rebuild_rate_index()
+            for rate_pair in self._pairs_by_rate_symbol.get(symbol, ()):
+                affected.update(dict.fromkeys(self._plans_by_pair[rate_pair]))
+
+        deltas = [delta for delta in map(self._reprice, affected) if delta is not None]
+        self._quotes += 1
+        self._latency.observe(time.perf_counter() - started)
+        return deltas
+
+    def _reprice(self, plan_id: Hashable) -> Optional[Delta]:
+        subscription = self._subscriptions[plan_id]
+        self._repriced += 1
+        try:
+            subscription.calculator.calculate()
+        except (ValueError, TypeError, ArithmeticError) as error:
+            self._errors += 1
+            self._deltas += 1
+            return Delta(plan_id, None, {}, str(error))
+
+        result = subscription.calculator.get_result_record()
+        changes = _get_changes(subscription.result, result)
+        subscription.result = result
+        if not changes:
+            return None
+
+        self._deltas += 1
+        return Delta(plan_id, result, changes)
+
+    def run(self, source: Iterable[Quote]) -> Iterator[Delta]:
+        for quote in source:
+            yield from self.on_quote(quote)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "plans": len(self._subscriptions),
+            "quotes": self._quotes,
+            "repriced": self._repriced,
+            "deltas": self._deltas,
+            "errors": self._errors,
+            "latency": self._latency.get_snapshot(),
+        }
+
+
+def read_csv_quotes(file: IO[str]) -> Iterator[Quote]:
+    for record in csv.DictReader(file):
+        yield Quote(record["symbol"], record["bid"], record.get("ask") or None, float(record["time"]) if record.get("time") else None)
+
+
+def read_ndjson_quotes(file: IO[str]) -> Iterator[Quote]:
+    for line in file:
+        if line.strip():
+            record = json.loads(line, parse_float=Decimal)
+            yield Quote(record["symbol"], record["bid"], record.get("ask"), record.get("time"))
+
+
+class QueueQuoteSource:
+    def __init__(self, quotes: "queue.Queue[Optional[Quote]]", timeout: Optional[float] = None) -> None:
+        self._quotes = quotes
+        self._timeout = timeout
+
+    def __iter__(self) -> Iterator[Quote]:
+        while True:
+            try:
+                quote = self._quotes.get(timeout=self._timeout)
+            except queue.Empty:
+                return
+
+            if quote is None:
+                return
+            yield quote
@@ -0,0 +1,69 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Iterable, Iterator, List, Optional
+from .registry import default_registry
+
+_worker_processor: Any = None
+
+
+def _initialize_worker(snapshot: bytes) -> None:
+    global _worker_processor
+    snapshot = pickle.loads(snapshot)
+    default_registry.set_spec_store(snapshot["spec_store"])
+    _worker_processor = snapshot["processor"]
+
+
+def _process_chunk(chunk: List[Any]) -> List[Any]:
+    return _worker_processor.process_chunk(chunk)
+
+
+class ParallelExecutor:
+    def __init__(self, processor: Any, workers: Optional[int] = None, max_pending_chunks: Optional[int] = None) -> None:
+        if not callable(getattr(processor, "process_chunk", None)):
+            raise TypeError("Processor must have a process_chunk method.")
+
+        workers = os.cpu_count() or 1 if workers is None else workers
+        if workers <= 0:
+            raise ValueError("Workers must be positive.")
+
+        self._workers = workers
+        self._max_pending_chunks = max_pending_chunks or 2 * workers
+
+        snapshot = pickle.dumps(
+            {"processor": processor, "spec_store": default_registry.get_spec_store()},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        self._pool: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(
+            workers, initializer=_initialize_worker, initargs=(snapshot,),
+        )
+
+    def get_workers(self) -> int:
+        return self._workers
+
+    def map(self, chunks: Iterable[List[Any]]) -> Iterator[List[Any]]:
+        if self._pool is None:
+            raise ValueError("Executor is closed.")
+
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            if len(pending) >= self._max_pending_chunks:
+                yield pending.popleft().result()
+            pending.append(self._pool.submit(_process_chunk, chunk))
+
+        while pending:
+            yield pending.popleft().result()
+
+    def close(self) -> None:
+        if self._pool is None:
+            return
+
+        self._pool.shutdown()
+        self._pool = None
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
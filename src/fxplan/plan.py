@@ -0,0 +1,159 @@
+from dataclasses import dataclass, fields
+from decimal import Context, Decimal, DivisionByZero, InvalidOperation, Overflow, ROUND_HALF_EVEN, localcontext
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Union
+from .calculator import Calculator
+from .rates import RateBook
+from .registry import default_registry
+from .symbol import Symbol
+from .utils import *
+
+DECIMAL_CONTEXT = Context(prec=28, rounding=ROUND_HALF_EVEN, traps=[InvalidOperation, DivisionByZero, Overflow])
+
+_DECIMAL_FIELDS = (
+    "entry_price",
+    "sl_price",
+    "sl_in_pips",
+    "sl_in_points",
+    "tp_price",
+    "tp_in_pips",
+    "tp_in_points",
+    "position_size_in_lots",
+    "sl_in_money",
+    "sl_with_commission_in_money",
+    "commission_per_lot_in_money",
+)
+
+_EXCLUSIVE_FIELDS = (
+    (("sl_price", "sl_in_pips", "sl_in_points"), "Only one of the stop loss price, stop loss in pips or stop loss in points is set."),
+    (("tp_price", "tp_in_pips", "tp_in_points"), "Only one of the take profit price, take profit in pips or take profit in points is set."),
+    (
+        ("position_size_in_lots", "sl_in_money", "sl_with_commission_in_money"),
+        "Only one of the position size in lots, stop loss in money or stop loss with commission in money is set.",
+    ),
+)
+
+Number = Union[Decimal, int, float, str]
+Rates = Union[RateBook, Mapping[str, Number], None]
+
+
+@dataclass(frozen=True)
+class TradePlan:
+    symbol: Union[Symbol, str]
+    is_long: bool
+    entry_price: Number
+    sl_price: Optional[Number] = None
+    sl_in_pips: Optional[Number] = None
+    sl_in_points: Optional[Number] = None
+    tp_price: Optional[Number] = None
+    tp_in_pips: Optional[Number] = None
+    tp_in_points: Optional[Number] = None
+    position_size_in_lots: Optional[Number] = None
+    sl_in_money: Optional[Number] = None
+    sl_with_commission_in_money: Optional[Number] = None
+    commission_per_lot_in_money: Number = 0
+    target_currency: str = "USD"
+
+    def __post_init__(self) -> None:
+        if isinstance(self.symbol, str):
+            object.__setattr__(self, "symbol", normalize_symbol(self.symbol))
+        elif not isinstance(self.symbol, Symbol):
+            raise TypeError("Symbol must be a string or a Symbol object.")
+
+        if not isinstance(self.target_currency, str):
+            raise TypeError("Target currency must be a string.")
+        object.__setattr__(self, "target_currency", parse_currency(self.target_currency))
+
+        for name in _DECIMAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, to_decimal(value))
+
+        for names, message in _EXCLUSIVE_FIELDS:
+            if sum(getattr(self, name) is not None for name in names) > 1:
+                raise ValueError(message)
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, Any]) -> "TradePlan":
+        unknown = set(values) - {field.name for field in fields(cls)}
+        if unknown:
+            raise ValueError(f"Unknown input '{sorted(unknown)[0]}'.")
+
+        return cls(**values)
+
+    def get_inputs(self) -> Dict[str, Any]:
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if field.name not in ("symbol", "target_currency") and getattr(self, field.name) is not None
+        }
+
+
+class PlanResult(NamedTuple):
+    symbol: str
+    base_currency: str
+    quote_currency: str
+    lot_size: Decimal
+    pip_size: Decimal
+    digits: Decimal
+    target_currency: str
+    exchange_rate_symbol: Optional[str]
+    exchange_rate: Optional[Decimal]
+    is_long: bool
+    position_size_in_lots: Decimal
+    entry_price: Decimal
+    sl_price: Decimal
+    tp_price: Decimal
+    commission_per_lot_in_money: Decimal
+    commission_per_lot_in_pips: Decimal
+    commission_in_money: Decimal
+    sl_in_pips: Decimal
+    tp_in_pips: Decimal
+    sl_in_points: Decimal
+    tp_in_points: Decimal
+    sl_in_money: Decimal
+    tp_in_money: Decimal
+    rrr: Decimal
+    sl_with_commission_in_money: Decimal
+    tp_with_commission_in_money: Decimal
+    rrr_with_commission: Decimal
+
+
+def _find_exchange_rate(rates: Mapping[str, Number], quote_currency: str, target_currency: str) -> Optional[Dict[str, Any]]:
+    for symbol, rate in rates.items():
+        if set(parse_symbol(symbol)) == {quote_currency, target_currency}:
+            return {"symbol": symbol, "rate": rate}
+
+    return None
+
+
+def _set_rates(calc: Calculator, rates: Rates, quote_currency: str, target_currency: str) -> None:
+    if rates is None:
+        return
+
+    if isinstance(rates, RateBook):
+        calc.set_exchange_rate(rates)
+        return
+
+    if not isinstance(rates, dict):
+        raise TypeError("Rates must be a dictionary or a RateBook object.")
+
+    if quote_currency == target_currency:
+        return
+
+    exchange_rate = _find_exchange_rate(rates, quote_currency, target_currency)
+    calc.set_exchange_rate(exchange_rate if exchange_rate is not None else RateBook(dict(rates)))
+
+
+def compute(plan: TradePlan, rates: Rates = None) -> PlanResult:
+    if not isinstance(plan, TradePlan):
+        raise TypeError("Plan must be a TradePlan object.")
+
+    with localcontext(DECIMAL_CONTEXT):
+        symbol = plan.symbol if isinstance(plan.symbol, Symbol) else default_registry.get(plan.symbol)
+        calc = Calculator()
+        calc.set_symbol(symbol)
+        calc.set_target_currency(plan.target_currency)
+        _set_rates(calc, rates, symbol.get_quote_currency(), plan.target_currency)
+        calc.with_inputs(**plan.get_inputs())
+        calc.calculate()
+        return PlanResult(*calc.get_result_record().get_values())
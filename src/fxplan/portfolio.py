@@ -0,0 +1,234 @@
+from decimal import Decimal, localcontext
+from typing import Dict, Hashable, Mapping, NamedTuple, Optional, Set, Tuple, Union
+from .plan import DECIMAL_CONTEXT, PlanResult, TradePlan, compute
+from .rates import RateBook
+from .result import Result
+from .utils import *
+
+Number = Union[Decimal, int, float, str]
+Amounts = Tuple[Tuple[str, Decimal], ...]
+
+
+class _Position(NamedTuple):
+    result: PlanResult
+    exposure: Amounts
+    risk: Amounts
+
+
+def _get_position(result: PlanResult) -> _Position:
+    units = result.position_size_in_lots * result.lot_size
+    signed_units = units if result.is_long else -units
+    return _Position(
+        result,
+        ((result.base_currency, signed_units), (result.quote_currency, -signed_units * result.entry_price)),
+        ((result.quote_currency, abs(result.entry_price - result.sl_price) * units), (result.target_currency, result.commission_in_money)),
+    )
+
+
+def _add_amounts(totals: Dict[str, Decimal], amounts: Amounts, sign: int) -> None:
+    for currency, amount in amounts:
+        totals[currency] = totals.get(currency, Decimal(0)) + sign * amount
+
+
+class Portfolio:
+    def __init__(self, rates: Union[RateBook, Mapping[str, Number], None] = None, reporting_currency: str = "USD") -> None:
+        if rates is None:
+            rates = RateBook()
+        elif not isinstance(rates, RateBook):
+            if not isinstance(rates, dict):
+                raise TypeError("Rates must be a dictionary or a RateBook object.")
+            rates = RateBook(dict(rates))
+
+        if not isinstance(reporting_currency, str):
+            raise TypeError("Reporting currency must be a string.")
+
+        self._rate_book = rates
+        self._reporting_currency = parse_currency(reporting_currency)
+        self._positions: Dict[Hashable, _Position] = {}
+        self._exposure: Dict[str, Decimal] = {}
+        self._risk: Dict[str, Decimal] = {}
+        self._risk_by_symbol: Dict[str, Dict[str, Decimal]] = {}
+        self._plans_by_currency: Dict[str, int] = {}
+        self._plans_by_symbol: Dict[str, int] = {}
+        self._factors: Dict[str, Decimal] = {}
+        self._currencies_by_rate_symbol: Dict[str, Set[str]] = {}
+        self._rate_version = self._rate_book.get_version()
+
+    def get_rate_book(self) -> RateBook:
+        return self._rate_book
+
+    def get_reporting_currency(self) -> str:
+        return self._reporting_currency
+
+    def add(self, plan_id: Hashable, plan: Union[TradePlan, PlanResult, Result]) -> PlanResult:
+        if plan_id in self._positions:
+            raise ValueError(f"Plan '{plan_id}' is already in the portfolio.")
+
+        position = self._get_position(plan)
+        self._apply(position, 1)
+        self._positions[plan_id] = position
+        return position.result
+
+    def update(self, plan_id: Hashable, plan: Union[TradePlan, PlanResult, Result]) -> PlanResult:
+        previous = self._positions.get(plan_id)
+        if previous is None:
+            raise ValueError(f"Plan '{plan_id}' is not in the portfolio.")
+
+        position = self._get_position(plan)
+        self._apply(position, 1)
+        self._apply(previous, -1)
+        self._positions[plan_id] = position
+        return position.result
+
+    def remove(self, plan_id: Hashable) -> None:
+        position = self._positions.pop(plan_id, None)
+        if position is None:
+            raise ValueError(f"Plan '{plan_id}' is not in the portfolio.")
+
+        self._apply(position, -1)
+
+    def get_result(self, plan_id: Hashable) -> PlanResult:
+        position = self._positions.get(plan_id)
+        if position is None:
+            raise ValueError(f"Plan '{plan_id}' is not in the portfolio.")
+
+        return position.result
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _get_position(self, plan: Union[TradePlan, PlanResult, Result]) -> _Position:
+        if isinstance(plan, TradePlan):
+            result = compute(plan, self._rate_book)
+        elif isinstance(plan, PlanResult):
+            result = plan
+        elif isinstance(plan, Result):
+            result = PlanResult(*plan.get_values())
+        else:
+            raise TypeError("Plan must be a TradePlan, PlanResult or Result object.")
+
+        with localcontext(DECIMAL_CONTEXT):
+            position = _get_position(result)
+
+        self._sync_rates()
+        currencies = [currency for currency, _ in position.exposure + position.risk if currency not in self._factors]
+        try:
+            for currency in currencies:
+                self._index_currency(currency)
+        except ValueError:
+            for currency in currencies:
+                self._factors.pop(currency, None)
+            raise
+        return position
+
+    def _apply(self, position: _Position, sign: int) -> None:
+        symbol = position.result.symbol
+        with localcontext(DECIMAL_CONTEXT):
+            _add_amounts(self._exposure, position.exposure, sign)
+            _add_amounts(self._risk, position.risk, sign)
+            _add_amounts(self._risk_by_symbol.setdefault(symbol, {}), position.risk, sign)
+
+        self._plans_by_symbol[symbol] = self._plans_by_symbol.get(symbol, 0) + sign
+        if not self._plans_by_symbol[symbol]:
+            del self._plans_by_symbol[symbol]
+            del self._risk_by_symbol[symbol]
+
+        for currency in {currency for currency, _ in position.exposure + position.risk}:
+            self._plans_by_currency[currency] = self._plans_by_currency.get(currency, 0) + sign
+            if not self._plans_by_currency[currency]:
+                del self._plans_by_currency[currency]
+                self._exposure.pop(currency, None)
+                self._risk.pop(currency, None)
+                self._factors.pop(currency, None)
+
+    def _index_currency(self, currency: str) -> None:
+        if currency == self._reporting_currency:
+            self._factors[currency] = Decimal(1)
+            return
+
+        if not self._rate_book.has_path(currency, self._reporting_currency):
+            raise ValueError(f"Exchange rate of '{currency}{self._reporting_currency}' or '{self._reporting_currency}{currency}' is required.")
+
+        self._factors[currency] = self._rate_book.get_factor(currency, self._reporting_currency)
+        for rate_symbol, _, _ in self._rate_book.get_conversion_path(currency, self._reporting_currency):
+            self._currencies_by_rate_symbol.setdefault(rate_symbol, set()).add(currency)
+
+    def _reindex(self) -> None:
+        self._factors = {}
+        self._currencies_by_rate_symbol = {}
+        for currency in self._plans_by_currency:
+            self._index_currency(currency)
+        self._rate_version = self._rate_book.get_version()
+
+    def _sync_rates(self) -> None:
+        if self._rate_version != self._rate_book.get_version():
+            self._reindex()
+
+    def set_rate(self, symbol: str, rate: Number) -> None:
+        base, quote = parse_symbol(symbol)
+        rate_symbol = f"{base}{quote}"
+        is_new = self._rate_book.get_rate(rate_symbol) is None
+        is_synced = self._rate_version == self._rate_book.get_version()
+        self._rate_book.set_rate(rate_symbol, rate)
+
+        if is_new or not is_synced:
+            self._reindex()
+            return
+
+        for currency in self._currencies_by_rate_symbol.get(rate_symbol, ()):
+            if currency in self._factors:
+                self._factors[currency] = self._rate_book.get_factor(currency, self._reporting_currency)
+        self._rate_version = self._rate_book.get_version()
+
+    def _to_reporting(self, amounts: Mapping[str, Decimal]) -> Decimal:
+        self._sync_rates()
+        with localcontext(DECIMAL_CONTEXT):
+            total = sum((amount * self._factors[currency] for currency, amount in amounts.items()), Decimal(0))
+            return total.quantize(MONEY_PRECISION)
+
+    def get_exposure(self) -> Dict[str, Decimal]:
+        with localcontext(DECIMAL_CONTEXT):
+            return {currency: amount.quantize(MONEY_PRECISION) for currency, amount in self._exposure.items()}
+
+    def get_exposure_in_reporting_currency(self) -> Dict[str, Decimal]:
+        return {currency: self._to_reporting({currency: amount}) for currency, amount in self._exposure.items()}
+
+    def get_risk_by_symbol(self) -> Dict[str, Decimal]:
+        return {symbol: self._to_reporting(risk) for symbol, risk in self._risk_by_symbol.items()}
+
+    def get_total_risk(self) -> Decimal:
+        return self._to_reporting(self._risk)
+
+    def get_snapshot(self) -> Dict[str, object]:
+        return {
+            "plans": len(self._positions),
+            "reporting_currency": self._reporting_currency,
+            "exposure": self.get_exposure(),
+            "exposure_in_reporting_currency": self.get_exposure_in_reporting_currency(),
+            "risk_by_symbol": self.get_risk_by_symbol(),
+            "total_risk": self.get_total_risk(),
+        }
+
+    def recalculate(self, plans: Optional[Mapping[Hashable, Union[TradePlan, PlanResult, Result]]] = None) -> "Portfolio":
+        portfolio = Portfolio(self._rate_book, self._reporting_currency)
+        if plans is None:
+            plans = {plan_id: position.result for plan_id, position in self._positions.items()}
+
+        for plan_id, plan in plans.items():
+            portfolio.add(plan_id, plan)
+        return portfolio
+
+    def verify(self) -> bool:
+        self._sync_rates()
+        portfolio = self.recalculate()
+        return (
+            _without_zeros(portfolio._exposure) == _without_zeros(self._exposure)
+            and _without_zeros(portfolio._risk) == _without_zeros(self._risk)
+            and {symbol: _without_zeros(risk) for symbol, risk in portfolio._risk_by_symbol.items()}
+            == {symbol: _without_zeros(risk) for symbol, risk in self._risk_by_symbol.items()}
+            and portfolio._factors == self._factors
+        )
+
+
+def _without_zeros(amounts: Mapping[str, Decimal]) -> Dict[str, Decimal]:
+    return {currency: amount for currency, amount in amounts.items() if amount}
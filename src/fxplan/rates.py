@@ -0,0 +1,108 @@
+from decimal import Decimal
+from typing import Dict, Optional, Tuple, Union
+from .converter import CurrencyConverter
+from .utils import *
+
+ConversionStep = Tuple[str, Decimal, bool]
+
+
+class RateBook:
+    def __init__(self, rates: Optional[Dict[str, Union[Decimal, int, float, str]]] = None, pivot_currency: str = "USD") -> None:
+        self._pivot_currency: str = parse_currency(pivot_currency)
+        self._rates: Dict[Tuple[str, str], Decimal] = {}
+        self._paths: Dict[Tuple[str, str], Tuple[Tuple[Tuple[str, str], bool], ...]] = {}
+        self._converters: Dict[Tuple[str, str], CurrencyConverter] = {}
+        self._version: int = 0
+
+        if rates is not None:
+            self.update(rates)
+
+    def get_pivot_currency(self) -> str:
+        return self._pivot_currency
+
+    def get_version(self) -> int:
+        return self._version
+
+    def set_rate(self, symbol: str, rate: Union[Decimal, int, float, str]) -> None:
+        self.update({symbol: rate})
+
+    def update(self, rates: Dict[str, Union[Decimal, int, float, str]]) -> None:
+        if not isinstance(rates, dict):
+            raise TypeError("Rates must be a dictionary.")
+
+        parsed = {}
+        for symbol, rate in rates.items():
+            base, quote = parse_symbol(symbol)
+            rate = to_decimal(rate)
+
+            if base == quote:
+                raise ValueError("Exchange symbol must contain different base and quote currencies.")
+
+            if rate <= 0:
+                raise ValueError(f"Exchange rate of '{base}{quote}' must be positive.")
+
+            parsed[(base, quote)] = rate
+
+        if any(pair not in self._rates for pair in parsed):
+            self._paths.clear()
+
+        self._rates.update(parsed)
+        self._converters.clear()
+        self._version += 1
+
+    def get_rate(self, symbol: str) -> Optional[Decimal]:
+        return self._rates.get(parse_symbol(symbol))
+
+    def get_conversion_path(self, source_currency: str, target_currency: str) -> Tuple[ConversionStep, ...]:
+        return tuple(
+            (f"{pair[0]}{pair[1]}", self._rates[pair], multiply)
+            for pair, multiply in self._resolve_path(source_currency, target_currency)
+        )
+
+    def _resolve_path(self, source_currency: str, target_currency: str) -> Tuple[Tuple[Tuple[str, str], bool], ...]:
+        key = (source_currency, target_currency)
+        path = self._paths.get(key)
+        if path is not None:
+            return path
+
+        path = self._find_direct_path(source_currency, target_currency)
+        if path is None:
+            first = self._find_direct_path(source_currency, self._pivot_currency)
+            second = self._find_direct_path(self._pivot_currency, target_currency)
+            if first is None or second is None:
+                raise ValueError(f"Exchange rate of '{source_currency}{target_currency}' or '{target_currency}{source_currency}' is required.")
+            path = first + second
+
+        self._paths[key] = path
+        return path
+
+    def _find_direct_path(self, source_currency: str, target_currency: str) -> Optional[Tuple[Tuple[Tuple[str, str], bool], ...]]:
+        if source_currency == target_currency:
+            return ()
+        if (source_currency, target_currency) in self._rates:
+            return (((source_currency, target_currency), True),)
+        if (target_currency, source_currency) in self._rates:
+            return (((target_currency, source_currency), False),)
+        return None
+
+    def has_path(self, source_currency: str, target_currency: str) -> bool:
+        try:
+            self._resolve_path(source_currency, target_currency)
+        except ValueError:
+            return False
+        return True
+
+    def get_converter(self, source_currency: str, target_currency: str) -> CurrencyConverter:
+        key = (source_currency, target_currency)
+        converter = self._converters.get(key)
+        if converter is None:
+            steps = ((self._rates[pair], multiply) for pair, multiply in self._resolve_path(source_currency, target_currency))
+            converter = CurrencyConverter(source_currency, target_currency, steps)
+            self._converters[key] = converter
+        return converter
+
+    def get_factor(self, source_currency: str, target_currency: str) -> Decimal:
+        return self.get_converter(source_currency, target_currency).get_factor()
+
+    def convert(self, amount: Decimal, source_currency: str, target_currency: str) -> Decimal:
+        return self.get_converter(source_currency, target_currency).convert(amount)
@@ -0,0 +1,48 @@
+from typing import Dict, Optional
+from .symbol import Symbol
+from .specs import ContractSpecStore
+from .utils import *
+
+
+class SymbolRegistry:
+    def __init__(self, spec_store: Optional[ContractSpecStore] = None) -> None:
+        self._symbols: Dict[str, Symbol] = {}
+        self._spec_store: Optional[ContractSpecStore] = spec_store
+
+    def set_spec_store(self, spec_store: Optional[ContractSpecStore]) -> None:
+        if spec_store is not None and not isinstance(spec_store, ContractSpecStore):
+            raise TypeError("Spec store must be a ContractSpecStore object.")
+
+        self._spec_store = spec_store
+        self.clear()
+
+    def get_spec_store(self) -> Optional[ContractSpecStore]:
+        return self._spec_store
+
+    def get(self, symbol: str) -> Symbol:
+        name = normalize_symbol(symbol)
+        spec = self._symbols.get(name)
+        if spec is None:
+            spec = self._create_symbol(name)
+            spec.freeze()
+            spec = self._symbols.setdefault(name, spec)
+
+        return spec
+
+    def _create_symbol(self, name: str) -> Symbol:
+        if self._spec_store is not None and name in self._spec_store:
+            return self._spec_store.create_symbol(name)
+
+        return Symbol(name)
+
+    def clear(self) -> None:
+        self._symbols.clear()
+
+    def __contains__(self, symbol: str) -> bool:
+        return normalize_symbol(symbol) in self._symbols
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+default_registry = SymbolRegistry()
@@ -1,67 +1,307 @@
-import json
+import operator
+from array import array
 from decimal import Decimal
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .serialization import dumps
+
+RESULT_FIELDS = (
+    "symbol",
+    "base_currency",
+    "quote_currency",
+    "lot_size",
+    "pip_size",
+    "digits",
+    "target_currency",
+    "exchange_rate_symbol",
+    "exchange_rate",
+    "is_long",
+    "position_size_in_lots",
+    "entry_price",
+    "sl_price",
+    "tp_price",
+    "commission_per_lot_in_money",
+    "commission_per_lot_in_pips",
+    "commission_in_money",
+    "sl_in_pips",
+    "tp_in_pips",
+    "sl_in_points",
+    "tp_in_points",
+    "sl_in_money",
+    "tp_in_money",
+    "rrr",
+    "sl_with_commission_in_money",
+    "tp_with_commission_in_money",
+    "rrr_with_commission",
+)
+
+CALCULATOR_STATE_FIELDS = (
+    "_symbol",
+    "_symbol_name",
+    "_target_currency",
+    "_exchange_rate",
+    "_is_long",
+    "_position_size_in_lots",
+    "_entry_price",
+    "_sl_price",
+    "_tp_price",
+    "_commission_per_lot_in_money",
+    "_commission_per_lot_in_pips",
+    "_commission_in_money",
+    "_sl_in_pips",
+    "_tp_in_pips",
+    "_sl_in_points",
+    "_tp_in_points",
+    "_sl_in_money",
+    "_tp_in_money",
+    "_rrr",
+    "_sl_with_commission_in_money",
+    "_tp_with_commission_in_money",
+    "_rrr_with_commission",
+)
+
+_get_calculator_state = operator.attrgetter(*CALCULATOR_STATE_FIELDS)
+
+NUMBER_CONVERTERS: Dict[str, Callable[[Decimal], Any]] = {"string": str, "float": float}
+
+
+class ReadOnlyDict(dict):
+    def _raise_read_only_error(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Result is read-only.")
+
+    __setitem__ = __delitem__ = __ior__ = _raise_read_only_error
+    clear = pop = popitem = setdefault = update = _raise_read_only_error
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, Any]]]:
+        return self.__class__, (dict(self),)
+
+    def __copy__(self) -> "ReadOnlyDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ReadOnlyDict":
+        return self
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: dict(value) if isinstance(value, dict) else value for name, value in result.items()}
 
 
 class Result:
-    def __init__(self) -> None:
-        self._result: Dict[str, Any] = {}
-
-    def _set_result(self) -> None:
-        self._result = {
-            "symbol": self._symbol.get_symbol(),
-            "base_currency": self._symbol.get_base_currency(),
-            "quote_currency": self._symbol.get_quote_currency(),
-            "lot_size": self._symbol.get_lot_size(),
-            "pip_size": self._symbol.get_pip_size(),
-            "digits": self._symbol.get_digits(),
-            "target_currency": self._target_currency,
-            "exchange_rate": {
-                "symbol": self._exchange_rate["symbol"],
-                "rate": self._exchange_rate["rate"],
-            },
-            "is_long": self._is_long,
-            "position_size_in_lots": self._position_size_in_lots,
-            "entry_price": self._entry_price,
-            "sl_price": self._sl_price,
-            "tp_price": self._tp_price,
-            "commission_per_lot_in_money": self._commission_per_lot_in_money,
-            "commission_per_lot_in_pips": self._commission_per_lot_in_pips,
-            "commission_in_money": self._commission_in_money,
-            "rr_in_pips": {
-                "sl_in_pips": self._sl_in_pips,
-                "tp_in_pips": self._tp_in_pips,
-            },
-            "rr_in_points": {
-                "sl_in_points": self._sl_in_points,
-                "tp_in_points": self._tp_in_points,
-            },
-            "rr_in_money": {
-                "sl_in_money": self._sl_in_money,
-                "tp_in_money": self._tp_in_money,
-            },
-            "rrr": self._rrr,
-            "rr_with_commission_in_money": {
-                "sl_with_commission_in_money": self._sl_with_commission_in_money,
-                "tp_with_commission_in_money": self._tp_with_commission_in_money,
-            },
-            "rrr_with_commission": self._rrr_with_commission,
-        }
+    __slots__ = ("_state", "_result", "_is_shared")
+
+    def __init__(self, state: Optional[Tuple[Any, ...]] = None) -> None:
+        self._state: Optional[Tuple[Any, ...]] = state
+        self._result: Optional[Dict[str, Any]] = None
+        self._is_shared: bool = False
+
+    @classmethod
+    def from_calculator(cls, calculator: Any) -> "Result":
+        return cls(_get_calculator_state(calculator))
+
+    def restore_calculator(self, calculator: Any) -> None:
+        for field, value in zip(CALCULATOR_STATE_FIELDS, self._get_state()):
+            setattr(calculator, field, value)
+
+    def _get_state(self) -> Tuple[Any, ...]:
+        if self._state is None:
+            raise AttributeError("Result is not calculated yet.")
+
+        return self._state
+
+    def get_values(self) -> Tuple[Any, ...]:
+        symbol, symbol_name, target_currency, exchange_rate, *values = self._get_state()
+        return (
+            symbol_name,
+            symbol.get_base_currency(),
+            symbol.get_quote_currency(),
+            symbol.get_lot_size(),
+            symbol.get_pip_size(),
+            symbol.get_digits(),
+            target_currency,
+            exchange_rate["symbol"],
+            exchange_rate["rate"],
+            *values,
+        )
+
+    def share(self) -> None:
+        if not self._is_shared:
+            self._is_shared = True
+            self._result = None
+
+    def is_shared(self) -> bool:
+        return self._is_shared
 
     def get_result(self) -> Dict[str, Any]:
-        if not self._result:
-            self._set_result()
+        if not self._is_shared:
+            if self._result is None:
+                self._result = self._build_result()
+            return self._result
 
-        return self._result
+        if self._result is None:
+            self._result = self._build_result(mapping=ReadOnlyDict)
+        return _copy_result(self._result)
 
-    def get_result_as_json(self, convert_numbers_to: str = "string") -> str:
-        if convert_numbers_to not in ["string", "float"]:
+    def get_serializable_result(self, convert_numbers_to: str = "string") -> Dict[str, Any]:
+        if convert_numbers_to not in NUMBER_CONVERTERS:
             raise ValueError("Numbers can be converted to 'string' or 'float' only.")
 
-        if not self._result:
-            self._set_result()
+        return self._build_result(NUMBER_CONVERTERS[convert_numbers_to])
+
+    def _build_result(self, convert: Optional[Callable[[Decimal], Any]] = None, mapping: type = dict) -> Dict[str, Any]:
+        symbol, symbol_name, target_currency, exchange_rate, is_long, *numbers = self._get_state()
+        lot_size, pip_size, digits, rate = symbol.get_lot_size(), symbol.get_pip_size(), symbol.get_digits(), exchange_rate["rate"]
+        if convert is not None:
+            lot_size, pip_size, digits = convert(lot_size), convert(pip_size), convert(digits)
+            rate = None if rate is None else convert(rate)
+            numbers = [None if number is None else convert(number) for number in numbers]
+
+        (
+            position_size_in_lots, entry_price, sl_price, tp_price, commission_per_lot_in_money, commission_per_lot_in_pips,
+            commission_in_money, sl_in_pips, tp_in_pips, sl_in_points, tp_in_points, sl_in_money, tp_in_money, rrr,
+            sl_with_commission_in_money, tp_with_commission_in_money, rrr_with_commission,
+        ) = numbers
+
+        return mapping({
+            "symbol": symbol_name,
+            "base_currency": symbol.get_base_currency(),
+            "quote_currency": symbol.get_quote_currency(),
+            "lot_size": lot_size,
+            "pip_size": pip_size,
+            "digits": digits,
+            "target_currency": target_currency,
+            "exchange_rate": mapping({
+                "symbol": exchange_rate["symbol"],
+                "rate": rate,
+            }),
+            "is_long": is_long,
+            "position_size_in_lots": position_size_in_lots,
+            "entry_price": entry_price,
+            "sl_price": sl_price,
+            "tp_price": tp_price,
+            "commission_per_lot_in_money": commission_per_lot_in_money,
+            "commission_per_lot_in_pips": commission_per_lot_in_pips,
+            "commission_in_money": commission_in_money,
+            "rr_in_pips": mapping({
+                "sl_in_pips": sl_in_pips,
+                "tp_in_pips": tp_in_pips,
+            }),
+            "rr_in_points": mapping({
+                "sl_in_points": sl_in_points,
+                "tp_in_points": tp_in_points,
+            }),
+            "rr_in_money": mapping({
+                "sl_in_money": sl_in_money,
+                "tp_in_money": tp_in_money,
+            }),
+            "rrr": rrr,
+            "rr_with_commission_in_money": mapping({
+                "sl_with_commission_in_money": sl_with_commission_in_money,
+                "tp_with_commission_in_money": tp_with_commission_in_money,
+            }),
+            "rrr_with_commission": rrr_with_commission,
+        })
+
+    def get_result_as_json(self, convert_numbers_to: str = "string", indent: Optional[int] = 4) -> str:
+        return dumps(self.get_serializable_result(convert_numbers_to), indent)
+
+
+_NUMBER_FIELDS = ("exchange_rate", *RESULT_FIELDS[10:])
+_NUMBER_WIDTH = 18
+_NO_NUMBER = -128
+
+
+class ResultStore:
+    __slots__ = ("_objects", "_object_indexes", "_references", "_is_long", "_coefficients", "_exponents", "_overflow")
+
+    def __init__(self, results: Iterable[Result] = ()) -> None:
+        self._objects: List[Any] = []
+        self._object_indexes: Dict[Any, int] = {}
+        self._references = array("I")
+        self._is_long = array("b")
+        self._coefficients = array("q")
+        self._exponents = array("b")
+        self._overflow: Dict[int, Decimal] = {}
+        self.extend(results)
+
+    def __len__(self) -> int:
+        return len(self._is_long)
+
+    def __iter__(self) -> Iterator[Result]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> Result:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Result index is out of range.")
+
+        start = index * 4
+        symbol, symbol_name, target_currency, exchange_rate_symbol = (self._objects[i] for i in self._references[start:start + 4])
+        exchange_rate, *values = self._get_numbers(index)
+        return Result((
+            symbol,
+            symbol_name,
+            target_currency,
+            {"symbol": exchange_rate_symbol, "rate": exchange_rate},
+            bool(self._is_long[index]),
+            *values,
+        ))
+
+    def append(self, result: Result) -> None:
+        if not isinstance(result, Result):
+            raise TypeError("Result must be a Result object.")
+
+        symbol, symbol_name, target_currency, exchange_rate, is_long, *values = result._get_state()
+        position = len(self._exponents)
+        self._references.extend(map(self._get_object_index, (symbol, symbol_name, target_currency, exchange_rate["symbol"])))
+        self._is_long.append(is_long)
+        for offset, value in enumerate((exchange_rate["rate"], *values)):
+            self._append_number(position + offset, value)
+
+    def extend(self, results: Iterable[Result]) -> None:
+        for result in results:
+            self.append(result)
+
+    def get_column(self, field: str) -> List[Any]:
+        if field not in RESULT_FIELDS:
+            raise ValueError(f"Field '{field}' is not a result field.")
+
+        if field in _NUMBER_FIELDS:
+            offset = _NUMBER_FIELDS.index(field)
+            return [self._get_number(row * _NUMBER_WIDTH + offset) for row in range(len(self))]
+
+        return [result.get_values()[RESULT_FIELDS.index(field)] for result in self]
+
+    def _get_object_index(self, value: Any) -> int:
+        index = self._object_indexes.get(value)
+        if index is None:
+            index = self._object_indexes[value] = len(self._objects)
+            self._objects.append(value)
+
+        return index
+
+    def _append_number(self, position: int, value: Optional[Decimal]) -> None:
+        if value is None:
+            self._coefficients.append(0)
+            self._exponents.append(_NO_NUMBER)
+            return
+
+        sign, digits, exponent = value.as_tuple() if value.is_finite() else (1, (), 0)
+        if len(digits) <= 18 and _NO_NUMBER < exponent <= 127 and not (sign and value.is_zero()):
+            self._coefficients.append(int(value.scaleb(-exponent)))
+            self._exponents.append(exponent)
+        else:
+            self._coefficients.append(0)
+            self._exponents.append(_NO_NUMBER)
+            self._overflow[position] = value
+
+    def _get_number(self, position: int) -> Optional[Decimal]:
+        exponent = self._exponents[position]
+        if exponent == _NO_NUMBER:
+            return self._overflow.get(position)
+
+        return Decimal(self._coefficients[position]).scaleb(exponent)
 
-        if convert_numbers_to == "string":
-            return json.dumps(self._result, indent=4, default=lambda x: str(x) if isinstance(x, Decimal) else x)
-        elif convert_numbers_to == "float":
-            return json.dumps(self._result, indent=4, default=lambda x: float(x) if isinstance(x, Decimal) else x)
+    def _get_numbers(self, index: int) -> List[Optional[Decimal]]:
+        start = index * _NUMBER_WIDTH
+        return [self._get_number(position) for position in range(start, start + _NUMBER_WIDTH)]
@@ -0,0 +1,113 @@
+import io
+import json
+from typing import IO, Any, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKENDS = ("json", "orjson")
+COMPACT_SEPARATORS = (",", ":")
+
+_backend = "orjson" if orjson is not None else "json"
+
+
+def get_json_backend() -> str:
+    return _backend
+
+
+def set_json_backend(backend: str) -> None:
+    global _backend
+
+    if backend not in JSON_BACKENDS:
+        raise ValueError("JSON backend can be 'json' or 'orjson' only.")
+
+    if backend == "orjson" and orjson is None:
+        raise ValueError("JSON backend 'orjson' is not installed.")
+
+    _backend = backend
+
+
+def dumps_bytes(obj: Any, indent: Optional[int] = None) -> bytes:
+    if indent is None and _backend == "orjson":
+        return orjson.dumps(obj)
+
+    return dumps(obj, indent).encode("utf-8")
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    if indent is None:
+        if _backend == "orjson":
+            return orjson.dumps(obj).decode("utf-8")
+        return json.dumps(obj, separators=COMPACT_SEPARATORS)
+
+    return json.dumps(obj, indent=indent)
+
+
+def _is_binary(file: Union[IO[str], IO[bytes]]) -> bool:
+    return isinstance(file, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(file, "mode", "")
+
+
+class ResultWriter:
+    def __init__(self, file: Union[IO[str], IO[bytes]], convert_numbers_to: str = "string", array: bool = False) -> None:
+        from .result import NUMBER_CONVERTERS
+
+        if convert_numbers_to not in NUMBER_CONVERTERS:
+            raise ValueError("Numbers can be converted to 'string' or 'float' only.")
+
+        self._file = file
+        self._convert_numbers_to = convert_numbers_to
+        self._array = array
+        self._binary = _is_binary(file)
+        self._count = 0
+        self._closed = False
+
+    def get_count(self) -> int:
+        return self._count
+
+    def _write(self, text: str) -> None:
+        self._file.write(text.encode("utf-8") if self._binary else text)
+
+    def write(self, result: Any) -> None:
+        from .result import Result
+
+        if self._closed:
+            raise ValueError("Writer is closed.")
+
+        if not isinstance(result, Result):
+            raise TypeError("Result must be a Result object.")
+
+        if self._array:
+            self._write("[" if self._count == 0 else ",")
+
+        record = result.get_serializable_result(self._convert_numbers_to)
+        if self._binary:
+            self._file.write(dumps_bytes(record))
+        else:
+            self._file.write(dumps(record))
+
+        if not self._array:
+            self._write("\n")
+        self._count += 1
+
+    def write_many(self, results: Iterable[Any]) -> int:
+        count = self._count
+        for result in results:
+            self.write(result)
+
+        return self._count - count
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        if self._array:
+            self._write("[]" if self._count == 0 else "]")
+        self._closed = True
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,403 @@
+import asyncio
+import json
+import os
+import socket
+import stat
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from .cli import Output, Plan, PlanProcessor
+from .instrumentation import LatencyHistogram
+from .serialization import dumps_bytes
+
+DEFAULT_BATCH_WINDOW = 0.001
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_PENDING = 4096
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class ServerBusyError(Exception):
+    pass
+
+
+def _to_output(output: Output) -> Dict[str, Any]:
+    _, result, error = output
+    return {"error": error} if result is None else {"result": result.get_serializable_result()}
+
+
+def _load_json(body: bytes) -> Any:
+    try:
+        return json.loads(body, parse_float=Decimal)
+    except ValueError:
+        raise ValueError("Body is not valid JSON.")
+
+
+def parse_plans(body: bytes) -> Tuple[List[Plan], bool]:
+    return _get_plans(_load_json(body))
+
+
+def _get_plans(document: Any) -> Tuple[List[Plan], bool]:
+    is_many = isinstance(document, list)
+    plans = []
+    for plan in document if is_many else [document]:
+        if isinstance(plan, dict):
+            plans.append({name: value for name, value in plan.items() if value is not None})
+        else:
+            plans.append(TypeError("Plan must be a JSON object."))
+
+    return plans, is_many
+
+
+class _Request:
+    __slots__ = ("plans", "future")
+
+    def __init__(self, plans: List[Plan], future: "asyncio.Future[List[Output]]") -> None:
+        self.plans = plans
+        self.future = future
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        processor: PlanProcessor,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        if batch_window < 0:
+            raise ValueError("Batch window must be non-negative.")
+
+        if max_batch_size <= 0:
+            raise ValueError("Max batch size must be positive.")
+
+        if max_pending <= 0:
+            raise ValueError("Max pending must be positive.")
+
+        self._processor = processor
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._max_pending = max_pending
+        self._requests: List[_Request] = []
+        self._pending = 0
+        self._ready: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._batches = 0
+        self._plans = 0
+        self._rejected = 0
+        self._failed_batches = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._ready = asyncio.Event()
+            self._full = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for request in self._requests:
+            request.future.cancel()
+        self._requests = []
+        self._pending = 0
+
+    async def submit(self, plans: List[Plan]) -> List[Output]:
+        if self._task is None:
+            raise RuntimeError("Batcher is not started.")
+
+        if not plans:
+            return []
+
+        if self._pending + len(plans) > self._max_pending:
+            self._rejected += 1
+            raise ServerBusyError("Server is busy.")
+
+        request = _Request(plans, asyncio.get_running_loop().create_future())
+        self._requests.append(request)
+        self._pending += len(plans)
+        self._ready.set()
+        if self._pending >= self._max_batch_size:
+            self._full.set()
+        return await request.future
+
+    async def _run(self) -> None:
+        while True:
+            await self._ready.wait()
+            if self._pending < self._max_batch_size and self._batch_window:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self._batch_window)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = [request for request in self._take_batch() if not request.future.done()]
+            try:
+                self._process_batch(batch)
+            except Exception as error:
+                self._failed_batches += 1
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(error)
+
+    def _take_batch(self) -> List[_Request]:
+        size = count = 0
+        for request in self._requests:
+            if size and size + len(request.plans) > self._max_batch_size:
+                break
+            size += len(request.plans)
+            count += 1
+
+        batch, self._requests = self._requests[:count], self._requests[count:]
+        self._pending -= size
+        if not self._requests:
+            self._ready.clear()
+        if self._pending < self._max_batch_size:
+            self._full.clear()
+        return batch
+
+    def _process_batch(self, batch: List[_Request]) -> None:
+        plans = [plan for request in batch for plan in request.plans]
+        if not plans:
+            return
+
+        outputs = self._processor.process_chunk(enumerate(plans, 1))
+        self._batches += 1
+        self._plans += len(plans)
+
+        start = 0
+        for request in batch:
+            end = start + len(request.plans)
+            request.future.set_result(outputs[start:end])
+            start = end
+
+    def get_processor(self) -> PlanProcessor:
+        return self._processor
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self._batches,
+            "plans": self._plans,
+            "mean_batch_size": self._plans / self._batches if self._batches else 0.0,
+            "pending": self._pending,
+            "rejected": self._rejected,
+            "failed_batches": self._failed_batches,
+        }
+
+
+class PricingServer:
+    def __init__(
+        self,
+        processor: Optional[PlanProcessor] = None,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ) -> None:
+        self._batcher = MicroBatcher(processor if processor is not None else PlanProcessor(), batch_window, max_batch_size, max_pending)
+        self._max_body_size = max_body_size
+        self._latency = LatencyHistogram()
+        self._requests = 0
+        self._servers: List[asyncio.AbstractServer] = []
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._socket_paths: List[str] = []
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        self._batcher.start()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise OSError(f"Path '{path}' is not a socket.")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(path)
+                except OSError:
+                    os.unlink(path)
+                else:
+                    raise OSError(f"Socket '{path}' is already in use.")
+
+        self._batcher.start()
+        server = await asyncio.start_unix_server(self._handle_lines, path, limit=self._max_body_size + 1)
+        self._servers.append(server)
+        self._socket_paths.append(path)
+        return server
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+        for writer in list(self._writers):
+            writer.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+        for path in self._socket_paths:
+            if os.path.exists(path):
+                os.unlink(path)
+        self._socket_paths = []
+        await self._batcher.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"requests": self._requests, **self._batcher.get_stats(), "latency": self._latency.get_snapshot()}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        request_line = await reader.readline()
+        if not request_line:
+            return False
+
+        started = time.perf_counter()
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        parts = request_line.decode("latin-1").split()
+        keep_alive = len(parts) == 3 and parts[2] == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            length = -1
+
+        if len(parts) != 3 or length < 0:
+            status, body, keep_alive = 400, {"error": "Request is malformed."}, False
+        elif length > self._max_body_size:
+            status, body, keep_alive = 413, {"error": "Request body is too large."}, False
+        else:
+            status, body = await self._dispatch(parts[0], parts[1], await reader.readexactly(length))
+
+        payload = dumps_bytes(body)
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + payload
+        )
+        await writer.drain()
+        self._requests += 1
+        self._latency.observe(time.perf_counter() - started)
+        return keep_alive
+
+    async def _handle_lines(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(dumps_bytes({"error": "Request body is too large."}) + b"\n")
+                    await writer.drain()
+                    break
+
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                started = time.perf_counter()
+                writer.write(dumps_bytes(await self._dispatch_line(line)) + b"\n")
+                await writer.drain()
+                self._requests += 1
+                self._latency.observe(time.perf_counter() - started)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _dispatch_line(self, line: bytes) -> Any:
+        try:
+            document = _load_json(line)
+            if isinstance(document, dict) and "command" in document:
+                return self._run_command(document)
+
+            plans, is_many = _get_plans(document)
+            outputs = await self._batcher.submit(plans)
+        except (ValueError, TypeError, ServerBusyError) as error:
+            return {"error": str(error)}
+        except Exception:
+            return {"error": "Batch calculation failed."}
+
+        return [_to_output(output) for output in outputs] if is_many else _to_output(outputs[0])
+
+    def _run_command(self, document: Dict[str, Any]) -> Any:
+        command = document["command"]
+        if command == "stats":
+            return self.get_stats()
+
+        if command == "rates":
+            rate_book = self._batcher.get_processor().get_rate_book()
+            if rate_book is None:
+                raise ValueError("Server has no rate book.")
+            rate_book.update(document.get("rates"))
+            return {"version": rate_book.get_version()}
+
+        raise ValueError(f"Command '{command}' is not supported.")
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "Method is not allowed."}
+            return 200, self.get_stats()
+
+        if path != "/calculate":
+            return 404, {"error": "Path is not found."}
+
+        if method != "POST":
+            return 405, {"error": "Method is not allowed."}
+
+        try:
+            plans, is_many = parse_plans(body)
+            outputs = await self._batcher.submit(plans)
+        except ValueError as error:
+            return 400, {"error": str(error)}
+        except ServerBusyError as error:
+            return 503, {"error": str(error)}
+        except Exception:
+            return 500, {"error": "Batch calculation failed."}
+
+        return 200, [_to_output(output) for output in outputs] if is_many else _to_output(outputs[0])
+
+
+async def serve(
+    server: PricingServer,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    ready: Optional[Callable[[asyncio.AbstractServer], None]] = None,
+    socket_path: Optional[str] = None,
+) -> None:
+    listener = await (server.start(host, port) if socket_path is None else server.start_unix(socket_path))
+    if ready is not None:
+        ready(listener)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
@@ -0,0 +1,206 @@
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_FLOOR
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from .parallel import ParallelExecutor
+from .rates import RateBook
+from .registry import default_registry
+from .symbol import Symbol
+from .utils import *
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("Monte Carlo simulations require numpy. Install it with 'pip install fxplan[numpy]'.") from e
+
+DEFAULT_PATHS_PER_SHARD = 1024
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+Number = Union[Decimal, int, float, str]
+
+
+@dataclass(frozen=True)
+class SimulationPlan:
+    symbol: Union[Symbol, str]
+    sl_in_pips: Number
+    tp_in_pips: Number
+    initial_equity: Number
+    risk_in_money: Optional[Number] = None
+    risk_in_percent: Optional[Number] = None
+    commission_per_lot_in_money: Number = 0
+    risk_includes_commission: bool = False
+    target_currency: str = "USD"
+
+    def __post_init__(self) -> None:
+        if isinstance(self.symbol, str):
+            object.__setattr__(self, "symbol", normalize_symbol(self.symbol))
+        elif not isinstance(self.symbol, Symbol):
+            raise TypeError("Symbol must be a string or a Symbol object.")
+
+        if not isinstance(self.target_currency, str):
+            raise TypeError("Target currency must be a string.")
+        object.__setattr__(self, "target_currency", parse_currency(self.target_currency))
+
+        for name, precision, message in (
+            ("sl_in_pips", PIPS_PRECISION, "Stop loss in pips must be positive."),
+            ("tp_in_pips", PIPS_PRECISION, "Take profit in pips must be positive."),
+            ("initial_equity", None, "Initial equity must be positive."),
+            ("risk_in_money", None, "Risk in money must be positive."),
+            ("risk_in_percent", None, "Risk in percent must be positive."),
+        ):
+            value = getattr(self, name)
+            if value is None:
+                continue
+
+            value = to_decimal(value)
+            if precision is not None:
+                value = value.quantize(precision, rounding=ROUND_FLOOR)
+            if value <= 0:
+                raise ValueError(message)
+            object.__setattr__(self, name, value)
+
+        commission = to_decimal(self.commission_per_lot_in_money)
+        if commission < 0:
+            raise ValueError("Commission per lot in money must be non-negative.")
+        object.__setattr__(self, "commission_per_lot_in_money", commission)
+
+        if (self.risk_in_money is None) == (self.risk_in_percent is None):
+            raise ValueError("Only one of the risk in money or risk in percent is set.")
+
+
+class SimulationResult(NamedTuple):
+    initial_equity: float
+    final_equity: "np.ndarray"
+    returns: "np.ndarray"
+    max_drawdown: "np.ndarray"
+    max_drawdown_in_money: "np.ndarray"
+    trades: "np.ndarray"
+    ruined: "np.ndarray"
+
+    def get_percentiles(self, field: str, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[float, float]:
+        if field not in ("final_equity", "returns", "max_drawdown", "max_drawdown_in_money", "trades"):
+            raise ValueError(f"Field '{field}' is not a distribution of the simulation.")
+
+        return dict(zip(percentiles, np.percentile(getattr(self, field), percentiles).tolist()))
+
+    def get_summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        return {
+            "paths": len(self.final_equity),
+            "mean_return": float(self.returns.mean()),
+            "returns": self.get_percentiles("returns", percentiles),
+            "max_drawdown": self.get_percentiles("max_drawdown", percentiles),
+            "ruin_probability": float(self.ruined.mean()),
+        }
+
+
+def _get_to_target_factor(symbol: Symbol, target_currency: str, rates: Union[RateBook, Mapping[str, Number], None]) -> Decimal:
+    quote_currency = symbol.get_quote_currency()
+    if quote_currency == target_currency:
+        return Decimal(1)
+
+    if rates is not None and not isinstance(rates, RateBook):
+        if not isinstance(rates, dict):
+            raise TypeError("Rates must be a dictionary or a RateBook object.")
+        rates = RateBook(dict(rates))
+
+    if rates is None or not rates.has_path(quote_currency, target_currency):
+        raise ValueError(f"Exchange rate of '{quote_currency}{target_currency}' or '{target_currency}{quote_currency}' is required.")
+
+    return rates.get_factor(quote_currency, target_currency)
+
+
+class MonteCarloSimulator:
+    def __init__(self, plan: SimulationPlan, rates: Union[RateBook, Mapping[str, Number], None] = None) -> None:
+        if not isinstance(plan, SimulationPlan):
+            raise TypeError("Plan must be a SimulationPlan object.")
+
+        symbol = plan.symbol if isinstance(plan.symbol, Symbol) else default_registry.get(plan.symbol)
+        to_target = _get_to_target_factor(symbol, plan.target_currency, rates)
+        pip_value_per_lot = symbol.get_pip_value_per_lot()
+        commission_per_lot_in_pips = plan.commission_per_lot_in_money / to_target / pip_value_per_lot
+        sizing_in_pips = plan.sl_in_pips + commission_per_lot_in_pips if plan.risk_includes_commission else plan.sl_in_pips
+
+        self._plan = plan
+        self._initial_equity = float(plan.initial_equity)
+        self._risk_in_money = None if plan.risk_in_money is None else float(plan.risk_in_money)
+        self._risk_fraction = None if plan.risk_in_percent is None else float(plan.risk_in_percent / 100)
+        self._commission_per_lot_in_money = float(plan.commission_per_lot_in_money)
+        self._to_target = float(to_target)
+        self._sizing_per_lot_in_quote = float(sizing_in_pips * pip_value_per_lot)
+        self._sl_per_lot_in_quote = float(plan.sl_in_pips * pip_value_per_lot)
+        self._tp_per_lot_in_quote = float(plan.tp_in_pips * pip_value_per_lot)
+
+    def get_plan(self) -> SimulationPlan:
+        return self._plan
+
+    def _get_position_size_in_lots(self, equity: "np.ndarray") -> "np.ndarray":
+        risk = np.full(equity.shape, self._risk_in_money) if self._risk_fraction is None else equity * self._risk_fraction
+        return floor_to_units(risk / self._to_target / self._sizing_per_lot_in_quote, 100) / 100
+
+    def _get_money(self, per_lot_in_quote: float, lots: "np.ndarray") -> "np.ndarray":
+        return floor_to_units(per_lot_in_quote * lots * self._to_target, 100) / 100
+
+    def simulate_paths(self, paths: int, trades: int, win_rate: float, seed: Any = None) -> SimulationResult:
+        rng = np.random.default_rng(seed)
+        equity = np.full(paths, self._initial_equity)
+        peak = equity.copy()
+        max_drawdown = np.zeros(paths)
+        max_drawdown_in_money = np.zeros(paths)
+        taken = np.zeros(paths, dtype=np.int64)
+        ruined = np.zeros(paths, dtype=bool)
+
+        for _ in range(trades):
+            wins = rng.random(paths) < win_rate
+            lots = self._get_position_size_in_lots(equity)
+            active = (lots > 0) & ~ruined
+            lots = np.where(active, lots, 0.0)
+
+            commission = lots * self._commission_per_lot_in_money
+            profit = np.where(wins, self._get_money(self._tp_per_lot_in_quote, lots), -self._get_money(self._sl_per_lot_in_quote, lots))
+            equity = equity + profit - commission
+            taken += active
+
+            ruined |= equity <= 0
+            np.maximum(peak, equity, out=peak)
+            drawdown_in_money = peak - equity
+            np.maximum(max_drawdown_in_money, drawdown_in_money, out=max_drawdown_in_money)
+            np.maximum(max_drawdown, drawdown_in_money / peak, out=max_drawdown)
+
+        return SimulationResult(
+            self._initial_equity, equity, equity / self._initial_equity - 1, max_drawdown, max_drawdown_in_money, taken, ruined,
+        )
+
+    def process_chunk(self, chunk: List[Tuple[int, int, float, Any]]) -> List[SimulationResult]:
+        return [self.simulate_paths(*shard) for shard in chunk]
+
+    def simulate(
+        self,
+        paths: int,
+        trades: int,
+        win_rate: float,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        paths_per_shard: int = DEFAULT_PATHS_PER_SHARD,
+    ) -> SimulationResult:
+        if not isinstance(paths, int) or paths <= 0:
+            raise ValueError("Paths must be a positive integer.")
+
+        if not isinstance(trades, int) or trades <= 0:
+            raise ValueError("Trades must be a positive integer.")
+
+        if not 0 <= win_rate <= 1:
+            raise ValueError("Win rate must be between 0 and 1.")
+
+        if paths_per_shard <= 0:
+            raise ValueError("Paths per shard must be positive.")
+
+        sizes = [min(paths_per_shard, paths - start) for start in range(0, paths, paths_per_shard)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        chunks = [[(size, trades, win_rate, shard_seed)] for size, shard_seed in zip(sizes, seeds)]
+
+        if workers > 1 and len(chunks) > 1:
+            with ParallelExecutor(self, min(workers, len(chunks))) as executor:
+                shards = [result for results in executor.map(chunks) for result in results]
+        else:
+            shards = [result for chunk in chunks for result in self.process_chunk(chunk)]
+
+        return SimulationResult(self._initial_equity, *(np.concatenate(columns) for columns in list(zip(*shards))[1:]))
@@ -0,0 +1,171 @@
+import csv
+import json
+import os
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .symbol import Symbol
+from .utils import *
+
+SPEC_FIELDS = ("symbol", "base_currency", "quote_currency", "lot_size", "pip_size", "digits")
+
+_CACHE_FORMAT_VERSION = 2
+
+
+def _get_field(record: Dict[str, Any], field: str) -> Any:
+    value = record.get(field)
+    return None if value is None or value == "" else value
+
+
+class ContractSpecStore:
+    def __init__(self) -> None:
+        self._index: Dict[str, int] = {}
+        self._columns: Dict[str, List[str]] = {field: [] for field in SPEC_FIELDS}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "ContractSpecStore":
+        store = cls()
+        for row, record in enumerate(records):
+            store._add_record(row, record)
+        return store
+
+    @classmethod
+    def from_csv(cls, path: str) -> "ContractSpecStore":
+        with open(path, newline="", encoding="utf-8") as file:
+            return cls.from_records(csv.DictReader(file))
+
+    @classmethod
+    def from_json(cls, path: str) -> "ContractSpecStore":
+        with open(path, encoding="utf-8") as file:
+            records = json.load(file)
+
+        if isinstance(records, dict):
+            records = records.get("symbols")
+
+        if not isinstance(records, list):
+            raise ValueError("Contract specs must be a list of objects or an object with a 'symbols' list.")
+
+        return cls.from_records(records)
+
+    @classmethod
+    def load(cls, path: str, cache_path: Optional[str] = None) -> "ContractSpecStore":
+        source = os.stat(path)
+        source_key = (source.st_mtime_ns, source.st_size)
+
+        if cache_path is not None and os.path.exists(cache_path):
+            store = cls._load_cache(cache_path, source_key)
+            if store is not None:
+                return store
+
+        if path.lower().endswith(".json"):
+            store = cls.from_json(path)
+        elif path.lower().endswith(".csv"):
+            store = cls.from_csv(path)
+        else:
+            raise ValueError("Contract specs must be a '.csv' or '.json' file.")
+
+        if cache_path is not None:
+            store.save_cache(cache_path, source_key)
+
+        return store
+
+    @classmethod
+    def _load_cache(cls, cache_path: str, source_key: Tuple[int, int]) -> Optional["ContractSpecStore"]:
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                payload = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_FORMAT_VERSION:
+            return None
+
+        if tuple(payload.get("source", ())) != source_key:
+            return None
+
+        columns = payload.get("columns")
+        if not isinstance(columns, dict) or not all(isinstance(columns.get(field), list) for field in SPEC_FIELDS):
+            return None
+
+        if len({len(columns[field]) for field in SPEC_FIELDS}) != 1:
+            return None
+
+        store = cls()
+        store._columns = {field: [str(value) for value in columns[field]] for field in SPEC_FIELDS}
+        store._index = {name: row for row, name in enumerate(store._columns["symbol"])}
+        return store
+
+    def save_cache(self, cache_path: str, source_key: Tuple[int, int] = (0, 0)) -> None:
+        payload = {"version": _CACHE_FORMAT_VERSION, "source": source_key, "columns": self._columns}
+        temporary_path = f"{cache_path}.tmp"
+
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(payload, file, separators=(",", ":"))
+
+        os.replace(temporary_path, cache_path)
+
+    def _add_record(self, row: int, record: Dict[str, Any]) -> None:
+        if not isinstance(record, dict):
+            raise ValueError(f"Row {row}: Contract spec must be an object.")
+
+        name = record.get("symbol")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Row {row}: Symbol is required.")
+
+        name = normalize_symbol(name)
+        if name in self._index:
+            raise ValueError(f"Row {row}: Symbol '{name}' is duplicated.")
+
+        base_currency = _get_field(record, "base_currency")
+        quote_currency = _get_field(record, "quote_currency")
+
+        try:
+            if base_currency is None and quote_currency is None:
+                base_currency, quote_currency = parse_symbol(name)
+
+            symbol = Symbol(
+                name,
+                base_currency=base_currency,
+                quote_currency=quote_currency,
+                lot_size=_get_field(record, "lot_size"),
+                pip_size=_get_field(record, "pip_size"),
+                digits=_get_field(record, "digits"),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Row {row}: {e}")
+
+        self._index[name] = len(self._columns["symbol"])
+        self._columns["symbol"].append(name)
+        self._columns["base_currency"].append(symbol.get_base_currency())
+        self._columns["quote_currency"].append(symbol.get_quote_currency())
+        self._columns["lot_size"].append(str(symbol.get_lot_size()))
+        self._columns["pip_size"].append(str(symbol.get_pip_size()))
+        self._columns["digits"].append(str(symbol.get_digits()))
+
+    def get(self, symbol: str) -> Optional[Dict[str, str]]:
+        row = self._index.get(symbol)
+        if row is None:
+            row = self._index.get(normalize_symbol(symbol))
+        if row is None:
+            return None
+
+        return {field: self._columns[field][row] for field in SPEC_FIELDS}
+
+    def create_symbol(self, symbol: str) -> Symbol:
+        spec = self.get(symbol)
+        if spec is None:
+            raise ValueError(f"Symbol '{symbol}' is not in the contract specs.")
+
+        return Symbol(
+            spec["symbol"],
+            base_currency=spec["base_currency"],
+            quote_currency=spec["quote_currency"],
+            lot_size=Decimal(spec["lot_size"]),
+            pip_size=Decimal(spec["pip_size"]),
+            digits=Decimal(spec["digits"]),
+        )
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index or normalize_symbol(symbol) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -0,0 +1,163 @@
+from decimal import Decimal
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from .rates import RateBook
+from .symbol import Symbol
+from .utils import *
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("Parameter sweeps require numpy. Install it with 'pip install fxplan[numpy]'.") from e
+
+from .batch import OUTPUT_FIELDS, BatchCalculator
+
+Number = Union[Decimal, int, float, str]
+
+DEFAULT_CHUNK_CELLS = 65536
+
+SWEEP_INPUTS = (
+    "is_long",
+    "entry_price",
+    "sl_price",
+    "tp_price",
+    "sl_in_pips",
+    "tp_in_pips",
+    "sl_in_points",
+    "tp_in_points",
+    "position_size_in_lots",
+    "sl_in_money",
+    "commission_per_lot_in_money",
+    "sl_with_commission_in_money",
+)
+
+
+def grid_range(start: Number, stop: Number, step: Number) -> "np.ndarray":
+    start, stop, step = to_decimal(start), to_decimal(stop), to_decimal(step)
+    if step <= 0:
+        raise ValueError("Step must be positive.")
+
+    if stop < start:
+        raise ValueError("Stop must not be lower than start.")
+
+    count = int((stop - start) / step) + 1
+    return np.array([float(start + step * index) for index in range(count)])
+
+
+class SweepResult(NamedTuple):
+    axes: Dict[str, "np.ndarray"]
+    values: Dict[str, "np.ndarray"]
+
+    def get_shape(self) -> Tuple[int, ...]:
+        return tuple(len(axis) for axis in self.axes.values())
+
+    def get_axis(self, name: str) -> "np.ndarray":
+        if name not in self.axes:
+            raise ValueError(f"Input '{name}' is not an axis of the sweep.")
+
+        return self.axes[name]
+
+    def get_field(self, field: str) -> "np.ndarray":
+        if field not in self.values:
+            raise ValueError(f"Field '{field}' is not a result field of the sweep.")
+
+        return self.values[field]
+
+
+def _to_axis(name: str, values: Any) -> "np.ndarray":
+    if isinstance(values, range):
+        values = list(values)
+
+    axis = np.asarray(values)
+    if axis.ndim != 1 or not len(axis):
+        raise ValueError(f"Axis '{name}' must be a non-empty one-dimensional sequence.")
+
+    return axis
+
+
+def _check_input_name(name: str) -> None:
+    if name in ("symbol", "target_currency", "exchange_rate"):
+        raise ValueError(f"Input '{name}' cannot be swept.")
+
+    if name not in SWEEP_INPUTS:
+        raise ValueError(f"Unknown input '{name}'.")
+
+
+def sweep(
+    symbol: Union[Symbol, str],
+    axes: Mapping[str, Any],
+    inputs: Optional[Mapping[str, Any]] = None,
+    target_currency: str = "USD",
+    exchange_rate: Union[dict, RateBook, None] = None,
+    fields: Sequence[str] = OUTPUT_FIELDS,
+    error_mode: str = "collect",
+    chunk_cells: int = DEFAULT_CHUNK_CELLS,
+) -> SweepResult:
+    inputs = dict(inputs or {})
+    if not axes:
+        raise ValueError("At least one axis is required.")
+
+    for name in list(axes) + list(inputs):
+        _check_input_name(name)
+
+    for name, value in inputs.items():
+        if name in axes:
+            raise ValueError(f"Input '{name}' is both an axis and a fixed input.")
+        if np.ndim(value) != 0:
+            raise ValueError(f"Fixed input '{name}' must be a single value.")
+
+    for field in fields:
+        if field not in OUTPUT_FIELDS:
+            raise ValueError(f"Field '{field}' is not a result field.")
+
+    if chunk_cells <= 0:
+        raise ValueError("Chunk cells must be positive.")
+
+    grid = {name: _to_axis(name, values) for name, values in axes.items()}
+    shape = tuple(len(axis) for axis in grid.values())
+    fields = list(fields)
+    if error_mode == "collect":
+        fields += ["error_code", "error_message"]
+
+    # The batch computes every output column and intermediate over its grid, so the grid
+    # is calculated in chunks along the first axis and only the requested fields are
+    # copied into the full-size output arrays.
+    rows = max(1, chunk_cells // (int(np.prod(shape[1:])) or 1))
+    values: Dict[str, "np.ndarray"] = {}
+    for start in range(0, shape[0], rows):
+        chunk = {name: axis[start:start + rows] if position == 0 else axis for position, (name, axis) in enumerate(grid.items())}
+        result = _calculate_chunk(symbol, chunk, inputs, target_currency, exchange_rate, error_mode)
+        for field in fields:
+            if field not in values:
+                values[field] = np.empty(shape, dtype=result[field].dtype)
+            values[field][start:start + rows] = result[field]
+
+    return SweepResult(grid, values)
+
+
+def _calculate_chunk(
+    symbol: Union[Symbol, str],
+    grid: Dict[str, "np.ndarray"],
+    inputs: Dict[str, Any],
+    target_currency: str,
+    exchange_rate: Union[dict, RateBook, None],
+    error_mode: str,
+) -> Dict[str, "np.ndarray"]:
+    batch = BatchCalculator()
+    batch.set_error_mode(error_mode)
+    batch.set_symbol(symbol)
+    batch.set_target_currency(target_currency)
+    if exchange_rate is not None:
+        batch.set_exchange_rate(exchange_rate)
+
+    for name, value in inputs.items():
+        getattr(batch, f"set_{name}")(value)
+
+    # Each axis is set as a column that only spans its own dimension, so the inputs stay
+    # as small as the axes and only the calculation broadcasts them to the full grid.
+    for position, (name, axis) in enumerate(grid.items()):
+        shape = [1] * len(grid)
+        shape[position] = len(axis)
+        getattr(batch, f"set_{name}")(axis.reshape(shape))
+
+    batch.calculate()
+    return batch.get_result()
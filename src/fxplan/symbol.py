@@ -4,15 +4,60 @@ from .utils import *
 
 
 class Symbol:
-    def __init__(self, symbol: str):
+    __slots__ = (
+        "_symbol",
+        "_base_currency",
+        "_quote_currency",
+        "_lot_size",
+        "_pip_size",
+        "_digits",
+        "_price_precision",
+        "_pip_value_per_lot",
+        "_frozen",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        base_currency: Optional[str] = None,
+        quote_currency: Optional[str] = None,
+        lot_size: Union[Decimal, int, float, str, None] = None,
+        pip_size: Union[Decimal, int, float, str, None] = None,
+        digits: Union[Decimal, int, float, str, None] = None,
+    ):
         self._symbol: str = symbol
         self._base_currency: Optional[str] = None
         self._quote_currency: Optional[str] = None
         self._lot_size: Decimal = Decimal("100000")
         self._pip_size: Decimal = Decimal("0.0001")
         self._digits: Decimal = Decimal("5")
+        self._price_precision: Decimal = Decimal("0.00001")
+        self._pip_value_per_lot: Decimal = Decimal("10")
+        self._frozen: bool = False
 
-        self._set_default_symbol_specification()
+        if base_currency is None and quote_currency is None:
+            self._set_default_symbol_specification()
+        else:
+            self._set_custom_currencies(base_currency, quote_currency)
+
+        if lot_size is not None:
+            self.set_lot_size(lot_size)
+        if pip_size is not None:
+            self.set_pip_size(pip_size)
+        if digits is not None:
+            self.set_digits(digits)
+
+        self._set_contract_constants()
+
+    def _set_custom_currencies(self, base_currency: Optional[str], quote_currency: Optional[str]) -> None:
+        if base_currency is None or quote_currency is None:
+            raise ValueError("Base and quote currencies must be set together.")
+
+        if not isinstance(base_currency, str) or not base_currency.strip():
+            raise ValueError("Base currency must be a non-empty string.")
+
+        self._base_currency = base_currency.upper().strip()
+        self._quote_currency = parse_currency(quote_currency)
 
     def _set_default_symbol_specification(self) -> None:
         self._base_currency, self._quote_currency = parse_symbol(self._symbol)
@@ -36,6 +81,20 @@ class Symbol:
         elif self._base_currency == "XAU":
             self._digits = Decimal("2")
 
+    def _set_contract_constants(self) -> None:
+        self._price_precision = Decimal("1") / (10 ** self._digits)
+        self._pip_value_per_lot = self._pip_size * self._lot_size
+
+    def _raise_error_if_frozen(self) -> None:
+        if self._frozen:
+            raise ValueError("Symbol is frozen and cannot be modified.")
+
+    def freeze(self) -> None:
+        self._frozen = True
+
+    def is_frozen(self) -> bool:
+        return self._frozen
+
     def get_symbol(self) -> str:
         return self._symbol
 
@@ -49,28 +108,37 @@ class Symbol:
         return self._lot_size
 
     def set_lot_size(self, lot_size: Union[Decimal, int, float, str]) -> None:
+        self._raise_error_if_frozen()
         lot_size = to_decimal(lot_size)
         if lot_size <= 0:
             raise ValueError("Lot size must be positive.")
         self._lot_size = lot_size
+        self._set_contract_constants()
 
     def get_pip_size(self) -> Decimal:
         return self._pip_size
 
     def set_pip_size(self, pip_size: Union[Decimal, int, float, str]) -> None:
+        self._raise_error_if_frozen()
         pip_size = to_decimal(pip_size)
         if pip_size <= 0:
             raise ValueError("Pip size must be positive.")
         self._pip_size = pip_size
+        self._set_contract_constants()
 
     def get_digits(self) -> Decimal:
         return self._digits
 
     def set_digits(self, digits: Union[Decimal, int, float, str]) -> None:
+        self._raise_error_if_frozen()
         digits = to_decimal(digits)
         if digits <= 0:
             raise ValueError("Digits must be positive.")
         self._digits = digits
+        self._set_contract_constants()
 
     def get_price_precision(self) -> Decimal:
-        return Decimal("1") / (10 ** self._digits)
+        return self._price_precision
+
+    def get_pip_value_per_lot(self) -> Decimal:
+        return self._pip_value_per_lot
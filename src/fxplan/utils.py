@@ -2,12 +2,24 @@ import re
 from decimal import Decimal
 from typing import Tuple, Union
 
+LOTS_PRECISION = Decimal("0.01")
+PIPS_PRECISION = Decimal("0.1")
+POINTS_PRECISION = Decimal("1")
+MONEY_PRECISION = Decimal("0.01")
+RRR_PRECISION = Decimal("0.01")
 
-def parse_symbol(symbol: str) -> Tuple[str, str]:
+# Relative tolerance under which a scaled float is taken to lie on the unit grid.
+SNAP_TOLERANCE = 1e-12
+
+
+def normalize_symbol(symbol: str) -> str:
     if not isinstance(symbol, str):
         raise TypeError("Symbol must be a string.")
 
-    cleaned = re.sub(r'[-/]', '', symbol.upper().strip())
+    return re.sub(r'[-/]', '', symbol.upper().strip())
+
+def parse_symbol(symbol: str) -> Tuple[str, str]:
+    cleaned = normalize_symbol(symbol)
 
     if len(cleaned) != 6:
         raise ValueError(f"Symbol must contain only 6 letters.")
@@ -76,3 +88,11 @@ def exchange_currency_by_rate(**kwargs: dict) -> (Decimal, str):
         return (source_amount * exchange_rate, quote)
     else:
         return (source_amount / exchange_rate, base)
+
+def floor_to_units(values: "np.ndarray", scale: float) -> "np.ndarray":
+    import numpy as np
+
+    scaled = values * scale
+    nearest = np.rint(scaled)
+    snapped = np.abs(scaled - nearest) <= SNAP_TOLERANCE * np.maximum(np.abs(scaled), 1.0)
+    return np.where(snapped, nearest, np.floor(scaled))
@@ -0,0 +1,97 @@
+import pytest
+from src.fxplan.calculator import Calculator
+from src.fxplan.result import ResultStore
+
+np = pytest.importorskip("numpy")
+
+from src.fxplan.backtest import BAR_DTYPE, OUTCOME_OPEN, OUTCOME_SL, OUTCOME_TP, Backtest, BarSeries
+
+
+def _random_bars(rows: int, seed: int) -> BarSeries:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0002, rows))
+    open = np.r_[close[0], close[:-1]]
+    high = np.maximum(open, close) + rng.random(rows) * 0.0003
+    low = np.minimum(open, close) - rng.random(rows) * 0.0003
+    return BarSeries.from_arrays(np.arange(rows) * 60, open, high, low, close)
+
+
+def _first_hit(bars: np.ndarray, start: int, is_long: bool, sl_price: float, tp_price: float) -> tuple:
+    for index in range(start, len(bars)):
+        sl_hit = bars["low"][index] <= sl_price if is_long else bars["high"][index] >= sl_price
+        tp_hit = bars["high"][index] >= tp_price if is_long else bars["low"][index] <= tp_price
+        if sl_hit or tp_hit:
+            return OUTCOME_SL if sl_hit else OUTCOME_TP, index
+    return OUTCOME_OPEN, -1
+
+
+class TestBarSeries:
+    def test_valid(self, tmp_path):
+        bars = _random_bars(100, seed=1)
+        bars.save(tmp_path / "bars.npy")
+        loaded = BarSeries.load(tmp_path / "bars.npy")
+        assert isinstance(loaded.get_bars(), np.memmap)
+        assert len(loaded) == 100
+        assert loaded.get_column("high").tolist() == bars.get_column("high").tolist()
+
+    def test_invalid(self):
+        with pytest.raises(TypeError, match="Bars must be a one-dimensional array of BAR_DTYPE."):
+            BarSeries(np.zeros(3))
+        with pytest.raises(ValueError, match="Bar times must be sorted."):
+            BarSeries.from_arrays([2, 1], [1, 1], [1, 1], [1, 1], [1, 1])
+        with pytest.raises(ValueError, match="All columns must have the same length."):
+            BarSeries.from_arrays([1, 2], [1], [1], [1], [1])
+        with pytest.raises(ValueError, match="Field 'volume' is not a bar field."):
+            BarSeries(np.zeros(1, dtype=BAR_DTYPE)).get_column("volume")
+
+
+class TestBacktest:
+    def test_valid(self):
+        rng = np.random.default_rng(3)
+        for rows in (1, 64, 65, 5000, 70000):
+            bars = _random_bars(rows, seed=rows)
+            plans = 200
+            entry_times = rng.integers(-100, rows * 60 + 100, plans)
+            is_long = rng.random(plans) < 0.5
+            price = bars.get_column("open")[np.minimum(np.searchsorted(bars.get_column("time"), entry_times), rows - 1)]
+            sl_distance = rng.uniform(0.0005, 0.02, plans)
+            tp_distance = rng.uniform(0.0005, 0.02, plans)
+            columns = {
+                "is_long": is_long,
+                "sl_price": np.where(is_long, price - sl_distance, price + sl_distance),
+                "tp_price": np.where(is_long, price + tp_distance, price - tp_distance),
+                "sl_with_commission_in_money": np.full(plans, 107.0),
+                "tp_with_commission_in_money": np.full(plans, 193.0),
+            }
+            result = Backtest(bars).run(entry_times, columns)
+            for plan in range(plans):
+                start = int(np.searchsorted(bars.get_column("time"), entry_times[plan]))
+                outcome, index = _first_hit(bars.get_bars(), start, is_long[plan], columns["sl_price"][plan], columns["tp_price"][plan])
+                assert (result["outcome"][plan], result["exit_index"][plan]) == (outcome, index), (rows, plan)
+                assert result["pnl"][plan] == {OUTCOME_OPEN: 0.0, OUTCOME_SL: -107.0, OUTCOME_TP: 193.0}[outcome]
+                assert result["exit_time"][plan] == (-1 if index == -1 else index * 60)
+
+    def test_result_store(self):
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        calc.set_commission_per_lot_in_money(7)
+        store = ResultStore()
+        for is_long in (True, False):
+            calc.with_inputs(is_long=is_long, entry_price=1.1, sl_in_pips=20, tp_in_pips=40, sl_in_money=100).calculate()
+            store.append(calc.get_result_record())
+
+        bars = BarSeries.from_arrays([0, 60, 120], [1.1, 1.1, 1.1035], [1.1005, 1.1041, 1.104], [1.0995, 1.0985, 1.1], [1.1, 1.1035, 1.1])
+        result = Backtest(bars).run([0, 0], store)
+        assert result["outcome"].tolist() == [OUTCOME_TP, OUTCOME_SL]
+        assert result["exit_index"].tolist() == [1, 1]
+        assert result["same_bar"].tolist() == [False, False]
+        assert result["pnl"].tolist() == [196.5, -103.5]
+
+    def test_invalid(self):
+        backtest = Backtest(_random_bars(10, seed=0))
+        with pytest.raises(TypeError, match="Bars must be a BarSeries object."):
+            Backtest(np.zeros(1, dtype=BAR_DTYPE))
+        with pytest.raises(ValueError, match="Plans must have a 'tp_price' column."):
+            backtest.run([0], {"is_long": [True], "sl_price": [1.0]})
+        with pytest.raises(TypeError, match="Plans must be a ResultStore or a dictionary of columns."):
+            backtest.run([0], [1, 2])
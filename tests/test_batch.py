@@ -0,0 +1,240 @@
+import random
+import pytest
+from decimal import Decimal
+from src.fxplan.calculator import Calculator
+from src.fxplan.rates import RateBook
+
+np = pytest.importorskip("numpy")
+
+from src.fxplan.batch import BatchCalculator, OUTPUT_FIELDS, ERROR_CONFLICTING_VALUES, ERROR_EXCHANGE_RATE, ERROR_INVALID_VALUE, ERROR_MISSING_VALUE, ERROR_NONE, ERROR_POSITION_SIZE, ERROR_PRICE_RELATION
+
+
+def _random_plans(rows: int, seed: int) -> list:
+    rnd = random.Random(seed)
+    plans = []
+    for _ in range(rows):
+        is_long = rnd.random() < 0.5
+        entry_price = round(rnd.uniform(1.05, 1.25), 5)
+        plan = {"is_long": is_long, "entry_price": entry_price, "commission_per_lot_in_money": rnd.choice([0, 7, 3.5])}
+        if rnd.random() < 0.5:
+            plan["sl_price"] = round(entry_price + (-1 if is_long else 1) * rnd.randint(10, 900) / 100000, 5)
+        else:
+            plan["sl_in_pips"] = round(rnd.uniform(1, 100), 1)
+        plan["tp_in_points"] = rnd.randint(10, 3000)
+        if rnd.random() < 0.5:
+            plan["position_size_in_lots"] = round(rnd.uniform(0.01, 10), 2)
+        else:
+            plan["sl_with_commission_in_money"] = rnd.choice([100, 250, round(rnd.uniform(50, 2000), 2)])
+        plans.append(plan)
+    return plans
+
+
+def _calculate_scalar(plan: dict, target_currency: str, exchange_rate: dict) -> dict:
+    calc = Calculator()
+    calc.set_symbol("EURGBP")
+    calc.set_target_currency(target_currency)
+    if exchange_rate:
+        calc.set_exchange_rate(exchange_rate)
+    for key, value in plan.items():
+        getattr(calc, f"set_{key}")(value)
+    calc.calculate()
+    return calc.get_result()
+
+
+def _calculate_batch(plans: list, target_currency: str, exchange_rate: dict) -> dict:
+    batch = BatchCalculator()
+    batch.set_symbol("EURGBP")
+    batch.set_target_currency(target_currency)
+    if exchange_rate:
+        batch.set_exchange_rate(exchange_rate)
+    batch.set_is_long([plan["is_long"] for plan in plans])
+    for key in ("entry_price", "sl_price", "sl_in_pips", "tp_in_points", "position_size_in_lots",
+                "sl_with_commission_in_money", "commission_per_lot_in_money"):
+        getattr(batch, f"set_{key}")([plan.get(key) for plan in plans])
+    batch.calculate()
+    return batch.get_result()
+
+
+def _flatten(result: dict) -> dict:
+    flat = dict(result)
+    for group in ("rr_in_pips", "rr_in_points", "rr_in_money", "rr_with_commission_in_money"):
+        flat.update(flat.pop(group))
+    return flat
+
+
+class TestCalculate:
+    def test_valid(self):
+        batch = BatchCalculator()
+        batch.set_symbol("EURUSD")
+        batch.set_is_long([True, False])
+        batch.set_entry_price([1.17968, 1.17968])
+        batch.set_sl_in_pips([50, 50])
+        batch.set_tp_price([1.18968, 1.16968])
+        batch.set_position_size_in_lots(1.0)
+        batch.calculate()
+        result = batch.get_result()
+        assert result["sl_price"].tolist() == [1.17468, 1.18468]
+        assert result["tp_in_pips"].tolist() == [100.0, 100.0]
+        assert result["sl_in_money"].tolist() == [500.0, 500.0]
+        assert result["rrr"].tolist() == [2.0, 2.0]
+
+    def test_matches_scalar_calculator(self):
+        plans = _random_plans(500, seed=7)
+        for target_currency, exchange_rate in (("GBP", {}), ("USD", {"symbol": "GBPUSD", "rate": 1.27345})):
+            columns = _calculate_batch(plans, target_currency, exchange_rate)
+            for row, plan in enumerate(plans):
+                expected = _flatten(_calculate_scalar(plan, target_currency, exchange_rate))
+                for field in ("position_size_in_lots", "sl_in_points", "tp_in_points", "sl_in_money",
+                              "tp_in_money", "rrr", "rrr_with_commission"):
+                    assert Decimal(repr(float(columns[field][row]))) == expected[field], (row, field)
+                for field in OUTPUT_FIELDS:
+                    assert float(columns[field][row]) == pytest.approx(float(expected[field]), rel=1e-12), (row, field)
+
+    def test_invalid(self):
+        batch = BatchCalculator()
+        with pytest.raises(ValueError, match="Symbol is required."):
+            batch.calculate()
+        batch.set_symbol("EURUSD")
+        batch.set_is_long([True, True])
+        batch.set_entry_price([1.1, 1.1])
+        batch.set_sl_price([1.09, 1.11])
+        batch.set_tp_in_pips([10, 10])
+        batch.set_position_size_in_lots([1, 1])
+        with pytest.raises(ValueError, match="Row 1: Stop loss price must be lower than entry price in a long position."):
+            batch.calculate()
+        batch.set_sl_price([1.09, 1.09])
+        batch.set_sl_in_pips([np.nan, 10])
+        with pytest.raises(ValueError, match="Row 1: Only one of the stop loss price, stop loss in pips or stop loss in points is set."):
+            batch.calculate()
+        batch.set_position_size_in_lots([1, 1, 1])
+        with pytest.raises(ValueError, match="All columns must have the same length."):
+            batch.calculate()
+
+
+class TestErrorMode:
+    def test_valid(self):
+        batch = BatchCalculator()
+        batch.set_error_mode("collect")
+        batch.set_symbol("EURUSD")
+        batch.set_is_long([True, True, False, True, True, True])
+        batch.set_entry_price([1.1, None, 1.1, 1.1, 1.1, 1.1])
+        batch.set_sl_price([1.09, 1.09, 1.09, None, 1.09, 1.09])
+        batch.set_sl_in_pips([None, None, None, None, 10, "abc"])
+        batch.set_tp_in_pips([10, 10, 10, 10, 10, -10])
+        batch.set_position_size_in_lots(1)
+        errors = batch.validate()
+        assert errors["error_code"].tolist() == [
+            ERROR_NONE, ERROR_MISSING_VALUE, ERROR_PRICE_RELATION, ERROR_MISSING_VALUE, ERROR_CONFLICTING_VALUES, ERROR_INVALID_VALUE,
+        ]
+        assert errors["error_message"].tolist() == [
+            None,
+            "Entry price is required.",
+            "Stop loss price must be greater than entry price in a short position.",
+            "One of the stop loss price, stop loss in pips or stop loss in points must be set.",
+            "Only one of the stop loss price, stop loss in pips or stop loss in points is set.",
+            "Stop loss in pips must be a number.",
+        ]
+
+        batch.calculate()
+        result = batch.get_result()
+        assert result["sl_in_money"][0] == 1000.0
+        assert np.isnan(result["sl_in_money"][1:]).all()
+        assert result["is_long"].tolist() == [True, True, False, True, True, True]
+        assert result["error_code"].tolist() == errors["error_code"].tolist()
+
+        batch.set_sl_in_pips([None, None, None, 10, None, None])
+        batch.set_entry_price(1.1)
+        batch.set_tp_in_pips(10)
+        batch.set_exchange_rate({"symbol": "GBPUSD", "rate": [1.27, 1.27, 1.27, 1.27, 1.27, 0]})
+        batch.set_target_currency("GBP")
+        batch.calculate()
+        result = batch.get_result()
+        assert result["error_code"].tolist() == [ERROR_NONE, ERROR_NONE, ERROR_PRICE_RELATION, ERROR_NONE, ERROR_NONE, ERROR_EXCHANGE_RATE]
+        assert result["sl_in_money"][0] == 787.4
+
+        batch.set_exchange_rate(RateBook({"USDJPY": "158.968"}))
+        batch.calculate()
+        assert set(batch.get_result()["error_message"]) == {"Exchange rate of 'USDGBP' or 'GBPUSD' is required."}
+
+    def test_position_size(self):
+        batch = BatchCalculator()
+        batch.set_error_mode("collect")
+        batch.set_symbol("EURUSD")
+        batch.set_is_long(True)
+        batch.set_entry_price(1.1)
+        batch.set_sl_in_pips(10)
+        batch.set_tp_in_pips(20)
+        batch.set_sl_in_money([0.5, 100, "0.99"])
+        batch.calculate()
+        result = batch.get_result()
+        assert result["error_code"].tolist() == [ERROR_POSITION_SIZE, ERROR_NONE, ERROR_POSITION_SIZE]
+        assert result["error_message"].tolist() == [
+            "Risk is too small for the minimum position size.", None, "Risk is too small for the minimum position size.",
+        ]
+        assert result["position_size_in_lots"][1] == 1.0
+        assert np.isnan(result["position_size_in_lots"][[0, 2]]).all()
+
+        batch.set_error_mode("raise")
+        batch.set_sl_in_money([0.5, 100, "0.99"])
+        with pytest.raises(ArithmeticError):
+            batch.calculate()
+
+    def test_invalid(self):
+        batch = BatchCalculator()
+        assert batch.get_error_mode() == "raise"
+        with pytest.raises(ValueError, match="Error mode can be 'raise' or 'collect' only."):
+            batch.set_error_mode("ignore")
+        with pytest.raises(AttributeError, match="Batch is not validated yet."):
+            batch.get_errors()
+
+
+class TestSetters:
+    def test_valid(self):
+        batch = BatchCalculator()
+        batch.set_symbol("USDJPY")
+        batch.set_entry_price([150.1239, 150.12])
+        assert batch._entry_price.tolist() == [150123.0, 150120.0]
+        batch.set_position_size_in_lots([1.239, 0.01])
+        assert batch._position_size_in_lots.tolist() == [123.0, 1.0]
+
+    def test_invalid(self):
+        batch = BatchCalculator()
+        with pytest.raises(ValueError, match="Symbol must be set before setting other fields."):
+            batch.set_entry_price([1.1])
+        batch.set_symbol("EURUSD")
+        with pytest.raises(ValueError, match="Entry price must be positive."):
+            batch.set_entry_price([1.1, 0])
+        with pytest.raises(ValueError, match="Position size must be positive."):
+            batch.set_position_size_in_lots([0.001])
+        with pytest.raises(TypeError, match="Is long must be a boolean."):
+            batch.set_is_long([1, 0])
+        with pytest.raises(ValueError, match="Cannot convert values"):
+            batch.set_sl_in_pips(["abc"])
+
+
+class TestRateBook:
+    def test_valid(self):
+        book = RateBook({"USDJPY": "158.968", "GBPUSD": "1.27"})
+        results = []
+        for rates in ({"symbol": "USDJPY", "rate": 158.968}, book):
+            batch = BatchCalculator()
+            batch.set_symbol("GBPJPY")
+            batch.set_exchange_rate(rates)
+            batch.set_is_long([True, False])
+            batch.set_entry_price([190.123, 190.123])
+            batch.set_sl_in_pips([35.5, 80])
+            batch.set_tp_in_pips(100)
+            batch.set_sl_in_money([250, 1000])
+            batch.calculate()
+            results.append(batch.get_result())
+        for field in OUTPUT_FIELDS:
+            assert results[0][field].tolist() == results[1][field].tolist()
+
+    def test_invalid(self):
+        batch = BatchCalculator()
+        batch.set_symbol("GBPJPY")
+        batch.set_exchange_rate(RateBook({"EURUSD": "1.1"}))
+        batch.set_is_long([True])
+        batch.set_entry_price([190.123])
+        with pytest.raises(ValueError, match="Exchange rate of 'JPYUSD' or 'USDJPY' is required."):
+            batch.calculate()
@@ -0,0 +1,76 @@
+import pytest
+from decimal import Decimal
+from src.fxplan.cache import ResultCache
+from src.fxplan.calculator import Calculator
+from src.fxplan.rates import RateBook
+from src.fxplan.result import Result
+
+PLAN = {"is_long": True, "sl_in_pips": 50, "tp_in_pips": 100, "sl_in_money": 500}
+
+
+class TestResultCache:
+    def test_valid(self):
+        cache = ResultCache(max_size=2)
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        calc.set_cache(cache)
+        calc.with_inputs(**PLAN, entry_price=1.17968).calculate()
+        record = calc.get_result_record()
+
+        other = calc.clone()
+        other.with_inputs(**PLAN, entry_price="1.179680").calculate()
+        assert other.get_result_record() is record
+        assert cache.get_stats() == {"size": 1, "max_size": 2, "hits": 1, "misses": 1, "evictions": 0, "expirations": 0, "hit_rate": 0.5}
+
+        other.set_tp_in_pips(200)
+        other.calculate()
+        assert other.get_result()["rrr"] == Decimal("4.00")
+        assert other.get_result()["rr_in_money"]["sl_in_money"] == Decimal("500.00")
+
+        calc.with_inputs(**PLAN, entry_price=1.1).calculate()
+        assert cache.get_stats()["evictions"] == 1
+        assert len(cache) == 2
+
+        result = other.get_result()
+        result["rrr"] = Decimal(0)
+        result["rr_in_money"].update(sl_in_money=Decimal(0))
+        result["note"] = "changed"
+        assert other.get_result_record().is_shared()
+        assert other.get_result()["rrr"] == Decimal("4.00")
+        assert other.get_result()["rr_in_money"]["sl_in_money"] == Decimal("500.00")
+        assert "note" not in other.get_result()
+
+        cache.clear()
+        assert cache.get_stats()["hits"] == 0 and len(cache) == 0
+
+    def test_rate_book_version(self):
+        book = RateBook({"USDJPY": "158.968"})
+        cache = ResultCache()
+        calc = Calculator()
+        calc.set_symbol("GBPJPY")
+        calc.set_exchange_rate(book)
+        calc.set_cache(cache)
+        calc.with_inputs(**PLAN, entry_price=190.123).calculate()
+        calc.with_inputs(**PLAN, entry_price=190.123).calculate()
+        assert cache.get_stats()["hits"] == 1
+
+        book.set_rate("USDJPY", "150")
+        calc.with_inputs(**PLAN, entry_price=190.123).calculate()
+        assert cache.get_stats()["expirations"] == 1
+        assert calc.get_result()["exchange_rate"]["rate"] == 1 / Decimal(150)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Max size must be a positive integer."):
+            ResultCache(0)
+        with pytest.raises(TypeError, match="Result must be a Result object."):
+            ResultCache().put("key", None, {})
+        with pytest.raises(TypeError, match="Cache must be a ResultCache object or None."):
+            Calculator().set_cache({})
+
+        cache = ResultCache()
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        calc.set_cache(cache)
+        with pytest.raises(ValueError, match="Entry price is required."):
+            calc.with_inputs(**PLAN).calculate()
+        assert len(cache) == 0
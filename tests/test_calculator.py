@@ -0,0 +1,104 @@
+import pytest
+from decimal import Decimal
+from src.fxplan.calculator import Calculator
+from src.fxplan.rates import RateBook
+
+
+class TestCalculateMany:
+    def test_valid(self):
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        plans = [
+            {"is_long": True, "entry_price": 1.1, "sl_in_pips": 50, "tp_in_pips": 100, "position_size_in_lots": 1},
+            {"is_long": False, "entry_price": 1.1, "sl_price": 1.102, "tp_in_pips": 10, "sl_in_money": 100},
+        ]
+        results = list(calc.calculate_many(plans))
+        assert results[0]["rr_in_money"]["sl_in_money"] == Decimal("500.00")
+        assert results[0]["rrr"] == Decimal("2.00")
+        assert results[1]["position_size_in_lots"] == Decimal("0.50")
+        assert results[1]["rrr"] == Decimal("0.50")
+        assert results[0] is not results[1]
+
+    def test_plans_with_symbol(self):
+        calc = Calculator()
+        plans = [
+            {"symbol": "EURUSD", "is_long": True, "entry_price": 1.1, "sl_in_pips": 50, "tp_in_pips": 100, "position_size_in_lots": 1},
+            {"symbol": "eur/usd", "is_long": False, "entry_price": 1.1, "sl_price": 1.102, "tp_in_pips": 10, "sl_in_money": 100},
+        ]
+        results = list(calc.calculate_many(plans))
+        assert results[0]["position_size_in_lots"] == Decimal("1.00")
+        assert results[1]["position_size_in_lots"] == Decimal("0.50")
+
+        results = calc.calculate_many([{"symbol": "GBPUSD", "is_long": True, "entry_price": 1.3, "sl_in_pips": 50, "tp_in_pips": 100}])
+        with pytest.raises(ValueError, match="Symbol 'GBPUSD' does not match the calculator symbol 'EURUSD'."):
+            list(results)
+
+    def test_invalid(self):
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        results = calc.calculate_many([{"is_long": True, "entry_price": 1.1, "sl_in_pips": 50}])
+        with pytest.raises(ValueError, match="One of the take profit price"):
+            list(results)
+
+
+def _calculate_fresh(rate: float = 158.968, **plan) -> dict:
+    calc = Calculator()
+    calc.set_symbol("GBPJPY")
+    calc.set_exchange_rate({"symbol": "USDJPY", "rate": rate})
+    calc.with_inputs(**plan).calculate()
+    return calc.get_result()
+
+
+class TestIncrementalCalculate:
+    def test_valid(self):
+        plan = {"is_long": True, "entry_price": 190.123, "sl_price": 189.5, "tp_in_pips": 100, "commission_per_lot_in_money": 7, "sl_with_commission_in_money": 250}
+        calc = Calculator()
+        calc.set_symbol("GBPJPY")
+        calc.set_exchange_rate({"symbol": "USDJPY", "rate": 158.968})
+        calc.with_inputs(**plan).calculate()
+        record = calc.get_result_record()
+        result = calc.get_result()
+
+        calc.calculate()
+        assert calc.get_result_record() is record
+        assert calc.get_result() is result
+
+        calc.set_entry_price(190.2)
+        calc.calculate()
+        assert calc.get_result_record() is not record
+        assert calc.get_result() == _calculate_fresh(**{**plan, "entry_price": 190.2})
+        assert result["entry_price"] == Decimal("190.123")
+
+        calc.set_tp_in_points(500)
+        calc.set_commission_per_lot_in_money(0)
+        calc.set_exchange_rate({"symbol": "USDJPY", "rate": 150})
+        calc.calculate()
+        plan = {**plan, "entry_price": 190.2, "tp_in_points": 500, "commission_per_lot_in_money": 0}
+        del plan["tp_in_pips"]
+        assert calc.get_result() == _calculate_fresh(150, **plan)
+
+    def test_rate_book(self):
+        book = RateBook({"USDJPY": "158.968"})
+        calc = Calculator()
+        calc.set_symbol("GBPJPY")
+        calc.set_exchange_rate(book)
+        calc.with_inputs(is_long=False, entry_price=190.123, sl_in_pips=50, tp_in_pips=100, sl_in_money=500).calculate()
+        assert calc.get_result()["position_size_in_lots"] == Decimal("1.58")
+
+        book.set_rate("USDJPY", "100")
+        calc.calculate()
+        assert calc.get_result()["position_size_in_lots"] == Decimal("1.00")
+
+    def test_invalid(self):
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        calc.with_inputs(is_long=True, entry_price=1.1, sl_price=1.095, tp_in_pips=100, position_size_in_lots=1).calculate()
+        calc.set_entry_price(1.09)
+        with pytest.raises(ValueError, match="Stop loss price must be lower than entry price in a long position."):
+            calc.calculate()
+        with pytest.raises(ValueError, match="Stop loss price must be lower than entry price in a long position."):
+            calc.calculate()
+
+        calc.set_entry_price(1.1)
+        calc.calculate()
+        assert calc.get_result()["rr_in_pips"]["sl_in_pips"] == Decimal("50.0")
@@ -237,3 +237,59 @@ class TestSetSlWithCommissionInMoney:
         calc = CalculatorBase()
         with pytest.raises(ValueError, match="Stop loss with commission in money must be non-negative."):
             calc.set_sl_with_commission_in_money(-1)
+
+
+class TestReset:
+    def test_valid(self):
+        calc = CalculatorBase()
+        calc.set_symbol("EURUSD")
+        calc.set_target_currency("EUR")
+        calc.set_commission_per_lot_in_money(7)
+        calc.set_is_long(True)
+        calc.set_entry_price(1.1000)
+        calc.set_sl_in_pips(50)
+        calc.reset()
+        assert calc._symbol.get_symbol() == "EURUSD"
+        assert calc._target_currency == "EUR"
+        assert calc._commission_per_lot_in_money == Decimal("7")
+        assert calc._is_long is None
+        assert calc._entry_price is None
+        assert calc._sl_in_pips is None
+        calc.with_inputs(symbol="EUR/USD", is_long=True)
+        assert calc._symbol.get_symbol() == "EURUSD"
+
+
+class TestWithInputs:
+    def test_valid(self):
+        calc = CalculatorBase()
+        assert calc.with_inputs(symbol="EURUSD", is_long=True, entry_price=1.1, sl_in_pips=50) is calc
+        assert calc._entry_price == Decimal("1.10000")
+        calc.with_inputs(is_long=False, sl_price=1.1050)
+        assert calc._is_long is False
+        assert calc._entry_price is None
+        assert calc._sl_price == Decimal("1.10500")
+        assert calc._sl_in_pips is None
+
+    def test_invalid(self):
+        calc = CalculatorBase()
+        with pytest.raises(ValueError, match="Unknown input 'stop_loss'."):
+            calc.with_inputs(symbol="EURUSD", stop_loss=50)
+        with pytest.raises(ValueError, match="Symbol 'GBPUSD' does not match the calculator symbol 'EURUSD'."):
+            calc.with_inputs(symbol="GBPUSD")
+        with pytest.raises(TypeError, match="Symbol must be a string or a Symbol object."):
+            calc.with_inputs(symbol=1)
+
+
+class TestClone:
+    def test_valid(self):
+        calc = CalculatorBase()
+        calc.set_symbol("EURUSD")
+        calc.set_exchange_rate({"symbol": "EURUSD", "rate": 1.1})
+        calc.set_entry_price(1.1000)
+        clone = calc.clone()
+        assert clone is not calc
+        assert clone._symbol is calc._symbol
+        assert clone._entry_price == Decimal("1.10000")
+        assert clone._result is not calc._result
+        clone.set_exchange_rate({"symbol": "EURUSD", "rate": 1.2})
+        assert calc._exchange_rate["rate"] == Decimal("1.1")
@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+import pytest
+from decimal import Decimal
+from src.fxplan.cli import PlanProcessor, main, read_csv_plans, read_ndjson_plans, run_batch
+
+CSV_PLANS = """symbol,is_long,entry_price,sl_in_pips,tp_in_pips,sl_in_money,position_size_in_lots,commission_per_lot_in_money
+EURUSD,true,1.17968,50,100,500,,
+GBPJPY,sell,190.123,35.5,100,,1.5,7
+EURUSD,maybe,1.17968,50,100,500,,
+EURUSD,buy,1.17968,50,100,500,,,extra
+EURUSD,buy,1.17968,50,100,500,,
+"""
+
+
+class TestBatch:
+    def test_valid(self, tmp_path, capsys):
+        source = tmp_path / "plans.csv"
+        source.write_text(CSV_PLANS)
+        output = tmp_path / "results.ndjson"
+        assert main(["batch", str(source), "-o", str(output), "--rate", "USDJPY=158.968", "--chunk-size", "2"]) == 0
+
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [record["row"] for record in records] == [1, 2, 3, 4, 5]
+        assert records[0]["result"]["position_size_in_lots"] == "1.00"
+        assert records[1]["result"]["is_long"] is False
+        assert records[1]["result"]["commission_in_money"] == "10.50"
+        assert records[2] == {"row": 3, "error": "Is long must be a boolean."}
+        assert records[3] == {"row": 4, "error": "Row has more values than the header."}
+        assert records[4]["result"]["commission_per_lot_in_money"] == "0"
+        assert "Calculated 5 plans (2 errors)" in capsys.readouterr().err
+
+        output = tmp_path / "results.csv"
+        assert main(["batch", str(source), "-o", str(output), "--quiet"]) == 0
+        rows = list(csv.DictReader(output.open()))
+        assert rows[0]["rrr"] == "2.00"
+        assert rows[1]["error"] == "Exchange rate of 'JPYUSD' or 'USDJPY' is required."
+        assert capsys.readouterr().err == ""
+
+    def test_row_settings(self, tmp_path):
+        plan = {"is_long": True, "sl_in_pips": 50, "tp_in_pips": 100, "sl_in_money": 100}
+        rows = [
+            {"symbol": "EURUSD", "entry_price": 1.1, **plan, "target_currency": "EUR"},
+            {"symbol": "EURUSD", "entry_price": 1.1, **plan},
+            {"symbol": "GBPJPY", "entry_price": 190.123, **plan, "sl_in_pips": 10, "sl_in_money": 150, "exchange_rate": {"symbol": "USDJPY", "rate": 100}},
+            {"symbol": "GBPJPY", "entry_price": 190.123, **plan, "sl_in_pips": 10, "sl_in_money": 150},
+        ]
+        source = tmp_path / "plans.ndjson"
+        source.write_text("".join(json.dumps(row) + "\n" for row in rows))
+        output = tmp_path / "results.ndjson"
+        assert main(["batch", str(source), "-o", str(output), "--rate", "USDJPY=150", "--rate", "EURUSD=1.1", "--quiet"]) == 0
+
+        results = [json.loads(line)["result"] for line in output.read_text().splitlines()]
+        assert [result["target_currency"] for result in results] == ["EUR", "USD", "USD", "USD"]
+        assert [result["position_size_in_lots"] for result in results] == ["0.22", "0.20", "1.50", "2.25"]
+        assert results[3]["exchange_rate"]["symbol"] == "JPYUSD"
+
+    def test_ndjson(self):
+        lines = io.StringIO('{"is_long": true, "entry_price": 1.1, "sl_in_pips": 50, "tp_in_pips": 100, "sl_in_money": 100.1}\n\n[1]\n{\n')
+        output = io.StringIO()
+        stats = run_batch(read_ndjson_plans(lines), PlanProcessor(symbol="EURUSD"), output)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert records[0]["result"]["rr_in_money"]["sl_in_money"] == "100.00"
+        assert records[1:] == [{"row": 3, "error": "Plan must be a JSON object."}, {"row": 4, "error": "Line is not valid JSON."}]
+        assert stats["rows"] == 3 and stats["errors"] == 2
+        assert list(read_csv_plans(io.StringIO("entry_price,sl_price\n1.1,\n"))) == [(1, {"entry_price": "1.1"})]
+
+    def test_invalid(self, tmp_path):
+        with pytest.raises(ValueError, match="Symbol is required."):
+            PlanProcessor().process({"entry_price": Decimal("1.1")})
+        with pytest.raises(ValueError, match="Chunk size must be positive."):
+            run_batch([], PlanProcessor(), io.StringIO(), chunk_size=0)
+        with pytest.raises(SystemExit):
+            main(["batch", str(tmp_path / "plans.txt")])
+        with pytest.raises(SystemExit):
+            main(["batch", "-", "--rate", "USDJPY"])
@@ -0,0 +1,91 @@
+import asyncio
+import io
+import json
+import threading
+import pytest
+from decimal import Decimal
+import src.fxplan as fxplan
+from src.fxplan.cli import PlanProcessor
+from src.fxplan.client import build_request, main
+from src.fxplan.rates import RateBook
+from src.fxplan.server import PricingServer
+
+PLAN = {"symbol": "GBPJPY", "is_long": True, "entry_price": 190.123, "sl_in_pips": 35.5, "tp_in_pips": 100, "sl_in_money": 250}
+
+
+class _Daemon:
+    def __init__(self, path: str) -> None:
+        self._server = PricingServer(PlanProcessor(rate_book=RateBook({"USDJPY": "158.968"})), batch_window=0)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._server.start_unix(path), self._loop).result()
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._server.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class TestClient:
+    def test_valid(self, tmp_path, capsys, monkeypatch):
+        path = str(tmp_path / "fxplan.sock")
+        daemon = _Daemon(path)
+        try:
+            assert main(["-s", path, json.dumps(PLAN)]) == 0
+            single = json.loads(capsys.readouterr().out)
+
+            assert main(["--socket", path, "symbol=GBPJPY", "is_long=TRUE", "entry_price=190.123", "sl_in_pips=35.5", "tp_in_pips=100", "sl_in_money=250"]) == 0
+            assert json.loads(capsys.readouterr().out) == single
+
+            monkeypatch.setenv("FXPLAN_SOCKET", path)
+            assert main([json.dumps({**PLAN, "symbol": "EURGBP", "entry_price": 0.85})]) == 1
+            assert json.loads(capsys.readouterr().out) == {"error": "Exchange rate of 'GBPUSD' or 'USDGBP' is required."}
+        finally:
+            daemon.close()
+
+        assert single["result"]["position_size_in_lots"] == "1.11"
+
+    def test_plan_settings(self, tmp_path, capsys):
+        path = str(tmp_path / "fxplan.sock")
+        daemon = _Daemon(path)
+        try:
+            outputs = []
+            for request in [
+                {**PLAN, "exchange_rate": {"symbol": "USDJPY", "rate": 100}},
+                PLAN,
+                {"command": "rates", "rates": {"USDJPY": "150"}},
+                PLAN,
+            ]:
+                assert main(["-s", path, json.dumps(request)]) == 0
+                outputs.append(json.loads(capsys.readouterr().out))
+        finally:
+            daemon.close()
+
+        assert outputs[0]["result"]["exchange_rate"] == {"symbol": "USDJPY", "rate": "100"}
+        assert outputs[1]["result"]["position_size_in_lots"] == "1.11"
+        assert outputs[2] == {"version": 2}
+        assert outputs[3]["result"]["exchange_rate"]["rate"] == str(1 / Decimal(150))
+        assert outputs[3]["result"]["position_size_in_lots"] == "1.05"
+
+    def test_build_request(self, monkeypatch):
+        assert build_request(["symbol=EURUSD", "is_long=false", "entry_price=1.1"]) == b'{"symbol":"EURUSD","is_long":false,"entry_price":"1.1"}\n'
+        assert build_request(['{\n"symbol": "EURUSD"\n}']) == b'{"symbol":"EURUSD"}\n'
+
+        monkeypatch.setattr("sys.stdin", io.StringIO('{"command": "stats"}\n'))
+        assert build_request([]) == b'{"command": "stats"}\n'
+
+    def test_lazy_exports(self):
+        assert "Calculator" in dir(fxplan)
+        assert fxplan.Calculator.__name__ == "Calculator"
+        with pytest.raises(AttributeError):
+            fxplan.Unknown
+
+    def test_invalid(self, tmp_path, capsys):
+        with pytest.raises(ValueError, match="Input 'symbol' must be in the format of NAME=VALUE."):
+            build_request(["symbol"])
+
+        assert main(["-s", str(tmp_path / "missing.sock"), json.dumps(PLAN)]) == 2
+        assert "fxplan-client: error:" in capsys.readouterr().err
+        assert main(["-s"]) == 2
@@ -0,0 +1,39 @@
+import pytest
+from decimal import Decimal
+from src.fxplan.converter import CurrencyConverter, get_converter, resolve_exchange_direction
+
+
+class TestGetConverter:
+    def test_valid(self):
+        to_usd = get_converter("EUR/usd", Decimal("1.21868"), "EUR", "USD")
+        assert to_usd.convert(Decimal("100")) == Decimal("121.868")
+        assert to_usd.get_factor() == Decimal("1.21868")
+        to_gbp = get_converter("GBPJPY", "205.868", "JPY", "GBP")
+        assert to_gbp.convert(Decimal("20586.8")) == Decimal("100")
+        assert get_converter("GBPJPY", "205.868", "JPY", "GBP") is to_gbp
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Exchange rate must be positive."):
+            get_converter("EURUSD", "0", "EUR", "USD")
+        with pytest.raises(ValueError, match="Exchange symbol must contain different base and quote currencies."):
+            get_converter("USDUSD", "1", "USD", "USD")
+        with pytest.raises(ValueError, match="Exchange symbol 'EURUSD' does not convert 'GBP' to 'USD'."):
+            get_converter("EURUSD", "1.1", "GBP", "USD")
+        with pytest.raises(TypeError):
+            get_converter("EURUSD", None, "EUR", "USD")
+
+
+class TestResolveExchangeDirection:
+    def test_valid(self):
+        assert resolve_exchange_direction("EURUSD", "EUR", "USD") is True
+        assert resolve_exchange_direction("EURUSD", "USD", "EUR") is False
+
+
+class TestInverse:
+    def test_valid(self):
+        converter = CurrencyConverter("GBP", "EUR", ((Decimal("1.5"), True), (Decimal("1.25"), False)))
+        inverse = converter.inverse()
+        assert inverse.get_source_currency() == "EUR"
+        assert inverse.get_target_currency() == "GBP"
+        assert inverse.get_steps() == ((Decimal("1.25"), True), (Decimal("1.5"), False))
+        assert inverse.convert(converter.convert(Decimal("100"))) == Decimal("100")
@@ -0,0 +1,80 @@
+import pytest
+from decimal import Decimal, InvalidOperation
+from src.fxplan.fanout import Account, fan_out
+from src.fxplan.plan import TradePlan, compute
+from src.fxplan.rates import RateBook
+
+
+class TestAccount:
+    def test_valid(self):
+        account = Account("acc-1", balance="12345.67", risk_in_percent="1.5", currency="eur")
+        assert account.currency == "EUR"
+        assert account.balance == Decimal("12345.67")
+        assert account.get_risk_in_money() == Decimal("185.18505")
+        assert Account("acc-2", balance=1000, risk_in_money=25).get_risk_in_money() == Decimal(25)
+        assert Account.from_dict({"account_id": 1, "balance": 100, "risk_in_money": 1}) == Account(1, 100, risk_in_money=1)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Balance must be positive."):
+            Account(1, balance=0, risk_in_percent=1)
+        with pytest.raises(ValueError, match="Only one of the risk in money or risk in percent is set."):
+            Account(1, balance=100)
+        with pytest.raises(ValueError, match="Only one of the risk in money or risk in percent is set."):
+            Account(1, balance=100, risk_in_percent=1, risk_in_money=1)
+        with pytest.raises(ValueError, match="Risk in percent must be positive."):
+            Account(1, balance=100, risk_in_percent=-1)
+        with pytest.raises(ValueError, match="Commission per lot in money must be non-negative."):
+            Account(1, balance=100, risk_in_money=1, commission_per_lot_in_money=-7)
+        with pytest.raises(ValueError, match="Unknown input 'leverage'."):
+            Account.from_dict({"account_id": 1, "balance": 100, "risk_in_money": 1, "leverage": 30})
+
+
+class TestFanOut:
+    def test_valid(self):
+        rates = RateBook({"USDJPY": "158.968", "EURUSD": "1.0876", "GBPUSD": "1.2712"})
+        plan = TradePlan("GBPJPY", True, "190.123", sl_in_pips="35.5", tp_in_pips=100)
+        accounts = [
+            Account(index, balance=balance, risk_in_percent=risk, currency=currency, commission_per_lot_in_money=commission, risk_includes_commission=includes)
+            for index, (balance, risk, currency, commission, includes) in enumerate([
+                (10000, 1, "USD", 0, False),
+                ("2500.50", "0.5", "EUR", 7, True),
+                (1000000, 2, "JPY", "3.5", False),
+                (50000, "0.75", "GBP", 7, False),
+                (80000, 1, "JPY", 0, True),
+                (123456, "1.25", "USD", 7, True),
+            ])
+        ]
+
+        outputs = fan_out(plan, accounts, rates)
+        assert [output.account_id for output in outputs] == list(range(len(accounts)))
+        for account, output in zip(accounts, outputs):
+            risk = {"sl_with_commission_in_money" if account.risk_includes_commission else "sl_in_money": account.get_risk_in_money()}
+            expected = compute(
+                TradePlan("GBPJPY", True, "190.123", sl_in_pips="35.5", tp_in_pips=100, target_currency=account.currency,
+                          commission_per_lot_in_money=account.commission_per_lot_in_money, **risk),
+                rates,
+            )
+            assert output.error is None
+            assert output.result.get_values() == tuple(expected)
+
+    def test_too_small_risk(self):
+        plan = TradePlan("EURUSD", False, "1.17968", sl_in_pips=50, tp_in_pips=100)
+        outputs = fan_out(plan, [Account("small", balance=100, risk_in_percent=1), Account("large", balance=100000, risk_in_percent=1)])
+        assert outputs[0].result is None
+        assert outputs[0].error == "Risk is too small for the minimum position size."
+        assert outputs[1].result.get_result()["position_size_in_lots"] == Decimal("2")
+
+        with pytest.raises(InvalidOperation):
+            fan_out(plan, [Account("huge", balance="1e40", risk_in_percent=1)])
+
+    def test_invalid(self):
+        plan = TradePlan("GBPJPY", True, "190.123", sl_in_pips="35.5", tp_in_pips=100)
+        with pytest.raises(ValueError, match="Position size of a fanned-out plan is set by the accounts."):
+            fan_out(TradePlan("EURUSD", True, "1.1", sl_in_pips=10, tp_in_pips=10, sl_in_money=100), [])
+        with pytest.raises(TypeError, match="Plan must be a TradePlan object."):
+            fan_out({"symbol": "EURUSD"}, [])
+        with pytest.raises(TypeError, match="Account must be an Account object."):
+            fan_out(plan, [{"account_id": 1}], {"USDJPY": 150})
+
+        outputs = fan_out(plan, [Account(1, balance=1000, risk_in_money=10, currency="CHF")], {"USDJPY": 150})
+        assert outputs[0].error == "Exchange rate of 'JPYCHF' or 'CHFJPY' is required."
@@ -0,0 +1,71 @@
+import pytest
+from src.fxplan.calculator import Calculator
+from src.fxplan.instrumentation import Instrumentation, LatencyHistogram, normalize_error_message
+
+PLAN = {"is_long": True, "entry_price": 190, "sl_in_pips": 20, "tp_in_pips": 40, "position_size_in_lots": 1}
+
+
+class TestLatencyHistogram:
+    def test_valid(self):
+        histogram = LatencyHistogram([0.001, 0.01, 0.1])
+        for seconds in (0.0005, 0.001, 0.005, 0.05, 1):
+            histogram.observe(seconds)
+        assert histogram.get_count() == 5
+        assert histogram.get_buckets() == [(0.001, 2), (0.01, 3), (0.1, 4), (float("inf"), 5)]
+        assert histogram.get_quantile(0.4) == pytest.approx(0.001)
+        assert histogram.get_quantile(0.5) == pytest.approx(0.0055)
+        assert histogram.get_quantile(1) == 0.1
+        assert LatencyHistogram().get_quantile(0.99) is None
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Quantile must be between 0 and 1."):
+            LatencyHistogram().get_quantile(99)
+
+
+class TestInstrumentation:
+    def test_valid(self):
+        instrumentation = Instrumentation()
+        calc = Calculator()
+        calc.set_symbol("GBPJPY")
+        calc.set_target_currency("JPY")
+        calc.set_instrumentation(instrumentation)
+        for _ in range(10):
+            calc.with_inputs(**PLAN).calculate()
+
+        snapshot = instrumentation.get_snapshot()
+        assert snapshot["calculate"]["count"] == 10
+        assert list(snapshot["stages"]) == [stage.lstrip("_") for stage in Calculator._CALCULATION_STAGES]
+        assert all(stage["count"] == 10 for stage in snapshot["stages"].values())
+        assert snapshot["stages"]["validate"]["buckets"]["+Inf"] == 10
+        assert snapshot["errors"] == []
+        assert calc.get_result()["rrr"] == 2
+
+        text = instrumentation.get_prometheus_text()
+        assert "# TYPE fxplan_stage_duration_seconds histogram" in text
+        assert 'fxplan_stage_duration_seconds_count{stage="calculate_position_size"} 10' in text
+        assert 'fxplan_calculate_duration_seconds_bucket{le="+Inf"} 10' in text
+
+        instrumentation.reset()
+        calc.set_instrumentation(None)
+        calc.with_inputs(**PLAN).calculate()
+        assert instrumentation.get_snapshot()["calculate"]["count"] == 0
+
+    def test_invalid(self):
+        instrumentation = Instrumentation()
+        calc = Calculator()
+        calc.set_symbol("GBPJPY")
+        calc.set_instrumentation(instrumentation)
+        for _ in range(3):
+            with pytest.raises(ValueError, match="Exchange rate of 'JPYUSD' or 'USDJPY' is required."):
+                calc.with_inputs(**PLAN).calculate()
+
+        snapshot = instrumentation.get_snapshot()
+        assert snapshot["calculate"]["count"] == 3
+        assert snapshot["errors"] == [
+            {"stage": "validate", "error": "ValueError", "message": "Exchange rate of '*' or '*' is required.", "count": 3},
+        ]
+        assert 'fxplan_stage_errors_total{stage="validate",error="ValueError",message="Exchange rate of \'*\' or \'*\' is required."} 3' in instrumentation.get_prometheus_text()
+        assert normalize_error_message("Row 12: Symbol 'X' is duplicated.") == "Row N: Symbol '*' is duplicated."
+
+        with pytest.raises(TypeError, match="Instrumentation must be an Instrumentation object or None."):
+            calc.set_instrumentation({})
@@ -0,0 +1,75 @@
+import io
+import queue
+import threading
+import pytest
+from decimal import Decimal
+from src.fxplan.live import Quote, QueueQuoteSource, RepricingEngine, read_csv_quotes, read_ndjson_quotes
+from src.fxplan.plan import TradePlan, compute
+from src.fxplan.rates import RateBook
+
+GBPJPY_PLAN = TradePlan("GBPJPY", True, "190.123", sl_in_pips="35.5", tp_in_pips=100, sl_in_money=250, commission_per_lot_in_money=7)
+EURUSD_PLAN = TradePlan("EURUSD", False, "1.1", sl_in_pips=20, tp_in_pips=40, sl_in_money=100)
+
+
+class TestRepricingEngine:
+    def test_valid(self):
+        engine = RepricingEngine()
+        delta = engine.subscribe("gbpjpy", GBPJPY_PLAN, follow_entry=True)
+        assert delta.error == "Exchange rate of 'JPYUSD' or 'USDJPY' is required."
+        assert engine.get_result("gbpjpy") is None
+
+        delta = engine.subscribe("eurusd", EURUSD_PLAN)
+        assert delta.error is None
+        assert delta.changes["sl_in_money"] == (None, Decimal("100.00"))
+
+        deltas = engine.on_quote(Quote("USDJPY", "158.96", "158.976"))
+        assert [delta.plan_id for delta in deltas] == ["gbpjpy"]
+        expected = compute(GBPJPY_PLAN, RateBook({"USDJPY": "158.968"}))
+        assert deltas[0].result.get_values() == tuple(expected)
+
+        deltas = engine.on_quote(Quote("GBPJPY", "190.2", "190.22"))
+        assert [delta.plan_id for delta in deltas] == ["gbpjpy"]
+        assert set(deltas[0].changes) == {"entry_price", "sl_price", "tp_price"}
+        assert deltas[0].changes["entry_price"] == (Decimal("190.123"), Decimal("190.220"))
+
+        assert engine.on_quote(Quote("EURUSD", "1.2")) == []
+        assert engine.on_quote(Quote("USDJPY", "158.968")) == []
+
+        deltas = engine.on_quote(Quote("USDJPY", "140"))
+        assert deltas[0].changes["position_size_in_lots"] == (Decimal("1.11"), Decimal("0.98"))
+
+        engine.unsubscribe("gbpjpy")
+        assert engine.on_quote(Quote("USDJPY", "150")) == []
+        stats = engine.get_stats()
+        assert (stats["plans"], stats["quotes"], stats["repriced"], stats["deltas"], stats["errors"]) == (1, 6, 6, 5, 1)
+        assert stats["latency"]["count"] == 6
+
+    def test_sources(self):
+        engine = RepricingEngine(RateBook({"USDJPY": "150"}))
+        engine.subscribe(1, GBPJPY_PLAN, follow_entry=True)
+
+        csv_file = io.StringIO("symbol,bid,ask,time\nGBPJPY,190.5,190.52,1\nUSDJPY,151,,2\n")
+        assert [delta.plan_id for delta in engine.run(read_csv_quotes(csv_file))] == [1, 1]
+
+        ndjson_file = io.StringIO('{"symbol": "GBPJPY", "bid": 191.5, "ask": 191.52}\n\n')
+        assert [delta.result.get_values()[11] for delta in engine.run(read_ndjson_quotes(ndjson_file))] == [Decimal("191.520")]
+
+        quotes = queue.Queue()
+        thread = threading.Thread(target=lambda: [quotes.put(quote) for quote in (Quote("GBPJPY", "192", "192.02"), None)])
+        thread.start()
+        assert len(list(engine.run(QueueQuoteSource(quotes)))) == 1
+        thread.join()
+
+    def test_invalid(self):
+        engine = RepricingEngine()
+        engine.subscribe("eurusd", EURUSD_PLAN, follow_entry=True)
+        with pytest.raises(ValueError, match="Plan 'eurusd' is already subscribed."):
+            engine.subscribe("eurusd", EURUSD_PLAN)
+        with pytest.raises(TypeError, match="Plan must be a TradePlan object."):
+            engine.subscribe("other", {"symbol": "EURUSD"})
+        with pytest.raises(ValueError, match="Quote must have a positive bid that is not greater than the ask."):
+            engine.on_quote(Quote("EURUSD", "1.2", "1.1"))
+        with pytest.raises(ValueError, match="Plan 'other' is not subscribed."):
+            engine.unsubscribe("other")
+        with pytest.raises(TypeError, match="Rate book must be a RateBook object."):
+            RepricingEngine({"USDJPY": 150})
@@ -0,0 +1,52 @@
+import json
+import pytest
+from src.fxplan.cli import ChunkFormatter, PlanProcessor, iter_chunks, main
+from src.fxplan.parallel import ParallelExecutor
+from src.fxplan.rates import RateBook
+from src.fxplan.registry import default_registry
+from src.fxplan.specs import ContractSpecStore
+
+PLAN = {"is_long": True, "tp_in_pips": 100, "sl_in_money": 100}
+
+
+class TestParallelExecutor:
+    def test_valid(self):
+        plans = [(row, {**PLAN, "symbol": "US30" if row % 2 else "GBPJPY", "entry_price": 39000 if row % 2 else 190, "sl_in_pips": row}) for row in range(1, 41)]
+        formatter = ChunkFormatter(PlanProcessor(rate_book=RateBook({"USDJPY": 158.968})))
+        default_registry.set_spec_store(ContractSpecStore.from_records([{"symbol": "US30", "base_currency": "US30", "quote_currency": "USD", "lot_size": 1, "pip_size": 1, "digits": 1}]))
+        try:
+            expected = [formatter.process_chunk(chunk) for chunk in iter_chunks(plans, 3)]
+            with ParallelExecutor(formatter, workers=2, max_pending_chunks=3) as executor:
+                assert executor.get_workers() == 2
+                assert list(executor.map(iter_chunks(plans, 3))) == expected
+        finally:
+            default_registry.set_spec_store(None)
+
+        records = [json.loads(line) for text, _, _ in expected for line in text.splitlines()]
+        assert [record["row"] for record in records] == list(range(1, 41))
+        assert records[0]["result"]["lot_size"] == "1"
+
+    def test_batch_command(self, tmp_path):
+        source = tmp_path / "plans.ndjson"
+        source.write_text("".join(json.dumps({**PLAN, "entry_price": 1.1, "sl_in_pips": row % 50}) + "\n" for row in range(200)))
+        outputs = []
+        for workers in ("1", "3"):
+            output = tmp_path / f"results-{workers}.csv"
+            assert main(["batch", str(source), "-o", str(output), "--symbol", "EURUSD", "--chunk-size", "7", "-w", workers, "-q"]) == 0
+            outputs.append(output.read_text())
+        assert outputs[0] == outputs[1]
+        assert outputs[0].count("Stop loss in pips must be positive.") == 4
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Workers must be positive."):
+            ParallelExecutor(PlanProcessor(), workers=0)
+        with pytest.raises(TypeError, match="Processor must have a process_chunk method."):
+            ParallelExecutor(object(), workers=1)
+
+        executor = ParallelExecutor(PlanProcessor(), workers=1)
+        executor.close()
+        executor.close()
+        with pytest.raises(ValueError, match="Executor is closed."):
+            list(executor.map([]))
+        with pytest.raises(ValueError, match="Output format must be one of 'csv', 'ndjson'."):
+            ChunkFormatter(PlanProcessor(), "xml")
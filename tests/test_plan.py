@@ -0,0 +1,84 @@
+import dataclasses
+import decimal
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from src.fxplan.calculator import Calculator
+from src.fxplan.plan import PlanResult, TradePlan, compute
+from src.fxplan.rates import RateBook
+from src.fxplan.result import RESULT_FIELDS
+
+
+def _calculate(plan: dict, exchange_rate) -> tuple:
+    calc = Calculator()
+    calc.set_symbol("GBPJPY")
+    calc.set_target_currency(plan.pop("target_currency", "USD"))
+    calc.set_exchange_rate(exchange_rate)
+    calc.with_inputs(**plan).calculate()
+    return calc.get_result_record().get_values()
+
+
+class TestTradePlan:
+    def test_valid(self):
+        plan = TradePlan("gbp/jpy", True, 190.123, sl_in_pips=35.5, tp_in_pips="100", sl_in_money=250)
+        assert plan.symbol == "GBPJPY"
+        assert plan.entry_price == Decimal("190.123")
+        assert plan.commission_per_lot_in_money == Decimal(0)
+        assert plan == TradePlan("GBPJPY", True, "190.123", sl_in_pips="35.5", tp_in_pips=100, sl_in_money="250")
+        assert hash(plan) == hash(TradePlan.from_dict({"symbol": "GBPJPY", "is_long": True, "entry_price": "190.123", "sl_in_pips": 35.5, "tp_in_pips": 100, "sl_in_money": 250}))
+        assert plan.get_inputs() == {
+            "is_long": True, "entry_price": Decimal("190.123"), "sl_in_pips": Decimal("35.5"), "tp_in_pips": Decimal("100"),
+            "sl_in_money": Decimal("250"), "commission_per_lot_in_money": Decimal(0),
+        }
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            plan.entry_price = Decimal("191")
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Only one of the stop loss price, stop loss in pips or stop loss in points is set."):
+            TradePlan("EURUSD", True, 1.1, sl_price=1.09, sl_in_pips=10)
+        with pytest.raises(ValueError, match="Only one of the position size in lots, stop loss in money or stop loss with commission in money is set."):
+            TradePlan("EURUSD", True, 1.1, position_size_in_lots=1, sl_in_money=10)
+        with pytest.raises(TypeError, match="Symbol must be a string or a Symbol object."):
+            TradePlan(None, True, 1.1)
+        with pytest.raises(ValueError, match="Cannot convert value 'abc' to Decimal."):
+            TradePlan("EURUSD", True, "abc")
+        with pytest.raises(ValueError, match="Unknown input 'sl'."):
+            TradePlan.from_dict({"symbol": "EURUSD", "is_long": True, "entry_price": 1.1, "sl": 10})
+
+
+class TestCompute:
+    def test_valid(self):
+        inputs = {"is_long": False, "entry_price": "190.123", "sl_price": "190.5", "tp_in_points": 1000, "commission_per_lot_in_money": 7, "sl_with_commission_in_money": 250}
+        plan = TradePlan("GBPJPY", **inputs)
+        result = compute(plan, {"EURUSD": "1.1", "USDJPY": "158.968"})
+        assert isinstance(result, PlanResult)
+        assert result._fields == RESULT_FIELDS
+        assert result == _calculate(dict(inputs), {"symbol": "USDJPY", "rate": "158.968"})
+
+        cross = compute(TradePlan("GBPJPY", **inputs, target_currency="EUR"), {"EURUSD": "1.1", "USDJPY": "158.968"})
+        assert cross.target_currency == "EUR"
+        assert cross == _calculate({**inputs, "target_currency": "EUR"}, RateBook({"EURUSD": "1.1", "USDJPY": "158.968"}))
+
+    def test_thread_safety(self):
+        plans = [TradePlan("GBPJPY", row % 2 == 0, "190.123", sl_in_pips=10 + row, tp_in_pips=100, sl_in_money=100 + row) for row in range(200)]
+        rates = RateBook({"USDJPY": "158.968"})
+        expected = [compute(plan, rates) for plan in plans]
+
+        def compute_with_low_precision(plan: TradePlan) -> PlanResult:
+            decimal.getcontext().prec = 3
+            decimal.getcontext().rounding = decimal.ROUND_UP
+            return compute(plan, rates)
+
+        with ThreadPoolExecutor(8) as executor:
+            assert list(executor.map(compute_with_low_precision, plans)) == expected
+
+    def test_invalid(self):
+        plan = TradePlan("GBPJPY", True, 190.123, sl_in_pips=35.5, tp_in_pips=100, position_size_in_lots=1)
+        with pytest.raises(TypeError, match="Plan must be a TradePlan object."):
+            compute({"symbol": "GBPJPY"})
+        with pytest.raises(TypeError, match="Rates must be a dictionary or a RateBook object."):
+            compute(plan, [("USDJPY", 158.968)])
+        with pytest.raises(ValueError, match="Exchange rate of 'JPYUSD' or 'USDJPY' is required."):
+            compute(plan, {"EURUSD": 1.1})
+        with pytest.raises(ValueError, match="Exchange rate of 'JPYUSD' or 'USDJPY' is required."):
+            compute(plan)
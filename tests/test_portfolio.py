@@ -0,0 +1,76 @@
+import pytest
+from decimal import Decimal
+from src.fxplan.calculator import Calculator
+from src.fxplan.plan import TradePlan, compute
+from src.fxplan.portfolio import Portfolio
+from src.fxplan.rates import RateBook
+
+
+class TestPortfolio:
+    def test_valid(self):
+        portfolio = Portfolio({"EURUSD": "1.1", "USDJPY": 150, "GBPUSD": "1.25"}, reporting_currency="eur")
+        portfolio.add("eurusd", TradePlan("EURUSD", True, "1.1", sl_in_pips=20, tp_in_pips=40, position_size_in_lots=1, commission_per_lot_in_money=7))
+        result = portfolio.add("gbpjpy", TradePlan("GBPJPY", False, 190, sl_in_pips=50, tp_in_pips=100, position_size_in_lots="0.5"))
+        assert result.sl_price == Decimal("190.500")
+        assert len(portfolio) == 2
+        assert portfolio.get_reporting_currency() == "EUR"
+        assert portfolio.get_exposure() == {"EUR": Decimal(100000), "USD": Decimal(-110000), "GBP": Decimal(-50000), "JPY": Decimal(9500000)}
+        assert portfolio.get_exposure_in_reporting_currency()["USD"] == Decimal("-100000.00")
+        assert portfolio.get_risk_by_symbol() == {"EURUSD": Decimal("188.18"), "GBPJPY": Decimal("151.52")}
+        assert portfolio.get_total_risk() == Decimal("339.70")
+
+        portfolio.set_rate("USDJPY", 100)
+        assert portfolio.get_risk_by_symbol()["GBPJPY"] == Decimal("227.27")
+        assert portfolio.get_total_risk() == Decimal("415.45")
+
+        portfolio.update("eurusd", TradePlan("EURUSD", False, "1.1", sl_in_pips=20, tp_in_pips=40, position_size_in_lots=2))
+        assert portfolio.get_exposure()["EUR"] == Decimal(-200000)
+        assert portfolio.get_risk_by_symbol()["EURUSD"] == Decimal("363.64")
+
+        portfolio.remove("gbpjpy")
+        assert portfolio.get_exposure() == {"EUR": Decimal(-200000), "USD": Decimal(220000)}
+        assert portfolio.get_risk_by_symbol() == {"EURUSD": Decimal("363.64")}
+        assert portfolio.verify()
+
+    def test_incremental_matches_recalculation(self):
+        book = RateBook({"USDJPY": "158.968", "EURUSD": "1.0876", "GBPUSD": "1.2712"})
+        portfolio = Portfolio(book, reporting_currency="GBP")
+        calc = Calculator()
+        calc.set_symbol("EURUSD")
+        calc.with_inputs(is_long=True, entry_price="1.0876", sl_in_pips=15, tp_in_pips=30, sl_in_money=300).calculate()
+        portfolio.add("record", calc.get_result_record())
+        portfolio.add("result", compute(TradePlan("USDJPY", False, "158.968", sl_in_pips=30, tp_in_pips=60, sl_in_money=500), book))
+        for index in range(20):
+            plan = TradePlan("GBPJPY", index % 2 == 0, "190.123", sl_in_pips=10 + index, tp_in_pips=50, sl_with_commission_in_money=400,
+                             commission_per_lot_in_money=7, target_currency=("USD", "EUR", "JPY")[index % 3])
+            portfolio.add(index, plan)
+            if index % 3 == 0:
+                portfolio.set_rate("USDJPY", Decimal("158.968") + index)
+            if index % 4 == 0:
+                portfolio.remove(index)
+        book.set_rate("EURUSD", "1.09")
+
+        assert portfolio.verify()
+        assert portfolio.recalculate().get_snapshot() == portfolio.get_snapshot()
+        assert portfolio.get_snapshot()["plans"] == 17
+
+    def test_invalid(self):
+        portfolio = Portfolio({"EURUSD": "1.1"})
+        plan = TradePlan("EURUSD", True, "1.1", sl_in_pips=20, tp_in_pips=40, position_size_in_lots=1)
+        portfolio.add(1, plan)
+        with pytest.raises(ValueError, match="Plan '1' is already in the portfolio."):
+            portfolio.add(1, plan)
+        with pytest.raises(ValueError, match="Plan '2' is not in the portfolio."):
+            portfolio.remove(2)
+        with pytest.raises(ValueError, match="Plan '2' is not in the portfolio."):
+            portfolio.update(2, plan)
+        with pytest.raises(TypeError, match="Plan must be a TradePlan, PlanResult or Result object."):
+            portfolio.add(2, {"symbol": "EURUSD"})
+        with pytest.raises(TypeError, match="Rates must be a dictionary or a RateBook object."):
+            Portfolio([("USDJPY", 150)])
+
+        portfolio = Portfolio(reporting_currency="EUR")
+        with pytest.raises(ValueError, match="Exchange rate of 'USDEUR' or 'EURUSD' is required."):
+            portfolio.add(1, plan)
+        assert len(portfolio) == 0
+        assert portfolio.verify()
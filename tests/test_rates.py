@@ -0,0 +1,86 @@
+import pytest
+from decimal import Decimal
+from src.fxplan.rates import RateBook
+from src.fxplan.calculator import Calculator
+
+
+class TestUpdate:
+    def test_valid(self):
+        book = RateBook({"EURUSD": 1.1, "usd/jpy": "150.000"})
+        assert book.get_version() == 1
+        assert book.get_rate("USDJPY") == Decimal("150.000")
+        book.set_rate("EURUSD", 1.2)
+        assert book.get_version() == 2
+        assert book.get_rate("EURUSD") == Decimal("1.2")
+
+    def test_invalid(self):
+        book = RateBook()
+        with pytest.raises(TypeError, match="Rates must be a dictionary."):
+            book.update(None)
+        with pytest.raises(ValueError, match="Exchange rate of 'EURUSD' must be positive."):
+            book.set_rate("EURUSD", 0)
+        with pytest.raises(ValueError, match="Exchange symbol must contain different base and quote currencies."):
+            book.set_rate("USDUSD", 1)
+
+
+class TestConvert:
+    def test_valid(self):
+        book = RateBook({"EURUSD": "1.25", "USDJPY": "150", "GBPUSD": "1.5"})
+        assert book.convert(Decimal("100"), "EUR", "USD") == Decimal("125.00")
+        assert book.convert(Decimal("150"), "JPY", "USD") == Decimal("1")
+        assert book.convert(Decimal("100"), "EUR", "JPY") == Decimal("18750.00")
+        assert book.get_conversion_path("GBP", "EUR") == (("GBPUSD", Decimal("1.5"), True), ("EURUSD", Decimal("1.25"), False))
+        assert book.get_factor("GBP", "EUR") == Decimal("1.2")
+        assert book.get_factor("USD", "USD") == Decimal("1")
+        book.set_rate("GBPUSD", "1.25")
+        assert book.get_factor("GBP", "EUR") == Decimal("1")
+
+    def test_invalid(self):
+        book = RateBook({"EURUSD": "1.25"}, pivot_currency="EUR")
+        assert not book.has_path("JPY", "USD")
+        with pytest.raises(ValueError, match="Exchange rate of 'JPYUSD' or 'USDJPY' is required."):
+            book.convert(Decimal("1"), "JPY", "USD")
+
+
+class TestCalculatorWithRateBook:
+    def test_valid(self):
+        book = RateBook({"USDJPY": "158.968", "EURUSD": "1.17968", "GBPUSD": "1.27"})
+        for symbol, exchange_rate in (("GBPJPY", {"symbol": "USDJPY", "rate": "158.968"}), ("EURGBP", {"symbol": "GBPUSD", "rate": "1.27"})):
+            results = []
+            for rates in (exchange_rate, book):
+                calc = Calculator()
+                calc.set_symbol(symbol)
+                calc.set_exchange_rate(rates)
+                calc.set_is_long(True)
+                calc.set_entry_price(150)
+                calc.set_sl_in_pips(50)
+                calc.set_tp_in_pips(100)
+                calc.set_commission_per_lot_in_money(7)
+                calc.set_sl_with_commission_in_money(500)
+                calc.calculate()
+                results.append(calc.get_result())
+            assert results[0]["position_size_in_lots"] == results[1]["position_size_in_lots"]
+            assert results[0]["rr_in_money"] == results[1]["rr_in_money"]
+
+        calc = Calculator()
+        calc.set_symbol("EURJPY")
+        calc.set_target_currency("GBP")
+        calc.set_exchange_rate(book)
+        calc.set_is_long(False)
+        calc.set_entry_price(160)
+        calc.set_sl_in_pips(100)
+        calc.set_tp_in_pips(100)
+        calc.set_position_size_in_lots(1)
+        calc.calculate()
+        result = calc.get_result()
+        assert result["exchange_rate"]["symbol"] == "JPYGBP"
+        assert result["rr_in_money"]["sl_in_money"] == Decimal("495.32")
+
+    def test_invalid(self):
+        calc = Calculator()
+        calc.set_symbol("EURJPY")
+        calc.set_exchange_rate(RateBook({"EURUSD": "1.1"}))
+        calc.set_is_long(True)
+        calc.set_entry_price(160)
+        with pytest.raises(ValueError, match="Exchange rate of 'JPYUSD' or 'USDJPY' is required."):
+            calc.calculate()
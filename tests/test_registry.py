@@ -0,0 +1,67 @@
+import pytest
+from decimal import Decimal
+from src.fxplan.cache import ResultCache
+from src.fxplan.calculator import Calculator
+from src.fxplan.calculator_base import CalculatorBase
+from src.fxplan.registry import SymbolRegistry, default_registry
+from src.fxplan.result import ResultStore
+
+
+class TestGet:
+    def test_valid(self):
+        registry = SymbolRegistry()
+        symbol = registry.get("eur/usd")
+        assert symbol.get_symbol() == "EURUSD"
+        assert symbol.is_frozen()
+        assert registry.get("EURUSD") is symbol
+        assert registry.get("Eur-Usd") is symbol
+        assert "eur/usd" in registry
+        assert len(registry) == 1
+        assert list(registry._symbols) == ["EURUSD"]
+
+    def test_invalid(self):
+        registry = SymbolRegistry()
+        with pytest.raises(TypeError, match="Symbol must be a string."):
+            registry.get(None)
+        with pytest.raises(ValueError, match="Symbol must contain only 6 letters."):
+            registry.get("EURUS")
+        with pytest.raises(ValueError, match="Symbol is frozen and cannot be modified."):
+            registry.get("EURUSD").set_lot_size(1000)
+
+
+class TestClear:
+    def test_valid(self):
+        registry = SymbolRegistry()
+        symbol = registry.get("EURUSD")
+        registry.clear()
+        assert len(registry) == 0
+        assert registry.get("EURUSD") is not symbol
+
+
+class TestSharedByCalculators:
+    def test_valid(self):
+        calc1 = CalculatorBase()
+        calc1.set_symbol("usdjpy")
+        calc2 = CalculatorBase()
+        calc2.set_symbol("USD/JPY")
+        assert calc1._symbol is calc2._symbol
+        assert calc1._symbol.get_price_precision() == Decimal("0.001")
+        with pytest.raises(ValueError, match="Symbol is frozen and cannot be modified."):
+            calc1._symbol.set_lot_size(1000)
+
+
+class TestSymbolName:
+    def test_valid(self):
+        cache = ResultCache()
+        results = []
+        for name in ("eur/usd", "EURUSD"):
+            calc = Calculator()
+            calc.set_cache(cache)
+            calc.set_symbol(name)
+            calc.with_inputs(is_long=True, entry_price="1.1", sl_in_pips=10, tp_in_pips=20, position_size_in_lots=1)
+            calc.calculate()
+            assert calc._symbol is default_registry.get(name)
+            results.append(calc.get_result_record())
+
+        assert [result.get_result()["symbol"] for result in results] == ["eur/usd", "EURUSD"]
+        assert [result.get_values()[0] for result in ResultStore(results)] == ["eur/usd", "EURUSD"]
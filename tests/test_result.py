@@ -1,6 +1,6 @@
 import pytest
 from decimal import Decimal
-from src.fxplan.result import Result
+from src.fxplan.result import RESULT_FIELDS, Result, ResultStore
 from src.fxplan.calculator import Calculator
 
 
@@ -24,6 +24,20 @@ class TestGetResult:
         assert result["target_currency"] == "USD"
         assert result["rrr"] == Decimal("2.00")
 
+        result["rrr"] = None
+        result["exchange_rate"]["rate"] = Decimal(1)
+        assert type(result) is dict
+        assert calc.get_result() is result
+
+    def test_shared(self):
+        record = _mock_calculator_state().get_result_record()
+        record.share()
+        result = record.get_result()
+        result["rr_in_pips"]["sl_in_pips"] = None
+        assert type(result) is dict
+        assert record.get_result()["rr_in_pips"]["sl_in_pips"] == Decimal("50.0")
+        assert record.get_result() is not record.get_result()
+
     def test_invalid(self):
         calc = Calculator()
         with pytest.raises(AttributeError):
@@ -43,3 +57,37 @@ class TestGetResultAsJson:
             calc.get_result_as_json(convert_numbers_to="int")
         with pytest.raises(ValueError, match="Numbers can be converted to 'string' or 'float' only."):
             calc.get_result_as_json(convert_numbers_to="str")
+
+
+class TestResultStore:
+    def test_valid(self):
+        calc = Calculator()
+        calc.set_symbol("GBPJPY")
+        calc.set_exchange_rate({"symbol": "USDJPY", "rate": "158.968"})
+        calc.set_commission_per_lot_in_money(7)
+        store = ResultStore()
+        records = []
+        for sl_in_pips in range(10, 20):
+            calc.with_inputs(is_long=True, entry_price=190.123, sl_in_pips=sl_in_pips, tp_in_pips=100, sl_with_commission_in_money=250).calculate()
+            records.append(calc.get_result_record())
+            store.append(records[-1])
+
+        assert len(store) == 10
+        assert [record.get_result() for record in store] == [record.get_result() for record in records]
+        assert store[-1].get_result_as_json() == records[-1].get_result_as_json()
+        assert store.get_column("sl_in_money") == [record.get_result()["rr_in_money"]["sl_in_money"] for record in records]
+        assert store.get_column("exchange_rate_symbol") == ["USDJPY"] * 10
+        assert store.get_column("exchange_rate") == [Decimal("158.968")] * 10
+        assert dict(zip(RESULT_FIELDS, records[0].get_values()))["rrr"] == records[0].get_result()["rrr"]
+        assert not hasattr(calc, "__dict__") and not hasattr(records[0], "__dict__")
+
+    def test_invalid(self):
+        store = ResultStore()
+        with pytest.raises(TypeError, match="Result must be a Result object."):
+            store.append({})
+        with pytest.raises(AttributeError, match="Result is not calculated yet."):
+            store.append(Result())
+        with pytest.raises(IndexError, match="Result index is out of range."):
+            store[0]
+        with pytest.raises(ValueError, match="Field 'sl' is not a result field."):
+            store.get_column("sl")
@@ -0,0 +1,78 @@
+import io
+import json
+import pytest
+from src.fxplan import serialization
+from src.fxplan.calculator import Calculator
+from src.fxplan.serialization import ResultWriter, dumps, get_json_backend, set_json_backend
+
+PLAN = {"is_long": False, "entry_price": "1.17968", "sl_in_pips": 50, "tp_in_pips": 100, "sl_in_money": 500}
+
+
+def get_result_record():
+    calc = Calculator()
+    calc.set_symbol("EURUSD")
+    calc.with_inputs(**PLAN).calculate()
+    return calc.get_result_record()
+
+
+class TestSerialization:
+    def test_valid(self):
+        backend = get_json_backend()
+        try:
+            for name in ("json", "orjson") if serialization.orjson is not None else ("json",):
+                set_json_backend(name)
+                assert get_json_backend() == name
+                assert dumps({"a": [1, "2"], "b": None}) == '{"a":[1,"2"],"b":null}'
+                assert dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+        finally:
+            set_json_backend(backend)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="JSON backend can be 'json' or 'orjson' only."):
+            set_json_backend("ujson")
+
+        if serialization.orjson is None:
+            with pytest.raises(ValueError, match="JSON backend 'orjson' is not installed."):
+                set_json_backend("orjson")
+
+
+class TestResultWriter:
+    def test_valid(self):
+        record = get_result_record()
+        expected = json.loads(record.get_result_as_json())
+        assert json.loads(record.get_result_as_json(indent=None)) == expected
+        assert "\n" not in record.get_result_as_json(indent=None)
+        assert record.get_serializable_result("float")["rrr"] == 2.0
+        assert record.get_serializable_result()["rr_in_money"]["sl_in_money"] == "500.00"
+
+        text = io.StringIO()
+        with ResultWriter(text) as writer:
+            assert writer.write_many([record, record]) == 2
+        lines = text.getvalue().splitlines()
+        assert len(lines) == 2
+        assert [json.loads(line) for line in lines] == [expected, expected]
+
+        binary = io.BytesIO()
+        with ResultWriter(binary, convert_numbers_to="float", array=True) as writer:
+            writer.write(record)
+            writer.write(record)
+            assert writer.get_count() == 2
+        assert json.loads(binary.getvalue()) == [json.loads(record.get_result_as_json("float"))] * 2
+
+        empty = io.StringIO()
+        ResultWriter(empty, array=True).close()
+        assert empty.getvalue() == "[]"
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Numbers can be converted to 'string' or 'float' only."):
+            ResultWriter(io.StringIO(), convert_numbers_to="int")
+        with pytest.raises(ValueError, match="Numbers can be converted to 'string' or 'float' only."):
+            get_result_record().get_serializable_result("int")
+
+        writer = ResultWriter(io.StringIO())
+        with pytest.raises(TypeError, match="Result must be a Result object."):
+            writer.write({"rrr": "2.00"})
+
+        writer.close()
+        with pytest.raises(ValueError, match="Writer is closed."):
+            writer.write(get_result_record())
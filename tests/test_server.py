@@ -0,0 +1,243 @@
+import asyncio
+import json
+import os
+import socket
+import pytest
+from decimal import Decimal
+from src.fxplan.cli import PlanProcessor
+from src.fxplan.rates import RateBook
+from src.fxplan.server import MicroBatcher, PricingServer
+
+PLAN = {"symbol": "GBPJPY", "is_long": True, "entry_price": 190.123, "sl_in_pips": 35.5, "tp_in_pips": 100, "sl_in_money": 250}
+
+
+async def _request(port: int, method: str, path: str, body: bytes = b"") -> tuple:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+async def _send_lines(path: str, lines: list) -> list:
+    reader, writer = await asyncio.open_unix_connection(path)
+    responses = []
+    for line in lines:
+        writer.write(line + b"\n")
+        await writer.drain()
+        responses.append(json.loads(await reader.readline()))
+    writer.close()
+    return responses
+
+
+def _run(server: PricingServer, client) -> object:
+    async def main():
+        listener = await server.start("127.0.0.1", 0)
+        try:
+            return await client(listener.sockets[0].getsockname()[1])
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestPricingServer:
+    def test_valid(self):
+        server = PricingServer(PlanProcessor(rate_book=RateBook({"USDJPY": "158.968"})), batch_window=0.05)
+
+        async def client(port):
+            single = _request(port, "POST", "/calculate", json.dumps(PLAN).encode())
+            many = _request(port, "POST", "/calculate", json.dumps([PLAN, {**PLAN, "symbol": "EURUSD", "entry_price": 1.1}, 1]).encode())
+            responses = await asyncio.gather(single, many, *(_request(port, "POST", "/calculate", json.dumps(PLAN).encode()) for _ in range(8)))
+            return responses, await _request(port, "GET", "/stats")
+
+        responses, (status, stats) = _run(server, client)
+        assert responses[0] == (200, {"result": responses[2][1]["result"]})
+        assert responses[0][1]["result"]["position_size_in_lots"] == "1.11"
+        status_many, outputs = responses[1]
+        assert status_many == 200
+        assert outputs[1]["result"]["symbol"] == "EURUSD"
+        assert outputs[2] == {"error": "Plan must be a JSON object."}
+
+        assert status == 200
+        assert stats["requests"] == 10
+        assert stats["plans"] == 12
+        assert stats["batches"] < 10
+        assert stats["rejected"] == 0
+        assert stats["latency"]["count"] == 10
+        assert stats["latency"]["p99"] is not None
+
+    def test_plan_settings(self):
+        server = PricingServer(PlanProcessor(rate_book=RateBook({"USDJPY": "158.968", "EURUSD": "1.1"})), batch_window=0)
+
+        async def client(port):
+            return [
+                await _request(port, "POST", "/calculate", json.dumps({**PLAN, "exchange_rate": {"symbol": "USDJPY", "rate": 100}}).encode()),
+                await _request(port, "POST", "/calculate", json.dumps({**PLAN, "target_currency": "EUR"}).encode()),
+                await _request(port, "POST", "/calculate", json.dumps(PLAN).encode()),
+            ]
+
+        (_, overridden), (_, in_euro), (_, plain) = _run(server, client)
+        assert overridden["result"]["exchange_rate"] == {"symbol": "USDJPY", "rate": "100"}
+        assert in_euro["result"]["target_currency"] == "EUR"
+        assert plain["result"]["target_currency"] == "USD"
+        assert plain["result"]["exchange_rate"]["symbol"] == "JPYUSD"
+        assert plain["result"]["position_size_in_lots"] == "1.11"
+
+    def test_backpressure(self):
+        server = PricingServer(batch_window=0.2, max_pending=2)
+
+        async def client(port):
+            body = json.dumps({**PLAN, "symbol": "EURUSD", "entry_price": 1.1}).encode()
+            return await asyncio.gather(*(_request(port, "POST", "/calculate", body) for _ in range(3)))
+
+        responses = _run(server, client)
+        assert sorted(status for status, _ in responses) == [200, 200, 503]
+        assert {"error": "Server is busy."} in [body for _, body in responses]
+        assert server.get_stats()["rejected"] == 1
+
+    def test_invalid(self):
+        server = PricingServer(max_body_size=16)
+
+        async def client(port):
+            return [
+                await _request(port, "GET", "/plans"),
+                await _request(port, "GET", "/calculate"),
+                await _request(port, "POST", "/calculate", b"{bad"),
+                await _request(port, "POST", "/calculate", json.dumps(PLAN).encode()),
+            ]
+
+        assert _run(server, client) == [
+            (404, {"error": "Path is not found."}),
+            (405, {"error": "Method is not allowed."}),
+            (400, {"error": "Body is not valid JSON."}),
+            (413, {"error": "Request body is too large."}),
+        ]
+
+        with pytest.raises(ValueError, match="Batch window must be non-negative."):
+            MicroBatcher(PlanProcessor(), batch_window=-1)
+        with pytest.raises(ValueError, match="Max pending must be positive."):
+            MicroBatcher(PlanProcessor(), max_pending=0)
+
+
+class FailingProcessor(PlanProcessor):
+    def __init__(self, failures: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.failures = failures
+
+    def process_chunk(self, chunk):
+        if self.failures:
+            self.failures -= 1
+            raise KeyError("symbol")
+        return super().process_chunk(chunk)
+
+
+class TestFailedBatch:
+    def test_batcher(self):
+        batcher = MicroBatcher(FailingProcessor(1, rate_book=RateBook({"USDJPY": "158.968"})), batch_window=0)
+
+        async def main():
+            batcher.start()
+            try:
+                with pytest.raises(KeyError):
+                    await asyncio.wait_for(batcher.submit([PLAN]), 1)
+                return await asyncio.wait_for(batcher.submit([PLAN]), 1)
+            finally:
+                await batcher.close()
+
+        (row, result, error), = asyncio.run(main())
+        assert error is None
+        assert result.get_result()["position_size_in_lots"] == Decimal("1.11")
+        assert batcher.get_stats()["failed_batches"] == 1
+        assert batcher.get_stats()["batches"] == 1
+
+    def test_server(self):
+        server = PricingServer(FailingProcessor(1, rate_book=RateBook({"USDJPY": "158.968"})), batch_window=0)
+
+        async def client(port):
+            failed = await asyncio.wait_for(_request(port, "POST", "/calculate", json.dumps(PLAN).encode()), 1)
+            return failed, await asyncio.wait_for(_request(port, "POST", "/calculate", json.dumps(PLAN).encode()), 1)
+
+        failed, (status, body) = _run(server, client)
+        assert failed == (500, {"error": "Batch calculation failed."})
+        assert status == 200
+        assert body["result"]["position_size_in_lots"] == "1.11"
+
+
+class TestUnixSocket:
+    def test_valid(self, tmp_path):
+        path = str(tmp_path / "fxplan.sock")
+        server = PricingServer(PlanProcessor(rate_book=RateBook()), batch_window=0)
+
+        async def main():
+            await server.start_unix(path)
+            try:
+                return await _send_lines(path, [
+                    json.dumps(PLAN).encode(),
+                    json.dumps({"command": "rates", "rates": {"USDJPY": "158.968"}}).encode(),
+                    json.dumps(PLAN).encode(),
+                    json.dumps([PLAN, 1]).encode(),
+                    json.dumps({"command": "stats"}).encode(),
+                ])
+            finally:
+                await server.close()
+
+        missing, updated, single, many, stats = asyncio.run(main())
+        assert missing == {"error": "Exchange rate of 'JPYUSD' or 'USDJPY' is required."}
+        assert updated == {"version": 1}
+        assert single["result"]["position_size_in_lots"] == "1.11"
+        assert many == [single, {"error": "Plan must be a JSON object."}]
+        assert stats["requests"] == 4
+        assert stats["plans"] == 4
+        assert not os.path.exists(path)
+
+    def test_stale_socket(self, tmp_path):
+        path = str(tmp_path / "fxplan.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+
+        server = PricingServer()
+        other = PricingServer()
+
+        async def main():
+            await server.start_unix(path)
+            try:
+                with pytest.raises(OSError, match="is already in use."):
+                    await other.start_unix(path)
+                return await _send_lines(path, [json.dumps({"command": "stats"}).encode()])
+            finally:
+                await server.close()
+                await other.close()
+
+        assert asyncio.run(main())[0]["requests"] == 0
+
+        (tmp_path / "plans.csv").write_text("symbol\n")
+        with pytest.raises(OSError, match="is not a socket."):
+            asyncio.run(PricingServer().start_unix(str(tmp_path / "plans.csv")))
+        assert (tmp_path / "plans.csv").exists()
+
+    def test_invalid(self, tmp_path):
+        path = str(tmp_path / "fxplan.sock")
+        server = PricingServer(max_body_size=64)
+
+        async def main():
+            await server.start_unix(path)
+            try:
+                return await _send_lines(path, [
+                    b"{bad",
+                    json.dumps({"command": "restart"}).encode(),
+                    json.dumps({"command": "rates", "rates": {"USDJPY": "1"}}).encode(),
+                    json.dumps({"command": "stats", "padding": "x" * 64}).encode(),
+                ])
+            finally:
+                await server.close()
+
+        assert asyncio.run(main()) == [
+            {"error": "Body is not valid JSON."},
+            {"error": "Command 'restart' is not supported."},
+            {"error": "Server has no rate book."},
+            {"error": "Request body is too large."},
+        ]
@@ -0,0 +1,81 @@
+import pytest
+from decimal import Decimal
+from src.fxplan.calculator import Calculator
+from src.fxplan.rates import RateBook
+
+np = pytest.importorskip("numpy")
+
+from src.fxplan.simulation import MonteCarloSimulator, SimulationPlan
+
+
+class TestSimulationPlan:
+    def test_valid(self):
+        plan = SimulationPlan("gbp/jpy", sl_in_pips="35.55", tp_in_pips=100, initial_equity=10000, risk_in_percent=1)
+        assert plan.symbol == "GBPJPY"
+        assert plan.sl_in_pips == Decimal("35.5")
+        assert plan.risk_in_percent == Decimal(1)
+        assert plan.commission_per_lot_in_money == Decimal(0)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Only one of the risk in money or risk in percent is set."):
+            SimulationPlan("EURUSD", sl_in_pips=10, tp_in_pips=20, initial_equity=1000)
+        with pytest.raises(ValueError, match="Only one of the risk in money or risk in percent is set."):
+            SimulationPlan("EURUSD", sl_in_pips=10, tp_in_pips=20, initial_equity=1000, risk_in_money=10, risk_in_percent=1)
+        with pytest.raises(ValueError, match="Stop loss in pips must be positive."):
+            SimulationPlan("EURUSD", sl_in_pips="0.01", tp_in_pips=20, initial_equity=1000, risk_in_money=10)
+        with pytest.raises(ValueError, match="Commission per lot in money must be non-negative."):
+            SimulationPlan("EURUSD", sl_in_pips=10, tp_in_pips=20, initial_equity=1000, risk_in_money=10, commission_per_lot_in_money=-1)
+
+
+class TestMonteCarloSimulator:
+    def test_valid(self):
+        plan = SimulationPlan(
+            "GBPJPY", sl_in_pips="35.5", tp_in_pips=100, initial_equity=10000, risk_in_percent=1,
+            commission_per_lot_in_money=7, risk_includes_commission=True,
+        )
+        simulator = MonteCarloSimulator(plan, RateBook({"USDJPY": "158.968"}))
+        for equity in (10000, 25000, 1234.56):
+            calc = Calculator()
+            calc.set_symbol("GBPJPY")
+            calc.set_exchange_rate({"symbol": "USDJPY", "rate": "158.968"})
+            calc.with_inputs(
+                is_long=True, entry_price="190.123", sl_in_pips="35.5", tp_in_pips=100,
+                commission_per_lot_in_money=7, sl_with_commission_in_money=str(equity / 100),
+            ).calculate()
+            lots = simulator._get_position_size_in_lots(np.array([equity]))
+            assert Decimal(repr(float(lots[0]))) == calc.get_result()["position_size_in_lots"]
+
+        result = simulator.simulate(paths=3000, trades=50, win_rate=0.4, seed=7, paths_per_shard=1000)
+        assert result.final_equity.shape == (3000,)
+        assert (result.trades == 50).all()
+        assert (result.max_drawdown >= 0).all() and (result.max_drawdown < 1).all()
+        assert result.returns.tolist() == (result.final_equity / 10000 - 1).tolist()
+        summary = result.get_summary(percentiles=(50,))
+        assert summary["paths"] == 3000
+        assert set(summary["returns"]) == {50}
+
+        again = simulator.simulate(paths=3000, trades=50, win_rate=0.4, seed=7, paths_per_shard=1000, workers=2)
+        for field in ("final_equity", "max_drawdown", "trades", "ruined"):
+            assert getattr(again, field).tolist() == getattr(result, field).tolist()
+
+        losing = MonteCarloSimulator(SimulationPlan("EURUSD", sl_in_pips=50, tp_in_pips=50, initial_equity=1000, risk_in_money=500))
+        result = losing.simulate(paths=10, trades=5, win_rate=0)
+        assert result.final_equity.tolist() == [0.0] * 10
+        assert result.trades.tolist() == [2] * 10
+        assert result.ruined.all()
+        assert result.max_drawdown.tolist() == [1.0] * 10
+
+    def test_invalid(self):
+        plan = SimulationPlan("GBPJPY", sl_in_pips=10, tp_in_pips=20, initial_equity=1000, risk_in_money=10)
+        with pytest.raises(ValueError, match="Exchange rate of 'JPYUSD' or 'USDJPY' is required."):
+            MonteCarloSimulator(plan)
+        with pytest.raises(TypeError, match="Plan must be a SimulationPlan object."):
+            MonteCarloSimulator({"symbol": "EURUSD"})
+
+        simulator = MonteCarloSimulator(plan, {"USDJPY": 150})
+        with pytest.raises(ValueError, match="Win rate must be between 0 and 1."):
+            simulator.simulate(paths=10, trades=10, win_rate=1.5)
+        with pytest.raises(ValueError, match="Paths must be a positive integer."):
+            simulator.simulate(paths=0, trades=10, win_rate=0.5)
+        with pytest.raises(ValueError, match="Field 'rrr' is not a distribution of the simulation."):
+            simulator.simulate(paths=10, trades=10, win_rate=0.5).get_percentiles("rrr")
@@ -0,0 +1,89 @@
+import json
+import os
+import pytest
+from decimal import Decimal
+from src.fxplan.specs import ContractSpecStore
+from src.fxplan.registry import SymbolRegistry
+
+CSV_SPECS = """symbol,base_currency,quote_currency,lot_size,pip_size,digits
+US30,US30,USD,1,1,1
+BTC/USD,,,1,1,2
+eurusd.m,EUR,USD,100000,0.0001,5
+"""
+
+
+def _write(tmp_path, name: str, content: str) -> str:
+    path = tmp_path / name
+    path.write_text(content)
+    return str(path)
+
+
+class TestLoad:
+    def test_valid(self, tmp_path):
+        store = ContractSpecStore.load(_write(tmp_path, "specs.csv", CSV_SPECS))
+        assert len(store) == 3
+        assert "us30" in store
+        assert store.get("BTC-USD") == {
+            "symbol": "BTCUSD", "base_currency": "BTC", "quote_currency": "USD",
+            "lot_size": "1", "pip_size": "1", "digits": "2",
+        }
+
+        records = {"symbols": [{"symbol": "XAGUSD", "lot_size": 5000, "pip_size": 0.001, "digits": 3}]}
+        store = ContractSpecStore.load(_write(tmp_path, "specs.json", json.dumps(records)))
+        assert store.get("XAGUSD")["lot_size"] == "5000"
+
+    def test_invalid(self, tmp_path):
+        with pytest.raises(ValueError, match="Row 0: Lot size must be positive."):
+            ContractSpecStore.load(_write(tmp_path, "a.csv", "symbol,lot_size\nEURUSD,-1\n"))
+        with pytest.raises(ValueError, match="Row 1: Symbol 'EURUSD' is duplicated."):
+            ContractSpecStore.load(_write(tmp_path, "b.csv", "symbol\nEURUSD\neur/usd\n"))
+        with pytest.raises(ValueError, match="Row 0: Symbol must contain only 6 letters."):
+            ContractSpecStore.load(_write(tmp_path, "c.csv", "symbol\nUS30\n"))
+        with pytest.raises(ValueError, match="Row 0: Digits must be positive."):
+            ContractSpecStore.load(_write(tmp_path, "e.json", json.dumps([{"symbol": "EURUSD", "digits": 0}])))
+        with pytest.raises(ValueError, match="Row 0: Lot size must be positive."):
+            ContractSpecStore.load(_write(tmp_path, "f.csv", "symbol,lot_size\nEURUSD,0\n"))
+        with pytest.raises(ValueError, match="Contract specs must be a '.csv' or '.json' file."):
+            ContractSpecStore.load(_write(tmp_path, "d.txt", "symbol\nEURUSD\n"))
+
+
+class TestCache:
+    def test_valid(self, tmp_path):
+        source = _write(tmp_path, "specs.csv", CSV_SPECS)
+        cache = str(tmp_path / "specs.cache")
+        ContractSpecStore.load(source, cache_path=cache)
+        assert os.path.exists(cache)
+
+        cached = ContractSpecStore.load(source, cache_path=cache)
+        assert cached.get("US30")["quote_currency"] == "USD"
+
+        with open(cache, "w") as file:
+            file.write("\x80\x04not json")
+        assert ContractSpecStore.load(source, cache_path=cache).get("US30")["digits"] == "1"
+        with open(cache) as file:
+            assert json.load(file)["columns"]["symbol"] == ["US30", "BTCUSD", "EURUSD.M"]
+
+        _write(tmp_path, "specs.csv", "symbol,digits\nEURUSD,4\n")
+        reloaded = ContractSpecStore.load(source, cache_path=cache)
+        assert len(reloaded) == 1
+        assert reloaded.get("EURUSD")["digits"] == "4"
+
+
+class TestCreateSymbol:
+    def test_valid(self, tmp_path):
+        store = ContractSpecStore.load(_write(tmp_path, "specs.csv", CSV_SPECS))
+        symbol = store.create_symbol("us30")
+        assert symbol.get_base_currency() == "US30"
+        assert symbol.get_quote_currency() == "USD"
+        assert symbol.get_pip_value_per_lot() == Decimal("1")
+        assert symbol.get_price_precision() == Decimal("0.1")
+
+        registry = SymbolRegistry(store)
+        assert registry.get("US30").get_digits() == Decimal("1")
+        assert registry.get("EURUSD.M").get_symbol() == "EURUSD.M"
+        assert registry.get("GBPJPY").get_pip_size() == Decimal("0.01")
+
+    def test_invalid(self, tmp_path):
+        store = ContractSpecStore.load(_write(tmp_path, "specs.csv", CSV_SPECS))
+        with pytest.raises(ValueError, match="Symbol 'GER40' is not in the contract specs."):
+            store.create_symbol("GER40")
@@ -0,0 +1,101 @@
+import pytest
+from src.fxplan.calculator import Calculator
+
+np = pytest.importorskip("numpy")
+
+from src.fxplan.batch import ERROR_NONE, ERROR_POSITION_SIZE
+from src.fxplan.sweep import grid_range, sweep
+
+
+def _calculate_scalar(inputs: dict) -> dict:
+    calc = Calculator()
+    calc.set_symbol("GBPJPY")
+    calc.set_exchange_rate({"symbol": "USDJPY", "rate": 158.968})
+    calc.with_inputs(**inputs).calculate()
+    result = dict(calc.get_result())
+    for group in ("rr_in_pips", "rr_in_points", "rr_in_money", "rr_with_commission_in_money"):
+        result.update(result.pop(group))
+    return result
+
+
+class TestGridRange:
+    def test_valid(self):
+        assert grid_range(10, 20, 5).tolist() == [10.0, 15.0, 20.0]
+        assert grid_range("0.1", "0.3", "0.1").tolist() == [0.1, 0.2, 0.3]
+        assert grid_range(1, 2, "0.3").tolist() == [1.0, 1.3, 1.6, 1.9]
+        assert grid_range(5, 5, 1).tolist() == [5.0]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Step must be positive."):
+            grid_range(1, 2, 0)
+        with pytest.raises(ValueError, match="Stop must not be lower than start."):
+            grid_range(2, 1, 1)
+
+
+class TestSweep:
+    def test_valid(self):
+        axes = {
+            "sl_in_pips": grid_range(10, "35.5", "8.5"),
+            "is_long": [True, False],
+            "tp_in_pips": [20, 55.5, 100],
+            "sl_with_commission_in_money": grid_range(50, 500, 150),
+        }
+        inputs = {"entry_price": "190.123", "commission_per_lot_in_money": 7}
+        result = sweep("GBPJPY", axes, inputs, exchange_rate={"symbol": "USDJPY", "rate": 158.968})
+        assert result.get_shape() == (4, 2, 3, 4)
+        assert result.get_axis("tp_in_pips").tolist() == [20, 55.5, 100]
+        assert (result.get_field("error_code") == ERROR_NONE).all()
+
+        for index in np.ndindex(result.get_shape()):
+            values = {name: axis[position].item() for (name, axis), position in zip(result.axes.items(), index)}
+            expected = _calculate_scalar({**inputs, **values})
+            for field in ("position_size_in_lots", "sl_price", "tp_in_points", "sl_in_money", "tp_with_commission_in_money", "rrr_with_commission"):
+                assert result.get_field(field)[index] == float(expected[field]), (index, field)
+
+    def test_fields_and_errors(self):
+        result = sweep(
+            "EURUSD",
+            {"sl_in_money": [0.5, 100], "sl_in_pips": [10, 20]},
+            {"is_long": True, "entry_price": 1.1, "tp_in_pips": 30},
+            fields=("position_size_in_lots",),
+        )
+        assert set(result.values) == {"position_size_in_lots", "error_code", "error_message"}
+        assert result.get_field("error_code").tolist() == [[ERROR_POSITION_SIZE, ERROR_POSITION_SIZE], [ERROR_NONE, ERROR_NONE]]
+        assert result.get_field("position_size_in_lots")[1].tolist() == [1.0, 0.5]
+
+        result = sweep("EURUSD", {"tp_in_pips": range(10, 40, 10)}, {"is_long": False, "entry_price": 1.1, "sl_in_pips": 10, "position_size_in_lots": 1}, error_mode="raise")
+        assert "error_code" not in result.values
+        assert result.get_field("tp_in_money").tolist() == [100.0, 200.0, 300.0]
+
+    def test_chunks(self):
+        axes = {"sl_in_money": [0.5, 100, 250], "sl_in_pips": [10, 20], "tp_in_pips": [15, 30]}
+        inputs = {"is_long": True, "entry_price": 1.1}
+        expected = sweep("EURUSD", axes, inputs)
+        for chunk_cells in (1, 4, 5):
+            result = sweep("EURUSD", axes, inputs, fields=("position_size_in_lots", "tp_in_money"), chunk_cells=chunk_cells)
+            assert set(result.values) == {"position_size_in_lots", "tp_in_money", "error_code", "error_message"}
+            for field, values in result.values.items():
+                np.testing.assert_array_equal(values, expected.get_field(field))
+
+    def test_invalid(self):
+        inputs = {"is_long": True, "entry_price": 1.1, "tp_in_pips": 30, "sl_in_money": 100}
+        with pytest.raises(ValueError, match="At least one axis is required."):
+            sweep("EURUSD", {}, inputs)
+        with pytest.raises(ValueError, match="Input 'target_currency' cannot be swept."):
+            sweep("EURUSD", {"target_currency": ["USD", "EUR"]}, inputs)
+        with pytest.raises(ValueError, match="Unknown input 'rrr'."):
+            sweep("EURUSD", {"rrr": [1, 2]}, inputs)
+        with pytest.raises(ValueError, match="Input 'tp_in_pips' is both an axis and a fixed input."):
+            sweep("EURUSD", {"tp_in_pips": [1, 2]}, inputs)
+        with pytest.raises(ValueError, match="Fixed input 'sl_in_pips' must be a single value."):
+            sweep("EURUSD", {"entry_price": [1.1]}, {"sl_in_pips": [10, 20]})
+        with pytest.raises(ValueError, match="Axis 'sl_in_pips' must be a non-empty one-dimensional sequence."):
+            sweep("EURUSD", {"sl_in_pips": []}, inputs)
+        with pytest.raises(ValueError, match="Chunk cells must be positive."):
+            sweep("EURUSD", {"sl_in_pips": [10]}, inputs, chunk_cells=0)
+        with pytest.raises(ValueError, match="Field 'rr_in_money' is not a result field."):
+            sweep("EURUSD", {"sl_in_pips": [10]}, inputs, fields=("rr_in_money",))
+        with pytest.raises(ValueError, match="Field 'sl_in_money' is not a result field of the sweep."):
+            sweep("EURUSD", {"sl_in_pips": [10]}, inputs, fields=("rrr",)).get_field("sl_in_money")
+        with pytest.raises(ValueError, match="Input 'tp_in_pips' is not an axis of the sweep."):
+            sweep("EURUSD", {"sl_in_pips": [10]}, inputs).get_axis("tp_in_pips")
@@ -29,13 +29,53 @@ class TestConstructor:
         assert symbol3.get_digits() == Decimal("2")
         assert symbol3.get_price_precision() == Decimal("0.01")
 
+    def test_custom_specification(self):
+        symbol = Symbol("US30", base_currency="us30", quote_currency="usd", lot_size=1, pip_size=1, digits=1)
+        assert symbol.get_base_currency() == "US30"
+        assert symbol.get_quote_currency() == "USD"
+        assert symbol.get_lot_size() == Decimal("1")
+        assert symbol.get_price_precision() == Decimal("0.1")
+
     def test_invalid(self):
+        with pytest.raises(ValueError, match="Base and quote currencies must be set together."):
+            Symbol("US30", quote_currency="USD")
+        with pytest.raises(ValueError, match="Lot size must be positive."):
+            Symbol("EURUSD", lot_size=0)
         with pytest.raises(ValueError, match="Symbol must contain only 6 letters."):
             Symbol("EURUS")
         with pytest.raises(ValueError, match="Symbol must contain only letters."):
             Symbol("EUR123")
 
 
+class TestContractConstants:
+    def test_valid(self):
+        symbol = Symbol("EURUSD")
+        assert symbol.get_pip_value_per_lot() == Decimal("10")
+        symbol.set_lot_size(10000)
+        assert symbol.get_pip_value_per_lot() == Decimal("1")
+        symbol.set_pip_size("0.001")
+        assert symbol.get_pip_value_per_lot() == Decimal("10")
+        assert Symbol("XAUUSD").get_pip_value_per_lot() == Decimal("1")
+
+
+class TestFreeze:
+    def test_valid(self):
+        symbol = Symbol("EURUSD")
+        assert not symbol.is_frozen()
+        symbol.freeze()
+        assert symbol.is_frozen()
+
+    def test_invalid(self):
+        symbol = Symbol("EURUSD")
+        symbol.freeze()
+        with pytest.raises(ValueError, match="Symbol is frozen and cannot be modified."):
+            symbol.set_lot_size(1000)
+        with pytest.raises(ValueError, match="Symbol is frozen and cannot be modified."):
+            symbol.set_pip_size(0.001)
+        with pytest.raises(ValueError, match="Symbol is frozen and cannot be modified."):
+            symbol.set_digits(4)
+
+
 class TestSetLotSize:
     def test_valid(self):
         symbol = Symbol("EURUSD")
@@ -105,3 +105,10 @@ class TestExchangeCurrencyByRate:
                 exchange_symbol="EUR/usd",
                 exchange_rate=Decimal("1.21868")
             )
+
+
+class TestFloorToUnits:
+    def test_valid(self):
+        np = pytest.importorskip("numpy")
+        values = floor_to_units(np.array([1.239, 0.29 * 3, 1.0 - 1e-15, -0.011]), 100)
+        assert values.tolist() == [123.0, 87.0, 100.0, -2.0]